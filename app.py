@@ -1,21 +1,36 @@
+import hashlib
+import importlib
+import logging
 import os
+import re
+import threading
+import time
 import uuid
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Dict
+from itertools import islice
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Final, List, Mapping, Optional, Tuple
 
-import pandas as pd
 import streamlit as st
 import streamlit.components.v1 as st_components
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-from src.ai.llama_summarizer import AdvancedAISummarizer
-from src.ai.ocr_reader import OCRReader
+from src.utils.lazy import Lazy
 
-# Import custom modules
-from src.ai.whisper_transcriber import WhisperTranscriber
-from src.api.swecha_auth_manager import SwechaIntegrationManager
-from src.utils.export_utils import ExportUtils
-from src.utils.swecha_storage import SwechaStorageManager
-from src.utils.text_processor import TranscriptionProcessor
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from src.ai.llama_summarizer import AdvancedAISummarizer
+    from src.ai.ocr_reader import OCRReader
+    from src.ai.whisper_transcriber import WhisperTranscriber
+    from src.api.swecha_auth_manager import SwechaIntegrationManager
+    from src.utils.export_utils import ExportUtils
+    from src.utils.swecha_storage import SwechaStorageManager
+    from src.utils.text_processor import TranscriptionProcessor
+
+logger = logging.getLogger(__name__)
 
 # Page config
 st.set_page_config(
@@ -25,6 +40,643 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+# Supported languages (display name -> language code)
+_LANGUAGE_OPTIONS: Final[Mapping[str, str]] = MappingProxyType({
+    "Hindi": "hi",
+    "Telugu": "te",
+    "Tamil": "ta",
+    "Bengali": "bn",
+    "Marathi": "mr",
+    "Gujarati": "gu",
+    "Kannada": "kn",
+    "Malayalam": "ml",
+    "Punjabi": "pa",
+    "English": "en",
+})
+_LANGUAGE_NAMES: Final = tuple(_LANGUAGE_OPTIONS)
+_DEFAULT_LANGUAGE_INDEX: Final = _LANGUAGE_NAMES.index("English")
+_LANGUAGE_FILTER_CHOICES: Final = ("All", *_LANGUAGE_OPTIONS)
+_CORPUS_UPLOAD_CONCURRENCY: Final = 5
+_STATS_REFRESH_DEBOUNCE_S: Final = 0.5
+# Recent-contribution expanders: (contributions key, title, optional detail field and format, expanded)
+_CONTRIBUTION_EXPANDERS: Final = (
+    ("audio_contributions", "🎵 **Audio Contributions**", ("duration", "⏱️ {}s"), True),
+    ("text_contributions", "📝 **Text Contributions**", None, False),
+    ("video_contributions", "🎬 **Video Contributions**", ("duration", "⏱️ {}s"), False),
+    ("image_contributions", "🖼️ **Image Contributions**", ("dimensions", "📐 {}"), False),
+)
+_MEDIA_CONTRIBUTION_KEYS: Final = tuple(key for key, _, _, _ in _CONTRIBUTION_EXPANDERS)
+_ROLE_BADGES: Final[Mapping[str, str]] = MappingProxyType({
+    "admin": "🔧 **Admin**",
+    "reviewer": "👁️ **Reviewer**",
+})
+_WORD_RE: Final = re.compile(r"\S+")
+_TABS: Final = ("🎙️ Record", "📝 My Notes", "📊 Summarize", "🔍 OCR", "📈 Stats")
+
+# Static page assets, built once per process instead of on every rerun
+_PAGE_HEADER_HTML = """
+<style>
+.main-header {
+    text-align: center;
+    color: #1f77b4;
+    margin-bottom: 2rem;
+}
+.note-card {
+    border: 1px solid #ddd;
+    border-radius: 8px;
+    padding: 1rem;
+    margin: 1rem 0;
+    background-color: #f9f9f9;
+}
+.privacy-notice {
+    background-color: #e8f4f8;
+    padding: 1rem;
+    border-radius: 8px;
+    border-left: 4px solid #1f77b4;
+}
+.corpus-stats {
+    background-color: #f0f8f0;
+    padding: 1rem;
+    border-radius: 8px;
+    text-align: center;
+}
+</style>
+<h1 class='main-header'>🎙️ WhispNote</h1>
+<p style='text-align: center; color: #666;'>AI-Powered Multilingual Voice Notes</p>
+"""
+
+_BROWSER_RECORDING_HTML = """
+<div style="padding: 20px; border: 2px dashed #ccc; border-radius: 10px; text-align: center;">
+    <button id="recordButton" onclick="toggleRecording()" style="
+        background-color: #ff4444;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 5px;
+        cursor: pointer;
+        font-size: 16px;
+    ">🎙️ Start Recording</button>
+    <br><br>
+    <div id="status">Click "Start Recording" to begin</div>
+    <audio id="audioPlayback" controls style="display: none; margin-top: 10px;"></audio>
+</div>
+
+<script>
+let mediaRecorder;
+let audioChunks = [];
+let isRecording = false;
+
+async function toggleRecording() {
+    const button = document.getElementById('recordButton');
+    const status = document.getElementById('status');
+
+    if (!isRecording) {
+        try {
+            const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
+            mediaRecorder = new MediaRecorder(stream);
+
+            mediaRecorder.ondataavailable = event => {
+                audioChunks.push(event.data);
+            };
+
+            mediaRecorder.onstop = () => {
+                const audioBlob = new Blob(audioChunks, { type: mediaRecorder.mimeType });
+                const audioUrl = URL.createObjectURL(audioBlob);
+                const audio = document.getElementById('audioPlayback');
+                // Release the previous recording's blob before replacing it
+                if (audio.src) {
+                    URL.revokeObjectURL(audio.src);
+                }
+                audio.src = audioUrl;
+                audio.style.display = 'block';
+
+                // Reset
+                audioChunks = [];
+                status.textContent = 'Recording completed! You can play it back above.';
+            };
+
+            // Emit a chunk every second so audio is buffered while recording, not all at stop
+            mediaRecorder.start(1000);
+            isRecording = true;
+            button.textContent = '⏹️ Stop Recording';
+            button.style.backgroundColor = '#444444';
+            status.textContent = '🔴 Recording... Click "Stop Recording" when finished';
+
+        } catch (err) {
+            status.textContent = 'Error: Could not access microphone. Please check permissions.';
+            console.error('Error accessing microphone:', err);
+        }
+    } else {
+        mediaRecorder.stop();
+        mediaRecorder.stream.getTracks().forEach(track => track.stop());
+        isRecording = false;
+        button.textContent = '🎙️ Start Recording';
+        button.style.backgroundColor = '#ff4444';
+        status.textContent = 'Processing recording...';
+    }
+}
+</script>
+"""
+
+
+@st.cache_resource
+def _transcription_executor() -> ThreadPoolExecutor:
+    """Background workers for transcribing uploads ahead of the button click"""
+    # More than one, so a long upload in one session doesn't queue everyone else's
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="whispnote-transcribe")
+
+
+def _audio_hash(data: bytes) -> str:
+    """Content hash of uploaded audio, used as the transcription cache key"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _present_files(paths: List[str]) -> set:
+    """Subset of paths that exist, found with one directory scan per distinct folder"""
+    present = set()
+    for folder in {os.path.dirname(path) for path in paths}:
+        try:
+            with os.scandir(folder or ".") as entries:
+                present.update(os.path.join(folder, e.name) for e in entries if e.is_file())
+        except OSError:
+            continue
+    return present
+
+
+def _save_audio(audio_bytes: bytes, filename: str, audio_hash: str) -> str:
+    """Store audio under a content-addressed name, skipping the write if it already exists"""
+    # The digest alone names the file, so re-uploads under another name share it too
+    extension = os.path.splitext(filename)[1].lower()
+    audio_path = f"whispnote_data/audio/audio_{audio_hash}{extension}"
+    if not os.path.exists(audio_path):
+        os.makedirs(os.path.dirname(audio_path), exist_ok=True)
+        with open(audio_path, "wb") as f:
+            f.write(audio_bytes)
+    return audio_path
+
+
+def _transcriber_model_id(transcriber: Any) -> str:
+    """Whisper backend and model, so persisted transcriptions never outlive a model change"""
+    return getattr(transcriber, "model_id", "")
+
+
+class TranscriptionFailed(RuntimeError):
+    """Raised from the cached transcription helpers so a failed result is never persisted"""
+
+    def __init__(self, results: List[Optional[str]]):
+        super().__init__("Transcription failed; please try again")
+        # Whatever did succeed, for callers that can use a partial batch
+        self.results = results
+
+
+@st.cache_data(persist="disk", show_spinner=False, max_entries=128)
+def _cached_transcribe(
+    audio_hash: str, language: str, model_id: str, _transcriber: Any, _audio_bytes: bytes
+) -> str:
+    """Transcribe encoded audio once per (content hash, language, model)"""
+    transcription = _transcriber.transcribe(_audio_bytes, language=language)
+    if not transcription:
+        raise TranscriptionFailed([transcription])
+    return transcription
+
+
+@st.cache_data(persist="disk", show_spinner=False, max_entries=128)
+def _cached_transcribe_batch(
+    audio_hashes: Tuple[str, ...],
+    language: str,
+    model_id: str,
+    _transcriber: Any,
+    _audio_bytes: List[bytes],
+) -> List[Optional[str]]:
+    """Batch-transcribe encoded audio once per (content hashes, language, model)"""
+    transcriptions = _transcriber.transcribe_batch(
+        _audio_bytes, language=language, cache_keys=list(audio_hashes)
+    )
+    if not all(transcriptions):
+        raise TranscriptionFailed(transcriptions)
+    return transcriptions
+
+
+def _text_hash(text: str) -> str:
+    """Content hash of a transcription, used as the LLM cache key"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class AIFallbackResult(RuntimeError):
+    """Raised from the cached LLM helpers so fallback or empty output is never persisted"""
+
+    def __init__(self, result: Any):
+        super().__init__("No AI service produced a result")
+        # The basic result to show this time
+        self.result = result
+
+
+def _checked_summary(llama_ai: Any, text: str, language: str) -> str:
+    """AI summary of text, raising AIFallbackResult for the extractive fallback"""
+    summary = llama_ai.summarize(text, language=language)
+    if llama_ai.is_fallback_summary(text, summary):
+        raise AIFallbackResult(summary)
+    return summary
+
+
+def _checked_keywords(llama_ai: Any, text: str, language: str, num_keywords: int) -> List[str]:
+    """AI keywords for text, raising AIFallbackResult for the simple fallback extraction"""
+    keywords = llama_ai.extract_keywords(text, language=language, num_keywords=num_keywords)
+    if llama_ai.is_fallback_keywords(text, keywords, num_keywords):
+        raise AIFallbackResult(keywords)
+    return keywords
+
+
+@st.cache_data(persist="disk", show_spinner=False, max_entries=256)
+def _cached_summary(text_hash: str, language: str, _llama_ai: Any, _text: str) -> str:
+    """Summarize a transcription once per (content hash, language)"""
+    return _checked_summary(_llama_ai, _text, language)
+
+
+def _summary(text: str, language: str, refresh: bool = False) -> str:
+    """Summary for text, from the cache unless refreshing; fallback output is never cached"""
+    try:
+        if refresh:
+            return _checked_summary(get_llama_ai(), text, language)
+        return _cached_summary(_text_hash(text), language, get_llama_ai(), text)
+    except AIFallbackResult as e:
+        return e.result
+
+
+def _checked_summary_and_keywords(llama_ai: Any, text: str, language: str) -> Tuple[str, List[str]]:
+    """AI summary and keywords for text, raising AIFallbackResult if either is a fallback"""
+    summary, keywords = llama_ai.generate_summary_and_keywords(text, language=language)
+    if llama_ai.is_fallback_summary(text, summary) or llama_ai.is_fallback_keywords(text, keywords):
+        raise AIFallbackResult((summary, keywords))
+    return summary, keywords
+
+
+@st.cache_data(persist="disk", show_spinner=False, max_entries=256)
+def _cached_summary_and_keywords(
+    text_hash: str, language: str, _llama_ai: Any, _text: str
+) -> Tuple[Tuple[str, List[str]], float]:
+    """Summary and keywords from one LLM call, with when they were generated"""
+    return _checked_summary_and_keywords(_llama_ai, _text, language), time.time()
+
+
+def _summary_and_keywords(text: str, language: str, refresh: bool = False) -> Tuple[str, List[str]]:
+    """Cached summary and keywords for text, counting this session's cache hits and misses"""
+    stats = st.session_state.setdefault("llm_cache_stats", {"hits": 0, "misses": 0})
+    requested_at = time.time()
+    try:
+        if refresh:
+            # Bypass the cache, e.g. to replace a note's existing summary
+            result = _checked_summary_and_keywords(get_llama_ai(), text, language)
+            stats["misses"] += 1
+            return result
+        result, generated_at = _cached_summary_and_keywords(_text_hash(text), language, get_llama_ai(), text)
+    except AIFallbackResult as e:
+        stats["misses"] += 1
+        return e.result
+    # A cached result was generated by an earlier call
+    stats["misses" if generated_at >= requested_at else "hits"] += 1
+    return result
+
+
+@st.cache_data(persist="disk", show_spinner=False, max_entries=256)
+def _cached_keywords(
+    text_hash: str, language: str, _llama_ai: Any, _text: str, num_keywords: int = 10
+) -> List[str]:
+    """Extract keywords once per (content hash, language, count)"""
+    return _checked_keywords(_llama_ai, _text, language, num_keywords)
+
+
+def _keywords(text: str, language: str, num_keywords: int = 10, refresh: bool = False) -> List[str]:
+    """Keywords for text, from the cache unless refreshing; fallback output is never cached"""
+    try:
+        if refresh:
+            return _checked_keywords(get_llama_ai(), text, language, num_keywords)
+        return _cached_keywords(_text_hash(text), language, get_llama_ai(), text, num_keywords)
+    except AIFallbackResult as e:
+        return e.result
+
+
+def _prefetch_transcription(
+    transcriber: Any, file_id: str, audio_bytes: bytes, language: str
+) -> "Future[Optional[str]]":
+    """Start transcribing an upload in the background, once per file and language"""
+    key = (file_id, language)
+    prefetch = st.session_state.get("transcription_prefetch")
+    if prefetch is not None and prefetch[0] == key:
+        return prefetch[1]
+    if prefetch is not None:
+        # A new file or language supersedes the earlier job; drop it if it hasn't started
+        prefetch[1].cancel()
+
+    ctx = get_script_run_ctx()
+
+    def transcribe() -> str:
+        # Attach this session so errors reported by the transcriber reach its page
+        add_script_run_ctx(ctx=ctx)
+        return _cached_transcribe(
+            _audio_hash(audio_bytes), language, _transcriber_model_id(transcriber), transcriber, audio_bytes
+        )
+
+    future = _transcription_executor().submit(transcribe)
+    st.session_state["transcription_prefetch"] = (key, future)
+    return future
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_load_notes(
+    _storage: Any, session_token: Optional[str], notes_mtime: float, notes_revision: int
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """Load notes and where they came from once per notes version (and per Swecha session)"""
+    return _storage.load_notes_with_source()
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_notes_frame(
+    _storage: Any, session_token: Optional[str], notes_mtime: float, notes_revision: int
+) -> "pd.DataFrame":
+    """Search columns for the notes list, lowercased once per notes version"""
+    return _build_notes_frame(_cached_load_notes(_storage, session_token, notes_mtime, notes_revision)[1])
+
+
+def _build_notes_frame(notes: List[Dict[str, Any]]) -> "pd.DataFrame":
+    """Search columns for a notes list, one row per note in list order"""
+    import pandas as pd  # only needed once a search or filter is applied
+
+    return pd.DataFrame(
+        {
+            # Content, language and tags, matching what the search box offers
+            "_search_lc": [
+                " ".join(
+                    (
+                        note.get("transcription") or "",
+                        note.get("language") or "",
+                        *(note.get("tags") or ()),
+                    )
+                ).lower()
+                for note in notes
+            ],
+            "language": [note.get("language") for note in notes],
+        }
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_swecha_status(_storage: Any, session_token: Optional[str]) -> Dict[str, Any]:
+    """Swecha connection status, probed at most once a minute per login"""
+    return _storage.get_swecha_status()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_user_contributions(_storage: Any, session_token: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Swecha contribution history, fetched at most once a minute per login"""
+    return _storage.get_user_contributions()
+
+
+@st.cache_resource
+def _swecha_executor() -> ThreadPoolExecutor:
+    """Background workers for Swecha API calls that can overlap page rendering"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="whispnote-swecha")
+
+
+def _prefetch_user_contributions(storage: Any, session_token: Optional[str]) -> "Future[Optional[Dict[str, Any]]]":
+    """Start fetching Swecha contributions in the background while the page renders"""
+    ctx = get_script_run_ctx()
+
+    def fetch() -> Optional[Dict[str, Any]]:
+        # The storage manager reads the Swecha login from this session's state
+        add_script_run_ctx(ctx=ctx)
+        return _cached_user_contributions(storage, session_token)
+
+    return _swecha_executor().submit(fetch)
+
+
+def _format_size(size: float) -> str:
+    """Human-readable byte count (bytes up to 1 KB, then KB/MB/GB)"""
+    if size > 1024 ** 3:
+        return f"{size / 1024 ** 3:.1f} GB"
+    elif size > 1024 ** 2:
+        return f"{size / 1024 ** 2:.1f} MB"
+    elif size > 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size} bytes"
+
+
+def _format_timestamp(timestamp: Optional[str]) -> str:
+    """Render an ISO-8601 timestamp as 'YYYY-MM-DD HH:MM' without parsing it"""
+    if not timestamp or "T" not in timestamp:
+        return "Recently"
+    return timestamp[:16].replace("T", " ")
+
+
+def _has_more_words(text: str, limit: int = 10) -> bool:
+    """True if text has more than limit words, scanning only as far as needed"""
+    return sum(1 for _ in islice(_WORD_RE.finditer(text), limit + 1)) > limit
+
+
+def _truncate(text: str, limit: int = 100) -> str:
+    """Shorten text to limit characters, marking the cut with an ellipsis"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_note_options(
+    _storage: Any, session_token: Optional[str], notes_mtime: float, notes_revision: int
+) -> Dict[str, Any]:
+    """Summarize-tab selector labels mapped to note ids, built once per version"""
+    _, notes = _cached_load_notes(_storage, session_token, notes_mtime, notes_revision)
+    labels = [f"{_format_timestamp(note.get('timestamp'))} - {note.get('language', '')}" for note in notes]
+    repeated = {label for label, count in Counter(labels).items() if count > 1}
+    # Notes recorded in the same minute and language would otherwise share a label
+    return {
+        f"{label} ({note.get('id')})" if label in repeated else label: note.get("id")
+        for label, note in zip(labels, notes)
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_note_word_counts(
+    _storage: Any, session_token: Optional[str], notes_mtime: float, notes_revision: int
+) -> Dict[str, Tuple[int, int]]:
+    """(source words, summary words) per note id, counted once per notes version"""
+    _, notes = _cached_load_notes(_storage, session_token, notes_mtime, notes_revision)
+    return {
+        note.get("id"): (
+            len((note.get("original_transcription") or note.get("transcription") or "").split()),
+            len((note.get("summary") or "").split()),
+        )
+        for note in notes
+    }
+
+
+def _is_pending_upload(note: Dict[str, Any]) -> bool:
+    """Whether a note still needs uploading; notes imported from Swecha are already in the corpus"""
+    return not note.get("uploaded_to_corpus", False) and not note.get("swecha_uid")
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_local_note_stats(
+    _storage: Any, session_token: Optional[str], notes_mtime: float, notes_revision: int
+) -> Tuple[int, Counter]:
+    """(pending corpus uploads, notes per language), tallied once per notes version"""
+    _, notes = _cached_load_notes(_storage, session_token, notes_mtime, notes_revision)
+    pending = sum(1 for note in notes if _is_pending_upload(note))
+    return pending, Counter(note.get("language", "Unknown") for note in notes)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_notes_export(
+    _export_utils: Any,
+    note_ids: Tuple[str, ...],
+    notes_version: Tuple[Optional[str], float, int],
+    _notes: List[Dict[str, Any]],
+) -> str:
+    """Markdown export of the selected notes, rebuilt only when the selection or notes change"""
+    return _export_utils.export_multiple_notes(_notes, format="markdown")
+
+
+@st.cache_resource
+def _notes_revisions() -> Dict[str, Any]:
+    """Notes revision per Swecha login, bumped by _invalidate_notes()"""
+    return {"values": {}, "lock": threading.Lock()}
+
+
+def _notes_version(storage: Any) -> Tuple[Optional[str], float, int]:
+    """Cache key for notes and everything derived from them: login, local write time, revision"""
+    token = st.session_state.get("swecha_token")
+    return token, storage.notes_mtime, _notes_revisions()["values"].get(token, 0)
+
+
+def _load_notes(storage: Any) -> List[Dict[str, Any]]:
+    """Load notes through the cache, keyed on the local notes write time"""
+    # Keep this session's decoded list resident; st.cache_data hands out a fresh copy per call
+    version = _notes_version(storage)
+    resident = st.session_state.get("resident_notes")
+    if resident is None or resident[0] != version:
+        source, notes = _cached_load_notes(storage, *version)
+        resident = (version, notes, source)
+        st.session_state.resident_notes = resident
+    return resident[1]
+
+
+def _load_notes_by_id(storage: Any) -> Dict[str, Dict[str, Any]]:
+    """Index this session's resident notes by id, rebuilt only when the notes change"""
+    notes = _load_notes(storage)
+    version = st.session_state.resident_notes[0]
+    index = st.session_state.get("resident_notes_by_id")
+    if index is None or index[0] != version:
+        index = (version, {note.get("id"): note for note in notes})
+        st.session_state.resident_notes_by_id = index
+    return index[1]
+
+
+def _invalidate_notes() -> None:
+    """Drop this login's cached notes after a change the local write time may not reflect"""
+    # Other logins keep their entries; superseded ones age out through max_entries
+    revisions = _notes_revisions()
+    token = st.session_state.get("swecha_token")
+    with revisions["lock"]:
+        revisions["values"][token] = revisions["values"].get(token, 0) + 1
+    st.session_state.pop("resident_notes", None)
+
+
+def _filter_notes(
+    storage: Any,
+    notes: List[Dict[str, Any]],
+    search_query: str,
+    language_filter: str,
+) -> List[Dict[str, Any]]:
+    """Filter notes with the local FTS index, or vectorized masks over the cached search frame"""
+    if not search_query and language_filter == "All":
+        return notes
+
+    # Where notes came from decides the search path, so go by the list _load_notes() returned
+    resident = st.session_state.get("resident_notes")
+    loaded = resident is not None and resident[1] is notes
+    if search_query and loaded and resident[2] == "local":
+        # Local notes are indexed in SQLite; keep the matches in list order
+        language = None if language_filter == "All" else language_filter
+        matched_ids = {
+            note.get("id") for note in storage.search_local_notes(search_query, language, limit=len(notes))
+        }
+        return [note for note in notes if note.get("id") in matched_ids]
+
+    # The frame's rows must line up with notes, so use the version notes was loaded under
+    if loaded:
+        notes_df = _cached_notes_frame(storage, *resident[0])
+    else:
+        notes_df = _build_notes_frame(notes)
+    mask = None
+    if search_query:
+        mask = notes_df["_search_lc"].str.contains(
+            search_query.lower(), regex=False
+        )
+    if language_filter != "All":
+        language_mask = notes_df["language"].eq(language_filter)
+        mask = language_mask if mask is None else mask & language_mask
+    return [notes[i] for i in notes_df.index[mask]]
+
+
+def _load_note_word_counts(storage: Any) -> Dict[str, Tuple[int, int]]:
+    """Load the cached per-note word counts matching _load_notes()"""
+    return _cached_note_word_counts(storage, *_notes_version(storage))
+
+
+def _load_local_note_stats(storage: Any) -> Tuple[int, Counter]:
+    """Load the cached pending-upload and language tallies matching _load_notes()"""
+    return _cached_local_note_stats(storage, *_notes_version(storage))
+
+
+def _load_note_options(storage: Any) -> Dict[str, Any]:
+    """Load the cached note selector options matching _load_notes()"""
+    return _cached_note_options(storage, *_notes_version(storage))
+
+
+def _upload_notes_to_corpus(storage: Any, notes: List[Dict[str, Any]]) -> int:
+    """Upload notes to the Swecha corpus a few at a time, returning how many succeeded"""
+    # Workers get the login as arguments; session state and st.* stay on this thread
+    token = st.session_state.get("swecha_token")
+    user_id = st.session_state.get("swecha_user_data", {}).get("id")
+    if not token or not user_id:
+        st.error("User ID not found in session")
+        return 0
+    try:
+        category_id = storage.get_default_category_id(token)
+    except Exception as e:
+        st.error(f"Failed to save note to Swecha: {str(e)}")
+        return 0
+    if not category_id:
+        st.error("No categories available")
+        return 0
+
+    progress = st.progress(0.0, text="Uploading to corpus...")
+    uploaded_notes = []
+    errors = []
+    try:
+        with ThreadPoolExecutor(max_workers=_CORPUS_UPLOAD_CONCURRENCY) as pool:
+            futures = {
+                pool.submit(storage.create_note_record, note, token, user_id, category_id): note
+                for note in notes
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                note = futures[future]
+                try:
+                    swecha_response = future.result()
+                except Exception as e:
+                    errors.append(f"Failed to save note to Swecha: {str(e)}")
+                else:
+                    storage.track_swecha_note(note, swecha_response)
+                    note["uploaded_to_corpus"] = True
+                    note["corpus_upload_date"] = datetime.now().isoformat()
+                    uploaded_notes.append(note)
+                progress.progress(done / len(notes), text=f"Uploaded {len(uploaded_notes)} of {len(notes)}")
+    finally:
+        # Mark everything that made it as uploaded in one local transaction, even if a later upload raised
+        if uploaded_notes:
+            storage._save_notes_locally(uploaded_notes)
+    for error in errors:
+        st.error(error)
+    return len(uploaded_notes)
+
 
 # Initialize session state
 def init_session_state() -> None:
@@ -52,293 +704,156 @@ def init_session_state() -> None:
         st.session_state.swecha_notes = {}
 
 
-# Initialize components
-@st.cache_resource
-def load_components() -> Dict[str, Any]:
-    """Load all components with error handling"""
-    components = {}
+# Component loaders: key -> (module, class, failure message level, label, build lazily)
+_COMPONENT_LOADERS: Final[Mapping[str, Tuple[str, str, str, str, bool]]] = MappingProxyType({
+    # Picks faster-whisper (int8 CTranslate2) when installed, else openai-whisper
+    "transcriber": ("src.ai.whisper_transcriber", "create_transcriber", "error", "Whisper transcriber", False),
+    # The LLaMA constructor probes API keys and a local Ollama server, so defer it
+    "llama_ai": ("src.ai.llama_summarizer", "AdvancedAISummarizer", "error", "LLaMA AI processor", True),
+    "ocr_reader": ("src.ai.ocr_reader", "OCRReader", "warning", "OCR reader", False),
+    "storage": ("src.utils.swecha_storage", "SwechaStorageManager", "error", "storage manager", False),
+    "export_utils": ("src.utils.export_utils", "ExportUtils", "warning", "export utils", False),
+    "text_processor": ("src.utils.text_processor", "TranscriptionProcessor", "warning", "text processor", False),
+    "swecha": ("src.api.swecha_auth_manager", "SwechaIntegrationManager", "error", "Swecha integration", False),
+})
 
-    try:
-        components["transcriber"] = WhisperTranscriber()
-    except Exception as e:
-        st.error(f"Failed to load Whisper transcriber: {str(e)}")
-        components["transcriber"] = None
 
+# Initialize components
+@st.cache_resource
+def get_component(key: str) -> Any:
+    """Import and build a component on first use (None if it fails to load)"""
+    module_name, class_name, level, label, lazy = _COMPONENT_LOADERS[key]
     try:
-        components["llama_ai"] = AdvancedAISummarizer()
-        st.success("🦙 LLaMA 3.1 AI processor loaded successfully!")
+        factory = getattr(importlib.import_module(module_name), class_name)
+        if lazy:
+            return Lazy(factory)
+        return factory()
     except Exception as e:
-        st.error(f"Failed to load LLaMA AI processor: {str(e)}")
-        components["llama_ai"] = None
+        getattr(st, level)(f"Failed to load {label}: {str(e)}")
+        return None
 
-    try:
-        components["ocr_reader"] = OCRReader()
-    except Exception as e:
-        st.warning(f"Failed to load OCR reader: {str(e)}")
-        components["ocr_reader"] = None
 
-    try:
-        components["storage"] = SwechaStorageManager()
-    except Exception as e:
-        st.error(f"Failed to load storage manager: {str(e)}")
-        components["storage"] = None
+def get_transcriber() -> Optional["WhisperTranscriber"]:
+    """Whisper transcriber"""
+    return get_component("transcriber")
 
-    try:
-        components["export_utils"] = ExportUtils()
-    except Exception as e:
-        st.warning(f"Failed to load export utils: {str(e)}")
-        components["export_utils"] = None
 
-    try:
-        components["text_processor"] = TranscriptionProcessor()
-    except Exception as e:
-        st.warning(f"Failed to load text processor: {str(e)}")
-        components["text_processor"] = None
+def get_llama_ai() -> Optional["AdvancedAISummarizer"]:
+    """LLaMA AI processor, built on first use (falsy if it can't be built)"""
+    return get_component("llama_ai")
 
-    try:
-        components["swecha"] = SwechaIntegrationManager()
-    except Exception as e:
-        st.error(f"Failed to load Swecha integration: {str(e)}")
-        components["swecha"] = None
 
-    return components
+def get_ocr_reader() -> Optional["OCRReader"]:
+    """OCR reader"""
+    return get_component("ocr_reader")
 
 
-def main() -> None:
-    init_session_state()
-    components = load_components()
-
-    # Custom CSS
-    st.markdown(
-        """
-    <style>
-    .main-header {
-        text-align: center;
-        color: #1f77b4;
-        margin-bottom: 2rem;
-    }
-    .note-card {
-        border: 1px solid #ddd;
-        border-radius: 8px;
-        padding: 1rem;
-        margin: 1rem 0;
-        background-color: #f9f9f9;
-    }
-    .privacy-notice {
-        background-color: #e8f4f8;
-        padding: 1rem;
-        border-radius: 8px;
-        border-left: 4px solid #1f77b4;
-    }
-    .corpus-stats {
-        background-color: #f0f8f0;
-        padding: 1rem;
-        border-radius: 8px;
-        text-align: center;
-    }
-    </style>
-    """,
-        unsafe_allow_html=True,
-    )
+def get_storage() -> Optional["SwechaStorageManager"]:
+    """Storage manager"""
+    return get_component("storage")
 
-    # Header
-    st.markdown("<h1 class='main-header'>🎙️ WhispNote</h1>", unsafe_allow_html=True)
-    st.markdown(
-        "<p style='text-align: center; color: #666;'>AI-Powered Multilingual Voice Notes</p>",
-        unsafe_allow_html=True,
-    )
 
-    # Sidebar
-    with st.sidebar:
-        st.header("Settings")
+def get_export_utils() -> Optional["ExportUtils"]:
+    """Export utilities"""
+    return get_component("export_utils")
 
-        # Language selection
-        language_options = {
-            "Hindi": "hi",
-            "Telugu": "te",
-            "Tamil": "ta",
-            "Bengali": "bn",
-            "Marathi": "mr",
-            "Gujarati": "gu",
-            "Kannada": "kn",
-            "Malayalam": "ml",
-            "Punjabi": "pa",
-            "English": "en",
-        }
 
-        selected_language = st.selectbox(
-            "Select Language",
-            options=list(language_options.keys()),
-            index=9,  # Default to English
-        )
-        language_code = language_options[selected_language]
-
-        # Privacy settings
-        st.subheader("Privacy Settings")
-        privacy_consent = st.checkbox(
-            "I consent to contribute my data to the multilingual corpus",
-            value=st.session_state.privacy_consent,
-            help="Your audio and transcription will be anonymized and used to improve AI for Indian languages",
-        )
-        st.session_state.privacy_consent = privacy_consent
+def get_text_processor() -> Optional["TranscriptionProcessor"]:
+    """Text processor"""
+    return get_component("text_processor")
 
-        if privacy_consent:
-            st.success("✅ Contributing to corpus")
-        else:
-            st.info("🔒 Private mode - data stays local")
 
-        # Swecha API Integration
-        st.subheader("🌟 Swecha Corpus")
-        swecha_manager = components["swecha"]
+def get_swecha() -> Optional["SwechaIntegrationManager"]:
+    """Swecha integration"""
+    return get_component("swecha")
 
-        if swecha_manager.is_logged_in():
-            swecha_manager.show_user_info()
-        else:
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button("🔐 Login to Swecha"):
-                    st.session_state.show_swecha_login = True
-                    st.session_state.show_swecha_signup = False
-            with col2:
-                if st.button("📝 Sign Up for Swecha"):
-                    st.session_state.show_swecha_signup = True
-                    st.session_state.show_swecha_login = False
-
-        # Show login form if requested
-        if st.session_state.get('show_swecha_login', False) and swecha_manager.show_login_form():
-            st.session_state.show_swecha_login = False
-
-        # Show signup form if requested
-        if st.session_state.get('show_swecha_signup', False) and swecha_manager.show_signup_form():
-            st.session_state.show_swecha_signup = False
-
-        # Privacy Information Section
-        st.subheader("🔒 Privacy & Storage")
-        with st.expander("Storage Information", expanded=True):
-            st.markdown("""
-            **WhispNote uses Swecha API for all data storage:**
-
-            • **Cloud Storage:** All notes stored securely via Swecha API
-            • **Account Required:** Create a free Swecha account or login to access all features
-            • **Secure Authentication:** Bearer token-based authentication
-            • **Telugu Corpus:** Your contributions help build the Swecha Telugu language corpus
-            • **Data Privacy:** Your data is handled according to Swecha's privacy policy
-            • **Open Source:** Transparent and community-driven
-            """)
-
-        # App info
-        st.subheader("About")
-        st.info("""
-        **WhispNote** is a cloud-based voice note app powered by Swecha that:
-        - Records and transcribes speech in Indian languages
-        - Summarizes content using AI
-        - Extracts keywords and topics
-        - Supports OCR for image text
-        - Contributes to Telugu language corpus
-        """)
 
-    # Check authentication status
-    swecha_manager = components["swecha"]
-    if not swecha_manager.is_logged_in():
-        st.warning("🔐 **Authentication Required**")
-        st.info("""
-        ### Welcome to WhispNote! 🎙️
+@st.fragment
+def render_record_tab(selected_language: str, language_code: str) -> None:
+    """Record tab: capture or upload audio, transcribe, clean up and save"""
+    st.header("Record Voice Note")
 
-        To access all features and contribute to the Swecha Telugu corpus, please:
+    # Choose recording method
+    recording_method = st.radio(
+        "Choose recording method:",
+        ("🎙️ Record with Device", "📁 Upload Audio File"),
+        horizontal=True,
+    )
 
-        - **Login** if you already have a Swecha account
-        - **Sign Up** to create a new free account
+    if recording_method == "🎙️ Record with Device":
+        st.subheader("Device Recording Instructions")
 
-        Use the sidebar authentication options to get started.
+        # Instructions for recording
+        st.info("""
+        **How to record audio:**
+        1. Use your device's built-in voice recorder app
+        2. Record your voice note in your preferred language
+        3. Save the recording as an audio file (WAV, MP3, etc.)
+        4. Upload the file below using the file uploader
+
+        **Popular voice recording apps:**
+        - 📱 **Mobile**: Voice Recorder, Voice Memos (iOS), Samsung Voice Recorder
+        - 💻 **Windows**: Voice Recorder app, Audacity
+        - 🖥️ **Mac**: Voice Memos, QuickTime Player
+        - 🐧 **Linux**: GNOME Sound Recorder, Audacity
         """)
-        st.stop()
-
-    # Main content tabs
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(
-        ["🎙️ Record", "📝 My Notes", "📊 Summarize", "🔍 OCR", "📈 Stats"]
-    )
 
-    with tab1:
-        st.header("Record Voice Note")
+        st.markdown("---")
 
-        # Choose recording method
-        recording_method = st.radio(
-            "Choose recording method:",
-            ("🎙️ Record with Device", "📁 Upload Audio File"),
-            horizontal=True,
+        # File uploader for device recordings
+        device_audio = st.file_uploader(
+            "Upload your device recording here:",
+            type=["wav", "mp3", "ogg", "m4a", "flac", "aac"],
+            help="Upload the audio file you recorded with your device",
+            key="device_recording_upload",
         )
 
-        if recording_method == "🎙️ Record with Device":
-            st.subheader("Device Recording Instructions")
-
-            # Instructions for recording
-            st.info("""
-            **How to record audio:**
-            1. Use your device's built-in voice recorder app
-            2. Record your voice note in your preferred language
-            3. Save the recording as an audio file (WAV, MP3, etc.)
-            4. Upload the file below using the file uploader
-
-            **Popular voice recording apps:**
-            - 📱 **Mobile**: Voice Recorder, Voice Memos (iOS), Samsung Voice Recorder
-            - 💻 **Windows**: Voice Recorder app, Audacity
-            - 🖥️ **Mac**: Voice Memos, QuickTime Player
-            - 🐧 **Linux**: GNOME Sound Recorder, Audacity
-            """)
+        if device_audio is not None:
+            # Read the upload once and share the bytes with the player, hash and transcriber
+            audio_bytes = device_audio.getvalue()
+            st.audio(audio_bytes, format=device_audio.type)
 
-            st.markdown("---")
-
-            # File uploader for device recordings
-            device_audio = st.file_uploader(
-                "Upload your device recording here:",
-                type=["wav", "mp3", "ogg", "m4a", "flac", "aac"],
-                help="Upload the audio file you recorded with your device",
-                key="device_recording_upload",
+            # Start transcribing while the user listens back
+            transcription_future = _prefetch_transcription(
+                get_transcriber(), device_audio.file_id, audio_bytes, language_code
             )
 
-            if device_audio is not None:
-                st.audio(device_audio)
-
-                # Save uploaded file temporarily
-                temp_audio_path = f"temp_device_audio_{uuid.uuid4().hex}.wav"
-                with open(temp_audio_path, "wb") as f:
-                    f.write(device_audio.read())
-
-                # Transcription
-                st.subheader("Step 2: Transcribe Recording")
-                if st.button("🔤 Transcribe Device Recording", type="primary"):
-                    with st.spinner(
-                        f"Transcribing device recording in {selected_language}..."
-                    ):
-                        try:
-                            # Step 1: Transcribe
-                            transcription = components["transcriber"].transcribe(
-                                temp_audio_path, language=language_code
-                            )
-
-                            if transcription:
-                                # Store transcription in session state
-                                st.session_state["device_transcription"] = transcription
-                                st.session_state["device_audio_path"] = temp_audio_path
-                                st.session_state["device_language_code"] = language_code
-                                st.success("✅ Transcription completed!")
-                                st.rerun()
-
-                        except Exception as e:
-                            st.error(f"Error during transcription: {str(e)}")
-
-                        finally:
-                            # Clean up temp file
-                            if os.path.exists(temp_audio_path):
-                                os.remove(temp_audio_path)
-
-                # Show processing UI if transcription exists
-                if "device_transcription" in st.session_state:
-                    st.subheader("Step 3: Review and Clean Text")
-                    transcription = st.session_state["device_transcription"]
-                    language_code = st.session_state["device_language_code"]
+            # Transcription
+            st.subheader("Step 2: Transcribe Recording")
+            if st.button("🔤 Transcribe Device Recording", type="primary"):
+                with st.spinner(
+                    f"Transcribing device recording in {selected_language}..."
+                ):
+                    try:
+                        # Step 1: Wait for the background transcription
+                        transcription = transcription_future.result()
+
+                        if transcription:
+                            # Store transcription in session state
+                            st.session_state["device_transcription"] = transcription
+                            st.session_state["device_language_code"] = language_code
+                            st.success("✅ Transcription completed!")
+                            st.rerun()
+                        else:
+                            # Forget the failed job so the next click transcribes again
+                            st.session_state.pop("transcription_prefetch", None)
+                            st.error("❌ Transcription failed. Please try again.")
 
-                    # Processing options
+                    except Exception as e:
+                        st.session_state.pop("transcription_prefetch", None)
+                        st.error(f"Error during transcription: {str(e)}")
+
+            # Show processing UI if transcription exists
+            ss = st.session_state
+            if "device_transcription" in ss:
+                st.subheader("Step 3: Review and Clean Text")
+                # Snapshot the pipeline state once per rerun
+                transcription = ss["device_transcription"]
+                language_code = ss["device_language_code"]
+                cleaning_result = ss.get("current_cleaning_result")
+
+                # Processing options (submitted together, so picking a method doesn't rerun)
+                with st.form("device_processing_form", border=False):
                     col1, col2 = st.columns([2, 1])
                     with col1:
                         processing_method = st.radio(
@@ -349,20 +864,20 @@ def main() -> None:
                         )
 
                     with col2:
-                        if st.button("🧹 Process Text", type="primary", key="device_process_text"):
+                        if st.form_submit_button("🧹 Process Text", type="primary"):
                             use_ai = processing_method.startswith("🤖")
 
                             with st.spinner(f"{'🤖 AI processing' if use_ai else '🔧 Traditional processing'}..."):
-                                cleaning_result = components["text_processor"].clean_transcription(
+                                cleaning_result = get_text_processor().clean_transcription(
                                     transcription, language=language_code, use_ai=use_ai
                                 )
 
-                            st.session_state["current_cleaning_result"] = cleaning_result
+                            ss["current_cleaning_result"] = cleaning_result
 
+                # Review, edit and save are submitted together so typing doesn't rerun the script
+                with st.form("device_review_form", border=False):
                     # Show results if available
-                    if "current_cleaning_result" in st.session_state:
-                        cleaning_result = st.session_state["current_cleaning_result"]
-
+                    if cleaning_result is not None:
                         # Show processing method used
                         method_used = cleaning_result.get('processing_method', 'traditional_nlp')
                         if method_used == 'ai_enhanced':
@@ -442,17 +957,17 @@ def main() -> None:
 
                     with col1:
                         # Save note option
-                        if st.button(
-                            "📝 Save Note", key="save_device_recording", type="primary"
+                        if st.form_submit_button(
+                            "📝 Save Note", type="primary"
                         ):
                             # Get the final transcription text safely
-                            if "current_cleaning_result" in st.session_state:
+                            if cleaning_result is not None:
                                 # Try to get edited transcription, fallback to cleaned version
-                                transcription_text = st.session_state.get("device_transcription_edit", st.session_state["current_cleaning_result"].get('cleaned', transcription))
+                                transcription_text = ss.get("device_transcription_edit", cleaning_result.get('cleaned', transcription))
                                 final_transcription = transcription_text
                             else:
                                 # Try to get raw transcription edit, fallback to original
-                                transcription_text = st.session_state.get("device_raw_transcription", transcription)
+                                transcription_text = ss.get("device_raw_transcription", transcription)
                                 final_transcription = transcription_text
 
                             # Validate we have required data
@@ -464,37 +979,25 @@ def main() -> None:
                                 # Generate summary and keywords before saving
                                 with st.spinner("🔄 Generating summary and keywords..."):
                                     try:
-                                        # Save audio file permanently
-                                        permanent_audio_path = f"whispnote_data/audio/audio_{uuid.uuid4().hex}_{device_audio.name}"
-                                        os.makedirs(os.path.dirname(permanent_audio_path), exist_ok=True)
-
-                                        # Copy temp audio to permanent location
-                                        import shutil
-                                        if "device_audio_path" in st.session_state and os.path.exists(st.session_state["device_audio_path"]):
-                                            shutil.copy2(st.session_state["device_audio_path"], permanent_audio_path)
-                                        else:
-                                            # If temp file is gone, recreate from uploaded file
-                                            try:
-                                                device_audio.seek(0)  # Reset file pointer
-                                                with open(permanent_audio_path, "wb") as f:
-                                                    f.write(device_audio.read())
-                                            except Exception as audio_error:
-                                                # If we can't read the uploaded file, skip audio saving
-                                                st.warning(f"Could not save audio file: {str(audio_error)}")
-                                                permanent_audio_path = None
+                                        # Save audio file permanently (identical recordings share one file)
+                                        audio_hash = _audio_hash(audio_bytes)
+                                        try:
+                                            permanent_audio_path = _save_audio(audio_bytes, device_audio.name, audio_hash)
+                                        except Exception as audio_error:
+                                            # If we can't write the audio, skip audio saving
+                                            st.warning(f"Could not save audio file: {str(audio_error)}")
+                                            permanent_audio_path = None
 
                                         # Generate summary and keywords with error handling
                                         summary = None
                                         keywords = []
 
                                         # Use LLaMA 3.1 for AI-powered summary and keyword extraction
-                                        if components["llama_ai"] and final_transcription and len(final_transcription.split()) > 10:
+                                        if get_llama_ai() and final_transcription and _has_more_words(final_transcription):
                                             try:
                                                 st.info("� Using LLaMA 3.1 for AI-powered summary and keyword extraction...")
                                                 # Use the combined method for efficiency
-                                                summary, keywords = components["llama_ai"].generate_summary_and_keywords(
-                                                    final_transcription, language=language_code
-                                                )
+                                                summary, keywords = _summary_and_keywords(final_transcription, language_code)
                                                 if summary:
                                                     st.success("✅ LLaMA 3.1 processing completed!")
                                             except Exception as llama_error:
@@ -516,20 +1019,20 @@ def main() -> None:
                                             "language_code": language_code,
                                             "transcription": final_transcription,  # This is the final/enhanced version
                                             "original_transcription": transcription,  # Store original transcription
-                                            "enhanced_transcription": final_transcription if "current_cleaning_result" in st.session_state else None,
+                                            "enhanced_transcription": final_transcription if cleaning_result is not None else None,
                                             "audio_file": device_audio.name,
                                             "audio_path": permanent_audio_path,
+                                            "audio_hash": audio_hash,
                                             "summary": summary,
                                             "keywords": keywords,
                                             "tags": ["device-recording"],
-                                            "processing_method": "ai_enhanced" if "current_cleaning_result" in st.session_state and st.session_state["current_cleaning_result"].get('processing_method') == 'ai_enhanced' else "traditional",
-                                            "summary_ai_model": "llama-3.1-405b" if summary and components["llama_ai"] else None,
-                                            "keywords_ai_model": "llama-3.1-405b" if keywords and components["llama_ai"] else None
+                                            "processing_method": "ai_enhanced" if cleaning_result is not None and cleaning_result.get('processing_method') == 'ai_enhanced' else "traditional",
+                                            "summary_ai_model": "llama-3.1-405b" if summary and get_llama_ai() else None,
+                                            "keywords_ai_model": "llama-3.1-405b" if keywords and get_llama_ai() else None
                                         }
 
                                         # Add cleaning stats if available
-                                        if "current_cleaning_result" in st.session_state:
-                                            cleaning_result = st.session_state["current_cleaning_result"]
+                                        if cleaning_result is not None:
                                             note_data["cleaning_stats"] = {
                                                 "original_length": cleaning_result.get('word_count_original', 0),
                                                 "cleaned_length": cleaning_result.get('word_count_cleaned', 0),
@@ -545,10 +1048,11 @@ def main() -> None:
                                                 note_data["ai_confidence"] = cleaning_result.get('confidence_score', 0.0)
 
                                         # Save note
-                                        components["storage"].save_note(note_data)
+                                        get_storage().save_note(note_data)
+                                        _invalidate_notes()
 
                                         st.success("📝 Note saved successfully!")
-                                        st.session_state.corpus_contributions += 1
+                                        ss.corpus_contributions += 1
 
                                         # Show summary and keywords
                                         if summary:
@@ -557,7 +1061,7 @@ def main() -> None:
 
                                         if keywords:
                                             st.subheader("🔑 Key Topics")
-                                            keyword_tags = " ".join([f"`{kw}`" for kw in keywords[:5]])
+                                            keyword_tags = " ".join(map("`{}`".format, keywords[:5]))
                                             st.markdown(keyword_tags)
 
                                         st.success("✅ Note automatically saved to Swecha corpus!")
@@ -571,15 +1075,14 @@ def main() -> None:
 
                     with col2:
                         # Quick summary preview
-                        if st.button("👁️ Preview Summary", key="preview_summary_device"):
-                            final_transcription = transcription_text if "current_cleaning_result" in st.session_state else transcription
-                            if final_transcription and len(final_transcription.split()) > 10:
-                                if components["llama_ai"]:
+                        if st.form_submit_button("👁️ Preview Summary"):
+                            final_transcription = transcription_text if cleaning_result is not None else transcription
+                            if final_transcription and _has_more_words(final_transcription):
+                                if get_llama_ai():
                                     with st.spinner("Generating preview..."):
                                         try:
-                                            preview_summary = components["llama_ai"].generate_summary(
-                                                final_transcription, language_code=language_code
-                                            )
+                                            # Same cache entry the Save button reads, so preview-then-save is one LLM call
+                                            preview_summary, _ = _summary_and_keywords(final_transcription, language_code)
                                             if preview_summary:
                                                 st.info(f"📋 Preview: {preview_summary}")
                                             else:
@@ -591,1147 +1094,1287 @@ def main() -> None:
                             else:
                                 st.warning("Text too short for summary")
 
-            # Add browser-based recording option
-            st.markdown("---")
-            st.subheader("Browser Recording")
-
-            # HTML for browser recording
-            browser_recording_html = """
-            <div style="padding: 20px; border: 2px dashed #ccc; border-radius: 10px; text-align: center;">
-                <button id="recordButton" onclick="toggleRecording()" style="
-                    background-color: #ff4444;
-                    color: white;
-                    border: none;
-                    padding: 10px 20px;
-                    border-radius: 5px;
-                    cursor: pointer;
-                    font-size: 16px;
-                ">🎙️ Start Recording</button>
-                <br><br>
-                <div id="status">Click "Start Recording" to begin</div>
-                <audio id="audioPlayback" controls style="display: none; margin-top: 10px;"></audio>
-            </div>
-
-            <script>
-            let mediaRecorder;
-            let audioChunks = [];
-            let isRecording = false;
-
-            async function toggleRecording() {
-                const button = document.getElementById('recordButton');
-                const status = document.getElementById('status');
-
-                if (!isRecording) {
-                    try {
-                        const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
-                        mediaRecorder = new MediaRecorder(stream);
-
-                        mediaRecorder.ondataavailable = event => {
-                            audioChunks.push(event.data);
-                        };
-
-                        mediaRecorder.onstop = () => {
-                            const audioBlob = new Blob(audioChunks, { type: 'audio/wav' });
-                            const audioUrl = URL.createObjectURL(audioBlob);
-                            const audio = document.getElementById('audioPlayback');
-                            audio.src = audioUrl;
-                            audio.style.display = 'block';
-
-                            // Reset
-                            audioChunks = [];
-                            status.textContent = 'Recording completed! You can play it back above.';
-                        };
-
-                        mediaRecorder.start();
-                        isRecording = true;
-                        button.textContent = '⏹️ Stop Recording';
-                        button.style.backgroundColor = '#444444';
-                        status.textContent = '🔴 Recording... Click "Stop Recording" when finished';
-
-                    } catch (err) {
-                        status.textContent = 'Error: Could not access microphone. Please check permissions.';
-                        console.error('Error accessing microphone:', err);
-                    }
-                } else {
-                    mediaRecorder.stop();
-                    mediaRecorder.stream.getTracks().forEach(track => track.stop());
-                    isRecording = false;
-                    button.textContent = '🎙️ Start Recording';
-                    button.style.backgroundColor = '#ff4444';
-                    status.textContent = 'Processing recording...';
-                }
-            }
-            </script>
-            """
+        # Add browser-based recording option
+        st.markdown("---")
+        st.subheader("Browser Recording")
 
-            st_components.html(browser_recording_html, height=200)
 
-            st.info("""
-            **Note**: Browser recording allows direct audio capture in your web browser.
-            You can also use your device's voice recorder app and upload the file for additional flexibility.
-            """)
+        st_components.html(_BROWSER_RECORDING_HTML, height=200)
 
-        else:  # Upload Audio File
-            st.subheader("Upload Audio File")
+        st.info("""
+        **Note**: Browser recording allows direct audio capture in your web browser.
+        You can also use your device's voice recorder app and upload the file for additional flexibility.
+        """)
 
-            # File uploader for audio
-            uploaded_audio = st.file_uploader(
-                "Upload audio file from your computer:",
-                type=["wav", "mp3", "ogg", "m4a", "flac", "aac"],
-                help="Select an audio file from your computer to transcribe",
-            )
+    else:  # Upload Audio File
+        st.subheader("Upload Audio File")
 
-            if uploaded_audio is not None:
-                st.audio(uploaded_audio)
+        # File uploader for audio
+        uploaded_audios = st.file_uploader(
+            "Upload audio files from your computer:",
+            type=["wav", "mp3", "ogg", "m4a", "flac", "aac"],
+            help="Select one or more audio files from your computer to transcribe",
+            accept_multiple_files=True,
+        )
 
-                # Save uploaded file temporarily
-                temp_audio_path = f"temp_audio_{uuid.uuid4().hex}.wav"
-                with open(temp_audio_path, "wb") as f:
-                    f.write(uploaded_audio.read())
+        if uploaded_audios:
+            # Read each upload once and share the bytes with the player, hash and transcriber
+            uploaded_bytes = [uploaded_audio.getvalue() for uploaded_audio in uploaded_audios]
+            for uploaded_audio, audio_bytes in zip(uploaded_audios, uploaded_bytes):
+                st.caption(uploaded_audio.name)
+                st.audio(audio_bytes, format=uploaded_audio.type)
 
-                # Transcription
-                st.subheader("Step 2: Transcribe")
-                if st.button("🔤 Transcribe Audio", type="primary"):
-                    with st.spinner(f"Transcribing audio in {selected_language}..."):
-                        try:
-                            transcription = components["transcriber"].transcribe(
-                                temp_audio_path, language=language_code
-                            )
+            uploaded_ids = [uploaded_audio.file_id for uploaded_audio in uploaded_audios]
 
-                            if transcription:
-                                st.success("✅ Transcription completed!")
+            # Transcription
+            st.subheader("Step 2: Transcribe")
+            if st.button("🔤 Transcribe Audio", type="primary"):
+                with st.spinner(
+                    f"Transcribing {len(uploaded_audios)} file(s) in {selected_language}..."
+                ):
+                    try:
+                        # Reuse transcriptions of audio already saved in this language
+                        audio_hashes = [_audio_hash(audio_bytes) for audio_bytes in uploaded_bytes]
+                        transcriptions: List[Optional[str]] = []
+                        for audio_hash in audio_hashes:
+                            prior_note = get_storage().find_note_by_audio_hash(audio_hash, language_code)
+                            if prior_note:
+                                transcriptions.append(
+                                    prior_note.get("original_transcription") or prior_note.get("transcription")
+                                )
+                            else:
+                                transcriptions.append(None)
 
-                                # Display transcription
-                                transcription_text = st.text_area(
-                                    "Transcription (editable):",
-                                    value=transcription,
-                                    height=150,
-                                    key="upload_transcription_edit",
+                        # Transcribe the remaining uploads in one batched Whisper pass
+                        pending = [i for i, transcription in enumerate(transcriptions) if not transcription]
+                        if pending:
+                            try:
+                                batch_results = _cached_transcribe_batch(
+                                    tuple(audio_hashes[i] for i in pending),
+                                    language_code,
+                                    _transcriber_model_id(get_transcriber()),
+                                    get_transcriber(),
+                                    [uploaded_bytes[i] for i in pending],
                                 )
+                            except TranscriptionFailed as e:
+                                # Keep the clips that worked; the batch is retried in full next time
+                                batch_results = e.results
+                                st.warning("⚠️ Some recordings could not be transcribed. Click again to retry them.")
+                            for i, transcription in zip(pending, batch_results):
+                                transcriptions[i] = transcription
+
+                        if any(transcriptions):
+                            st.session_state["upload_transcriptions"] = {
+                                "file_ids": uploaded_ids,
+                                "audio_hashes": audio_hashes,
+                                "language": selected_language,
+                                "language_code": language_code,
+                                "rows": [
+                                    {"File": uploaded_audio.name, "Transcription": transcription or ""}
+                                    for uploaded_audio, transcription in zip(uploaded_audios, transcriptions)
+                                ],
+                            }
+                            st.success("✅ Transcription completed!")
 
-                                # Create note
-                                if st.button("💾 Save Note", key="save_uploaded_audio"):
-                                    with st.spinner("🔄 Processing note with AI..."):
-                                        # Save audio file permanently
-                                        permanent_audio_path = f"whispnote_data/audio/audio_{uuid.uuid4().hex}_{uploaded_audio.name}"
-                                        os.makedirs(os.path.dirname(permanent_audio_path), exist_ok=True)
+                    except Exception as e:
+                        st.error(f"Error during transcription: {str(e)}")
+
+            # Show results for the current set of uploads
+            upload_state = st.session_state.get("upload_transcriptions")
+            if upload_state and upload_state["file_ids"] == uploaded_ids:
+                edited_rows = st.data_editor(
+                    upload_state["rows"],
+                    column_config={
+                        "File": st.column_config.TextColumn("File", disabled=True),
+                        "Transcription": st.column_config.TextColumn(
+                            "Transcription (editable)", width="large"
+                        ),
+                    },
+                    hide_index=True,
+                    use_container_width=True,
+                    key="upload_transcription_edit",
+                )
 
-                                        # Save uploaded audio to permanent location
-                                        with open(permanent_audio_path, "wb") as f:
-                                            uploaded_audio.seek(0)  # Reset file pointer
-                                            f.write(uploaded_audio.read())
+                # Create notes
+                if st.button("💾 Save Notes", key="save_uploaded_audio"):
+                    with st.spinner("🔄 Processing notes with AI..."):
+                        for uploaded_audio, audio_bytes, audio_hash, original_row, edited_row in zip(
+                            uploaded_audios,
+                            uploaded_bytes,
+                            upload_state["audio_hashes"],
+                            upload_state["rows"],
+                            edited_rows,
+                        ):
+                            transcription = original_row["Transcription"]
+                            transcription_text = edited_row["Transcription"]
+                            if not transcription_text or not transcription_text.strip():
+                                st.warning(f"Skipped {uploaded_audio.name}: no transcription text")
+                                continue
 
-                                        # Generate summary and keywords using LLaMA AI
-                                        summary = None
-                                        keywords = []
+                            # Save audio file permanently (identical uploads share one file)
+                            permanent_audio_path = _save_audio(audio_bytes, uploaded_audio.name, audio_hash)
 
-                                        # Use LLaMA 3.1 for AI-powered summary and keyword extraction
-                                        if components["llama_ai"] and transcription_text and len(transcription_text.split()) > 10:
-                                            try:
-                                                st.info("� Using LLaMA 3.1 for AI-powered summary and keyword extraction...")
-                                                summary, keywords = components["llama_ai"].generate_summary_and_keywords(
-                                                    transcription_text, language=language_code
-                                                )
-                                                if summary:
-                                                    st.success("✅ LLaMA 3.1 processing completed!")
-                                            except Exception as llama_error:
-                                                st.warning(f"LLaMA AI processing failed: {str(llama_error)}")
+                            # Generate summary and keywords using LLaMA AI
+                            summary = None
+                            keywords = []
 
-                                        # If no summary/keywords generated, show info
-                                        if not summary:
-                                            st.info("💡 Add OpenRouter API key to enable advanced AI summarization")
-                                        if not keywords:
-                                            st.info("💡 Add OpenRouter API key to enable advanced AI keyword extraction")
+                            # Use LLaMA 3.1 for AI-powered summary and keyword extraction
+                            if get_llama_ai() and _has_more_words(transcription_text):
+                                try:
+                                    st.info(f"🦙 Using LLaMA 3.1 for {uploaded_audio.name}...")
+                                    summary, keywords = _summary_and_keywords(transcription_text, upload_state["language_code"])
+                                except Exception as llama_error:
+                                    st.warning(f"LLaMA AI processing failed: {str(llama_error)}")
+
+                            note_data = {
+                                "id": str(uuid.uuid4()),
+                                "timestamp": datetime.now().isoformat(),
+                                "language": upload_state["language"],
+                                "language_code": upload_state["language_code"],
+                                "transcription": transcription_text,
+                                "original_transcription": transcription,
+                                "enhanced_transcription": None,  # No enhancement done for upload method
+                                "audio_file": uploaded_audio.name,
+                                "audio_path": permanent_audio_path,
+                                "audio_hash": audio_hash,
+                                "summary": summary,
+                                "keywords": keywords,
+                                "tags": ["uploaded-audio"],
+                                "processing_method": "llama_ai" if summary and keywords else "none",
+                                "ai_model": "llama-3.1-405b" if summary and keywords else None
+                            }
+
+                            # Save note
+                            get_storage().save_note(note_data)
+                            _invalidate_notes()
+                            st.session_state.corpus_contributions += 1
+
+                            st.success(f"📝 Note saved for {uploaded_audio.name}!")
+
+                            # Show generated summary and keywords
+                            if summary:
+                                st.subheader("📋 Generated Summary")
+                                st.info(summary)
+
+                            if keywords:
+                                st.subheader("🔑 Key Topics")
+                                keyword_tags = " ".join(map("`{}`".format, keywords[:5]))
+                                st.markdown(keyword_tags)
+
+                        if not get_llama_ai():
+                            st.info("💡 Add OpenRouter API key to enable advanced AI summarization")
+
+
+@st.fragment
+def render_notes_tab() -> None:
+    """My Notes tab: search, review, export and delete saved notes"""
+    st.header("My Notes")
+
+    # Load and display notes
+    notes = _load_notes(get_storage())
+
+    if not notes:
+        st.info("📝 No notes yet. Record your first voice note!")
+    else:
+        # Search and filter
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            search_query = st.text_input(
+                "🔍 Search notes...",
+                placeholder="Search by content, language, or tags",
+            )
+        with col2:
+            language_filter = st.selectbox(
+                "Filter by language", _LANGUAGE_FILTER_CHOICES
+            )
 
-                                        note_data = {
-                                            "id": str(uuid.uuid4()),
-                                            "timestamp": datetime.now().isoformat(),
-                                            "language": selected_language,
-                                            "language_code": language_code,
-                                            "transcription": transcription_text,
-                                            "original_transcription": transcription,
-                                            "enhanced_transcription": None,  # No enhancement done for upload method
-                                            "audio_file": uploaded_audio.name,
-                                            "audio_path": permanent_audio_path,
-                                            "summary": summary,
-                                            "keywords": keywords,
-                                            "tags": ["uploaded-audio"],
-                                            "processing_method": "llama_ai" if summary and keywords else "none",
-                                            "ai_model": "llama-3.1-405b" if summary and keywords else None
-                                        }
+        # Filter notes
+        filtered_notes = _filter_notes(
+            get_storage(), notes, search_query, language_filter
+        )
 
-                                        # Save note
-                                        components["storage"].save_note(note_data)
-                                        st.session_state.corpus_contributions += 1
+        # Select notes in one table and act on them in bulk
+        displayed_notes = list(reversed(filtered_notes))  # Show newest first
+        edited_rows = st.data_editor(
+            [
+                {
+                    "Select": False,
+                    "Time": _format_timestamp(note.get("timestamp")),
+                    "Language": note.get("language", "Unknown"),
+                    "Transcription": note.get("transcription", ""),
+                    "Summary": note.get("summary") or "",
+                }
+                for note in displayed_notes
+            ],
+            column_config={"Select": st.column_config.CheckboxColumn("Select", default=False)},
+            disabled=["Time", "Language", "Transcription", "Summary"],
+            hide_index=True,
+            use_container_width=True,
+            key=f"notes_table_{search_query}_{language_filter}",
+        )
+        selected_notes = [
+            note for note, row in zip(displayed_notes, edited_rows) if row["Select"]
+        ]
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            if st.button(
+                f"🗑️ Delete selected ({len(selected_notes)})",
+                disabled=not selected_notes,
+                key="delete_selected_notes",
+            ):
+                for note in selected_notes:
+                    get_storage().delete_note(note["id"])
+                _invalidate_notes()
+                st.rerun()
+        with col2:
+            st.download_button(
+                f"📤 Export selected ({len(selected_notes)})",
+                _cached_notes_export(
+                    get_export_utils(),
+                    tuple(note.get("id") for note in selected_notes),
+                    _notes_version(get_storage()),
+                    selected_notes,
+                )
+                if selected_notes
+                else "",
+                file_name="whispnote_input_notes.md",
+                mime="text/markdown",
+                disabled=not selected_notes,
+                key="export_selected_notes",
+            )
+        with col3:
+            if st.button(
+                f"🌐 Upload selected to corpus ({len(selected_notes)})",
+                disabled=not selected_notes,
+                key="corpus_selected_notes",
+            ):
+                if not get_storage().get_swecha_status().get("authenticated", False):
+                    st.error("❌ Please log in to Swecha to upload to corpus")
+                else:
+                    uploaded = _upload_notes_to_corpus(get_storage(), selected_notes)
+                    _invalidate_notes()
+                    if uploaded == len(selected_notes):
+                        st.success(f"✅ Uploaded {uploaded} note(s) to the corpus database!")
+                    else:
+                        st.warning(f"Uploaded {uploaded} of {len(selected_notes)} note(s); please retry the rest.")
+
+        # Display notes - Focus on INPUT DATA
+        # Only selected rows get detail widgets; the table above already lists every note
+        if not selected_notes:
+            st.caption("Select notes in the table to see their audio, input text and upload options.")
+        note_word_counts = _load_note_word_counts(get_storage())
+        for note in selected_notes:
+            # Bind the fields this expander reads once per note
+            language = note.get("language", "Unknown")
+            audio_file = note.get("audio_file")
+            audio_path = note.get("audio_path")
+            tags = note.get("tags", [])
+            original_text = note.get("original_transcription") or note.get("transcription", "")
+
+            with st.expander(
+                f"🎙️ {language} - {_format_timestamp(note.get('timestamp'))}"
+            ):
+                # Highlight this is INPUT DATA section
+                st.markdown("### 📥 **Input Data**")
+
+                # Show audio information prominently
+                if audio_file:
+                    st.info(f"🎵 **Audio File:** {audio_file}")
+
+                # Show language and processing info
+                st.write(f"**Language:** {language} ({note.get('language_code', '')})")
+
+                # Show recording method
+                if "device-recording" in tags:
+                    st.write("📱 **Source:** Device Recording")
+                elif "uploaded-audio" in tags:
+                    st.write("📁 **Source:** Uploaded Audio File")
+                elif "OCR" in tags:
+                    st.write("🔍 **Source:** OCR Text Extraction")
+
+                # FOCUS ON ORIGINAL INPUT - show original transcription prominently
+                st.markdown("### 📝 **Original Transcription (Input)**")
+                if original_text:
+                    st.text_area(
+                        "Raw input text:",
+                        value=original_text,
+                        height=150,
+                        disabled=True,
+                        key=f"input_display_{note.get('id', '')}"
+                    )
 
-                                        st.success("📝 Note saved successfully!")
+                    # Show word count and basic stats for input
+                    word_count = note_word_counts.get(note.get("id"), (0, 0))[0]
+                    st.write(f"📊 **Input Stats:** {word_count} words, {len(original_text)} characters")
+                else:
+                    st.warning("No original transcription available")
 
-                                        # Show generated summary and keywords
-                                        if summary:
-                                            st.subheader("📋 Generated Summary")
-                                            st.info(summary)
+                # Show audio player if audio file is available
+                if audio_path and os.path.exists(audio_path):
+                    st.write("**🎵 Audio Recording:**")
+                    st.audio(audio_path)
+                elif audio_file:
+                    st.write(f"**Audio File:** {audio_file} (file not found)")
 
-                                        if keywords:
-                                            st.subheader("🔑 Key Topics")
-                                            keyword_tags = " ".join([f"`{kw}`" for kw in keywords[:5]])
-                                            st.markdown(keyword_tags)
+                # Note about AI outputs
+                if note.get("summary") or note.get("keywords"):
+                    st.success("🤖 **AI outputs available** - Check the 'Summarize' tab for AI-generated summaries and keywords")
 
-                                        st.success("✅ Note automatically saved to Swecha corpus!")
+                # Corpus upload for input data
+                st.markdown("### 🌐 **Corpus Contribution**")
+                st.info("💡 Upload your input data to contribute to the corpus database")
 
+                if st.button("📤 Upload Input to Corpus", key=f"corpus_input_{note['id']}"):
+                    with st.spinner("Uploading input data to corpus..."):
+                        try:
+                            # Check if user is authenticated
+                            swecha_status = get_storage().get_swecha_status()
+                            if not swecha_status.get("authenticated", False):
+                                st.error("❌ Please log in to Swecha to upload to corpus")
+                                st.info("Use the sidebar to authenticate with your Swecha account")
+                            else:
+                                # Upload the note to Swecha API
+                                success = get_storage()._save_note_to_swecha(note)
+                                if success:
+                                    st.success("✅ Input data uploaded to corpus database!")
+                                    st.info("🎯 Your original transcription is now part of the knowledge base!")
+
+                                    # Mark as uploaded in local storage
+                                    note["uploaded_to_corpus"] = True
+                                    note["corpus_upload_date"] = datetime.now().isoformat()
+                                    get_storage()._save_note_locally(note)
+                                    _invalidate_notes()
+                                else:
+                                    st.error("❌ Failed to upload to corpus. Please try again.")
                         except Exception as e:
-                            st.error(f"Error during transcription: {str(e)}")
+                            st.error(f"❌ Error uploading to corpus: {str(e)}")
+                            st.info("Please check your internet connection and try again.")
+
+
+@st.fragment
+def render_summarize_tab() -> None:
+    """Summarize tab: AI summaries and keywords for a saved note"""
+    st.header("🤖 AI Outputs & Summarization")
+    st.info("📤 **This section displays AI-generated outputs:** summaries, keywords, enhanced transcriptions, and processing insights")
+
+    # Load notes for AI processing
+    notes = _load_notes(get_storage())
+    if notes:
+        # Selector labels map to note ids; the note itself comes from the resident id index
+        note_options = _load_note_options(get_storage())
+
+        selected_note_key = st.selectbox(
+            "📋 Select a note to view/generate AI outputs:",
+            list(note_options.keys()),
+            help="Choose a note to see AI summaries, keywords, and enhanced transcriptions"
+        )
 
-                        finally:
-                            # Clean up temp file
-                            if os.path.exists(temp_audio_path):
-                                os.remove(temp_audio_path)
+        if selected_note_key:
+            selected_note_id = note_options[selected_note_key]
+            selected_note = _load_notes_by_id(get_storage()).get(selected_note_id)
+            if selected_note is None:
+                st.warning("⚠️ Note not found - it may have been deleted. Please select another note.")
+                return
+
+            # Source text and cached word counts, shared by the reference and summary stats
+            original_text = selected_note.get("original_transcription") or selected_note.get("transcription", "")
+            original_words, summary_words = _load_note_word_counts(get_storage()).get(
+                selected_note_id, (0, 0)
+            )
 
-    with tab2:
-        st.header("My Notes")
+            # Reference to source (brief)
+            with st.expander("📝 Source Input Reference"):
+                st.write(f"**Language:** {selected_note.get('language', 'Unknown')}")
+                if original_text:
+                    st.write(f"**Input length:** {original_words} words")
+                    st.text_area("Input preview:", original_text[:200] + "..." if len(original_text) > 200 else original_text, height=80, disabled=True)
+                else:
+                    st.warning("No input text available")
+
+            # FOCUS ON AI OUTPUTS
+            st.markdown("### 🤖 **AI-Generated Outputs**")
+
+            # Show existing AI outputs prominently
+            ai_outputs_exist = False
+
+            # Display AI Summary if available
+            if selected_note.get("summary"):
+                ai_outputs_exist = True
+                st.success("✨ **AI Summary Available**")
+                st.markdown("#### 📄 AI Summary")
+                st.info(selected_note.get("summary"))
+
+                # Show summary stats
+                if original_text:
+                    compression = (summary_words / original_words) if original_words > 0 else 0
+
+                    col_sum1, col_sum2, col_sum3 = st.columns(3)
+                    with col_sum1:
+                        st.metric("Original Words", original_words)
+                    with col_sum2:
+                        st.metric("Summary Words", summary_words)
+                    with col_sum3:
+                        st.metric("Compression", f"{compression:.1%}")
+
+            # Display AI Keywords if available
+            if selected_note.get("keywords"):
+                ai_outputs_exist = True
+                st.success("🔍 **AI Keywords Available**")
+                st.markdown("#### 🏷️ AI-Extracted Keywords")
+                keywords_text = ", ".join(selected_note.get("keywords", []))
+                st.write(f"**Keywords:** {keywords_text}")
+
+            # Display Enhanced Transcription if available
+            if selected_note.get("enhanced_transcription") and selected_note.get("original_transcription"):
+                ai_outputs_exist = True
+                st.success("✨ **AI-Enhanced Transcription Available**")
+                st.markdown("#### 📝 AI Enhancement")
+
+                col_enh1, col_enh2 = st.columns(2)
+                with col_enh1:
+                    st.write("**Original:**")
+                    st.text_area("", selected_note.get("original_transcription", ""), height=120, disabled=True, key="orig_disp")
+                with col_enh2:
+                    st.write("**AI Enhanced:**")
+                    st.text_area("", selected_note.get("enhanced_transcription", ""), height=120, disabled=True, key="enh_disp")
+
+                # Show AI improvements if available
+                if selected_note.get("ai_improvements"):
+                    with st.expander("🔍 AI Improvements Made"):
+                        for improvement in selected_note.get("ai_improvements", []):
+                            st.write(f"• {improvement}")
+
+            # Show AI processing stats if available
+            if selected_note.get("cleaning_stats"):
+                ai_outputs_exist = True
+                cleaning_stats = selected_note.get("cleaning_stats")
+                st.success("📊 **AI Processing Statistics Available**")
+                with st.expander("📈 AI Processing Details"):
+                    col_stat1, col_stat2, col_stat3 = st.columns(3)
+                    with col_stat1:
+                        st.metric("Original Length", cleaning_stats.get('original_length', 0))
+                    with col_stat2:
+                        st.metric("Enhanced Length", cleaning_stats.get('cleaned_length', 0))
+                    with col_stat3:
+                        st.metric("AI Confidence", f"{cleaning_stats.get('confidence_score', 0):.1%}")
+
+                    if cleaning_stats.get('ai_model'):
+                        st.info(f"🤖 Processed using: {cleaning_stats.get('ai_model')}")
+
+            # If no AI outputs exist yet, show generation options
+            if not ai_outputs_exist:
+                st.warning("⚠️ No AI outputs available for this note yet. Generate them below:")
+
+            # AI Generation Options
+            st.markdown("### 🚀 **Generate New AI Outputs**")
 
-        # Load and display notes
-        notes = components["storage"].load_notes()
+            col1, col2 = st.columns(2)
 
-        if not notes:
-            st.info("📝 No notes yet. Record your first voice note!")
-        else:
-            # Search and filter
-            col1, col2 = st.columns([2, 1])
             with col1:
-                search_query = st.text_input(
-                    "🔍 Search notes...",
-                    placeholder="Search by content, language, or tags",
+                st.markdown("#### 📝 AI Summary Generation")
+                summary_method = st.radio(
+                    "Summarization method:",
+                    ["🤖 LLaMA 3.1 405B (AI)"],
+                    key="summary_method"
                 )
+
+                if st.button("📝 Generate/Update Summary", type="primary"):
+                    with st.spinner("🤖 LLaMA generating summary..."):
+                        try:
+                            if get_llama_ai():
+                                # Use LLaMA AI summarization
+                                note_text = selected_note.get("transcription", "")
+                                # Updating an existing summary asks the model again rather than the cache
+                                summary = _summary(
+                                    note_text,
+                                    selected_note.get("language_code", "en"),
+                                    refresh=bool(selected_note.get("summary")),
+                                )
+
+                                # Show new AI summary
+                                st.success("✨ New AI Summary generated!")
+                                st.markdown("#### 📄 Fresh AI Summary")
+                                st.info(summary)
+
+                                # Update note with summary
+                                selected_note["summary"] = summary
+                                get_storage().update_note(selected_note)
+                                _invalidate_notes()
+                                st.success("💾 Summary saved! Refresh to see in outputs above.")
+
+                            else:
+                                st.error("❌ LLaMA AI not available for summarization")
+
+                        except Exception as e:
+                            st.error(f"❌ Error generating summary: {str(e)}")
+
             with col2:
-                language_filter = st.selectbox(
-                    "Filter by language", ["All"] + list(language_options.keys())
+                st.markdown("#### 🔍 AI Keyword Extraction")
+                keyword_method = st.radio(
+                    "Keyword extraction method:",
+                    ["🤖 LLaMA 3.1 405B (AI)"],
+                    key="keyword_method"
                 )
 
-            # Filter notes
-            filtered_notes = notes
-            if search_query:
-                filtered_notes = [
-                    note
-                    for note in filtered_notes
-                    if search_query.lower() in note.get("transcription", "").lower()
-                ]
-            if language_filter != "All":
-                filtered_notes = [
-                    note
-                    for note in filtered_notes
-                    if note.get("language") == language_filter
-                ]
-
-            # Display notes - Focus on INPUT DATA
-            for note in reversed(filtered_notes):  # Show newest first
-                with st.expander(
-                    f"🎙️ {note.get('language', 'Unknown')} - {note.get('timestamp', '')[:16]}"
-                ):
-                    col1, col2 = st.columns([3, 1])
-                    with col1:
-                        # Highlight this is INPUT DATA section
-                        st.markdown("### 📥 **Input Data**")
-
-                        # Show audio information prominently
-                        if note.get("audio_file"):
-                            st.info(f"🎵 **Audio File:** {note.get('audio_file')}")
-
-                        # Show language and processing info
-                        st.write(f"**Language:** {note.get('language', 'Unknown')} ({note.get('language_code', '')})")
-
-                        # Show recording method
-                        tags = note.get("tags", [])
-                        if "device-recording" in tags:
-                            st.write("📱 **Source:** Device Recording")
-                        elif "uploaded-audio" in tags:
-                            st.write("📁 **Source:** Uploaded Audio File")
-                        elif "OCR" in tags:
-                            st.write("🔍 **Source:** OCR Text Extraction")
-
-                        # FOCUS ON ORIGINAL INPUT - show original transcription prominently
-                        st.markdown("### 📝 **Original Transcription (Input)**")
-                        original_text = note.get("original_transcription") or note.get("transcription", "")
-                        if original_text:
-                            st.text_area(
-                                "Raw input text:",
-                                value=original_text,
-                                height=150,
-                                disabled=True,
-                                key=f"input_display_{note.get('id', '')}"
-                            )
-                        else:
-                            st.warning("No original transcription available")
-
-                        # Show word count and basic stats for input
-                        if original_text:
-                            word_count = len(original_text.split())
-                            char_count = len(original_text)
-                            st.write(f"📊 **Input Stats:** {word_count} words, {char_count} characters")
-
-                        # Show audio player if audio file is available
-                        if note.get("audio_path") and os.path.exists(note.get("audio_path")):
-                            st.write("**🎵 Audio Recording:**")
-                            with open(note.get("audio_path"), "rb") as audio_file:
-                                st.audio(audio_file.read())
-                        elif note.get("audio_file"):
-                            st.write(f"**Audio File:** {note.get('audio_file')} (file not found)")
-
-                        # Note about AI outputs
-                        if note.get("summary") or note.get("keywords"):
-                            st.success("🤖 **AI outputs available** - Check the 'Summarize' tab for AI-generated summaries and keywords")
-
-                        # Corpus upload for input data
-                        st.markdown("### 🌐 **Corpus Contribution**")
-                        st.info("💡 Upload your input data to contribute to the corpus database")
-
-                        if st.button("📤 Upload Input to Corpus", key=f"corpus_input_{note['id']}"):
-                            with st.spinner("Uploading input data to corpus..."):
-                                try:
-                                    # Check if user is authenticated
-                                    swecha_status = components["storage"].get_swecha_status()
-                                    if not swecha_status.get("authenticated", False):
-                                        st.error("❌ Please log in to Swecha to upload to corpus")
-                                        st.info("Use the sidebar to authenticate with your Swecha account")
-                                    else:
-                                        # Upload the note to Swecha API
-                                        success = components["storage"]._save_note_to_swecha(note)
-                                        if success:
-                                            st.success("✅ Input data uploaded to corpus database!")
-                                            st.info("🎯 Your original transcription is now part of the knowledge base!")
-
-                                            # Mark as uploaded in local storage
-                                            note["uploaded_to_corpus"] = True
-                                            note["corpus_upload_date"] = datetime.now().isoformat()
-                                            components["storage"]._save_note_locally(note)
-                                        else:
-                                            st.error("❌ Failed to upload to corpus. Please try again.")
-                                except Exception as e:
-                                    st.error(f"❌ Error uploading to corpus: {str(e)}")
-                                    st.info("Please check your internet connection and try again.")
+                if st.button("🔍 Generate/Update Keywords", type="primary"):
+                    with st.spinner("🤖 LLaMA extracting keywords..."):
+                        try:
+                            if get_llama_ai():
+                                # Use LLaMA keyword extraction
+                                note_text = selected_note.get("transcription", "")
+                                keywords = _keywords(
+                                    note_text,
+                                    selected_note.get("language_code", "en"),
+                                    refresh=bool(selected_note.get("keywords")),
+                                )
 
-                    with col2:
-                        if st.button("🗑️ Delete", key=f"delete_{note['id']}"):
-                            components["storage"].delete_note(note["id"])
-                            st.rerun()
+                                st.success("✨ New AI Keywords extracted!")
+                                st.markdown("#### 🏷️ Fresh AI Keywords")
+                                st.write(f"**Keywords:** {', '.join(keywords)}")
 
-                        if st.button("📤 Export Input", key=f"export_{note['id']}"):
-                            # Export functionality - focus on input data
-                            export_data = components["export_utils"].export_note(
-                                note, format="markdown"
-                            )
-                            st.download_button(
-                                "⬇️ Download Input MD",
-                                export_data,
-                                file_name=f"input_note_{note['id'][:8]}.md",
-                                mime="text/markdown",
-                                key=f"download_input_{note['id']}",
+                                # Update note with keywords
+                                selected_note["keywords"] = keywords
+                                get_storage().update_note(selected_note)
+                                _invalidate_notes()
+                                st.success("💾 Keywords saved! Refresh to see in outputs above.")
+
+                            else:
+                                st.error("❌ LLaMA AI not available for keyword extraction")
+
+                        except Exception as e:
+                            st.error(f"❌ Error extracting keywords: {str(e)}")
+
+            # Both outputs from one combined request (concurrent fallback inside the summarizer)
+            if st.button("🚀 Generate Both", key="generate_summary_and_keywords"):
+                with st.spinner("🤖 LLaMA generating summary and keywords..."):
+                    try:
+                        if get_llama_ai():
+                            note_text = selected_note.get("transcription", "")
+                            summary, keywords = _summary_and_keywords(
+                                note_text,
+                                selected_note.get("language_code", "en"),
+                                refresh=bool(selected_note.get("summary") or selected_note.get("keywords")),
                             )
 
-    with tab3:
-        st.header("🤖 AI Outputs & Summarization")
-        st.info("📤 **This section displays AI-generated outputs:** summaries, keywords, enhanced transcriptions, and processing insights")
+                            st.markdown("#### 📄 Fresh AI Summary")
+                            st.info(summary)
+                            st.markdown("#### 🏷️ Fresh AI Keywords")
+                            st.write(f"**Keywords:** {', '.join(keywords)}")
 
-        # Load notes for AI processing
-        notes = components["storage"].load_notes()
-        if notes:
-            # Filter notes that have some AI processing available or can be processed
-            note_options = {
-                f"{note.get('timestamp', '')[:16]} - {note.get('language', '')}": note
-                for note in notes
-            }
+                            # Update note with both outputs in one write
+                            selected_note["summary"] = summary
+                            selected_note["keywords"] = keywords
+                            get_storage().update_note(selected_note)
+                            _invalidate_notes()
+                            st.success("💾 Summary and keywords saved! Refresh to see in outputs above.")
 
-            selected_note_key = st.selectbox(
-                "📋 Select a note to view/generate AI outputs:",
-                list(note_options.keys()),
-                help="Choose a note to see AI summaries, keywords, and enhanced transcriptions"
-            )
+                        else:
+                            st.error("❌ LLaMA AI not available for summarization")
 
-            if selected_note_key:
-                selected_note = note_options[selected_note_key]
-
-                # Reference to source (brief)
-                with st.expander("📝 Source Input Reference"):
-                    st.write(f"**Language:** {selected_note.get('language', 'Unknown')}")
-                    original_text = selected_note.get("original_transcription") or selected_note.get("transcription", "")
-                    if original_text:
-                        word_count = len(original_text.split())
-                        st.write(f"**Input length:** {word_count} words")
-                        st.text_area("Input preview:", original_text[:200] + "..." if len(original_text) > 200 else original_text, height=80, disabled=True)
-                    else:
-                        st.warning("No input text available")
-
-                # FOCUS ON AI OUTPUTS
-                st.markdown("### 🤖 **AI-Generated Outputs**")
-
-                # Show existing AI outputs prominently
-                ai_outputs_exist = False
-
-                # Display AI Summary if available
-                if selected_note.get("summary"):
-                    ai_outputs_exist = True
-                    st.success("✨ **AI Summary Available**")
-                    st.markdown("#### 📄 AI Summary")
-                    st.info(selected_note.get("summary"))
-
-                    # Show summary stats
-                    original_text = selected_note.get("original_transcription") or selected_note.get("transcription", "")
-                    if original_text:
-                        original_words = len(original_text.split())
-                        summary_words = len(selected_note.get("summary", "").split())
-                        compression = (summary_words / original_words) if original_words > 0 else 0
-
-                        col_sum1, col_sum2, col_sum3 = st.columns(3)
-                        with col_sum1:
-                            st.metric("Original Words", original_words)
-                        with col_sum2:
-                            st.metric("Summary Words", summary_words)
-                        with col_sum3:
-                            st.metric("Compression", f"{compression:.1%}")
-
-                # Display AI Keywords if available
-                if selected_note.get("keywords"):
-                    ai_outputs_exist = True
-                    st.success("🔍 **AI Keywords Available**")
-                    st.markdown("#### 🏷️ AI-Extracted Keywords")
-                    keywords_text = ", ".join(selected_note.get("keywords", []))
-                    st.write(f"**Keywords:** {keywords_text}")
-
-                # Display Enhanced Transcription if available
-                if selected_note.get("enhanced_transcription") and selected_note.get("original_transcription"):
-                    ai_outputs_exist = True
-                    st.success("✨ **AI-Enhanced Transcription Available**")
-                    st.markdown("#### 📝 AI Enhancement")
-
-                    col_enh1, col_enh2 = st.columns(2)
-                    with col_enh1:
-                        st.write("**Original:**")
-                        st.text_area("", selected_note.get("original_transcription", ""), height=120, disabled=True, key="orig_disp")
-                    with col_enh2:
-                        st.write("**AI Enhanced:**")
-                        st.text_area("", selected_note.get("enhanced_transcription", ""), height=120, disabled=True, key="enh_disp")
-
-                    # Show AI improvements if available
-                    if selected_note.get("ai_improvements"):
-                        with st.expander("🔍 AI Improvements Made"):
-                            for improvement in selected_note.get("ai_improvements", []):
-                                st.write(f"• {improvement}")
-
-                # Show AI processing stats if available
-                if selected_note.get("cleaning_stats"):
-                    ai_outputs_exist = True
-                    cleaning_stats = selected_note.get("cleaning_stats")
-                    st.success("📊 **AI Processing Statistics Available**")
-                    with st.expander("📈 AI Processing Details"):
-                        col_stat1, col_stat2, col_stat3 = st.columns(3)
-                        with col_stat1:
-                            st.metric("Original Length", cleaning_stats.get('original_length', 0))
-                        with col_stat2:
-                            st.metric("Enhanced Length", cleaning_stats.get('cleaned_length', 0))
-                        with col_stat3:
-                            st.metric("AI Confidence", f"{cleaning_stats.get('confidence_score', 0):.1%}")
-
-                        if cleaning_stats.get('ai_model'):
-                            st.info(f"🤖 Processed using: {cleaning_stats.get('ai_model')}")
-
-                # If no AI outputs exist yet, show generation options
-                if not ai_outputs_exist:
-                    st.warning("⚠️ No AI outputs available for this note yet. Generate them below:")
-
-                # AI Generation Options
-                st.markdown("### 🚀 **Generate New AI Outputs**")
-
-                col1, col2 = st.columns(2)
+                    except Exception as e:
+                        st.error(f"❌ Error generating summary and keywords: {str(e)}")
 
-                with col1:
-                    st.markdown("#### 📝 AI Summary Generation")
-                    summary_method = st.radio(
-                        "Summarization method:",
-                        ["🤖 LLaMA 3.1 405B (AI)"],
-                        key="summary_method"
-                    )
+            # Corpus upload section for outputs
+            st.markdown("### 🌐 **Corpus Contribution**")
+            if ai_outputs_exist:
+                if st.button("📤 Upload AI Outputs to Corpus Database", type="secondary"):
+                    with st.spinner("Uploading AI outputs to corpus..."):
+                        try:
+                            # Check if user is authenticated
+                            swecha_status = get_storage().get_swecha_status()
+                            if not swecha_status.get("authenticated", False):
+                                st.error("❌ Please log in to Swecha to upload to corpus")
+                                st.info("Use the sidebar to authenticate with your Swecha account")
+                            else:
+                                # Create a comprehensive record with AI outputs
+                                now_iso = datetime.now().isoformat()
+                                ai_record = {
+                                    "id": f"ai_output_{selected_note.get('id', uuid.uuid4().hex)}",
+                                    "original_transcription": selected_note.get("original_transcription") or selected_note.get("transcription", ""),
+                                    "enhanced_transcription": selected_note.get("enhanced_transcription", ""),
+                                    "summary": selected_note.get("summary", ""),
+                                    "keywords": selected_note.get("keywords", []),
+                                    "ai_improvements": selected_note.get("ai_improvements", []),
+                                    "cleaning_stats": selected_note.get("cleaning_stats", {}),
+                                    "language": selected_note.get("language", "Unknown"),
+                                    "language_code": selected_note.get("language_code", "te"),
+                                    "processing_method": "ai_enhanced",
+                                    "timestamp": now_iso,
+                                    "note_type": "ai_processed_output"
+                                }
+
+                                # Upload AI-enhanced data to corpus
+                                success = get_storage()._save_note_to_swecha(ai_record)
+                                if success:
+                                    st.success("✅ AI outputs uploaded to corpus database!")
+                                    st.info("🎯 Your AI summaries and keywords are now part of the knowledge base!")
+
+                                    # Mark original note as having AI outputs uploaded
+                                    selected_note["ai_outputs_uploaded"] = True
+                                    selected_note["ai_upload_date"] = now_iso
+                                    get_storage().update_note(selected_note)
+                                    _invalidate_notes()
+                                else:
+                                    st.error("❌ Failed to upload AI outputs to corpus. Please try again.")
+                        except Exception as e:
+                            st.error(f"❌ Error uploading to corpus: {str(e)}")
+                            st.info("Please check your internet connection and try again.")
+            else:
+                st.info("💡 Generate AI outputs first, then contribute them to the corpus database!")
 
-                    if st.button("📝 Generate/Update Summary", type="primary"):
-                        with st.spinner("🤖 LLaMA generating summary..."):
-                            try:
-                                if components["llama_ai"]:
-                                    # Use LLaMA AI summarization
-                                    ai_result = components["llama_ai"].summarize_text(
-                                        selected_note.get("transcription", ""),
-                                        selected_note.get("language_code", "en")
-                                    )
-                                    summary = ai_result['summary']
-
-                                    # Show new AI summary
-                                    st.success("✨ New AI Summary generated!")
-                                    st.markdown("#### 📄 Fresh AI Summary")
-                                    st.info(summary)
+    else:
+        st.info("📝 No notes available. Create some voice notes first to generate AI outputs!")
 
-                                    # Show additional AI insights
-                                    if ai_result.get('key_points'):
-                                        with st.expander("🎯 AI-Identified Key Points"):
-                                            for point in ai_result['key_points']:
-                                                st.write(f"• {point}")
 
-                                    # Update note with summary
-                                    selected_note["summary"] = summary
-                                    components["storage"].update_note(selected_note)
-                                    st.success("💾 Summary saved! Refresh to see in outputs above.")
+@st.fragment
+def render_ocr_tab() -> None:
+    """OCR tab: extract text from an uploaded image"""
+    st.header("OCR - Extract Text from Images")
 
-                                else:
-                                    st.error("❌ LLaMA AI not available for summarization")
+    uploaded_image = st.file_uploader(
+        "Upload an image to extract text",
+        type=["png", "jpg", "jpeg", "tiff", "bmp"],
+        help="Upload an image containing text to extract it using OCR",
+    )
 
-                            except Exception as e:
-                                st.error(f"❌ Error generating summary: {str(e)}")
+    if uploaded_image is not None:
+        st.image(uploaded_image, caption="Uploaded Image", width=400)
 
-                with col2:
-                    st.markdown("#### 🔍 AI Keyword Extraction")
-                    keyword_method = st.radio(
-                        "Keyword extraction method:",
-                        ["🤖 LLaMA 3.1 405B (AI)"],
-                        key="keyword_method"
-                    )
+        if st.button("🔍 Extract Text from Image"):
+            with st.spinner("Processing image with OCR..."):
+                try:
+                    # Decode straight from the upload stream, without copying its bytes
+                    extracted_text = get_ocr_reader().extract_text_from_bytes(uploaded_image)
 
-                    if st.button("🔍 Generate/Update Keywords", type="primary"):
-                        with st.spinner("🤖 LLaMA extracting keywords..."):
-                            try:
-                                if components["llama_ai"]:
-                                    # Use LLaMA keyword extraction
-                                    ai_result = components["llama_ai"].extract_keywords(
-                                        selected_note.get("transcription", ""),
-                                        max_keywords=10
-                                    )
-
-                                    keywords = [kw['term'] for kw in ai_result.get('keywords', [])]
-
-                                    st.success("✨ New AI Keywords extracted!")
-                                    st.markdown("#### 🏷️ Fresh AI Keywords")
-                                    st.write(f"**Keywords:** {', '.join(keywords)}")
-
-                                    # Show detailed keyword analysis
-                                    if ai_result.get('keywords'):
-                                        with st.expander("🎯 Detailed AI Keyword Analysis"):
-                                            for kw in ai_result['keywords'][:5]:  # Top 5
-                                                relevance = kw.get('relevance', 0.5)
-                                                st.write(f"**{kw['term']}** - Relevance: {relevance:.1%} ({kw.get('type', 'unknown')})")
-
-                                    if ai_result.get('main_topics'):
-                                        st.write("**AI-Identified Topics:**")
-                                        st.write(", ".join(ai_result['main_topics']))
-
-                                    if ai_result.get('text_category'):
-                                        st.write(f"**AI Category:** {ai_result['text_category']}")
-
-                                    # Update note with keywords
-                                    selected_note["keywords"] = keywords
-                                    components["storage"].update_note(selected_note)
-                                    st.success("💾 Keywords saved! Refresh to see in outputs above.")
+                    if extracted_text and extracted_text.strip():
+                        st.success("✅ Text extracted successfully!")
 
-                                else:
-                                    st.error("❌ LLaMA AI not available for keyword extraction")
+                        # Editable text area
+                        final_text = st.text_area(
+                            "Extracted Text (editable):",
+                            value=extracted_text,
+                            height=200,
+                            key="ocr_text_edit",
+                        )
 
-                            except Exception as e:
-                                st.error(f"❌ Error extracting keywords: {str(e)}")
+                        # Option to save as note
+                        if st.button("💾 Save as Voice Note"):
+                            with st.spinner("🔄 Processing OCR text with AI..."):
+                                # Generate summary and keywords using LLaMA AI
+                                summary = None
+                                keywords = []
 
-                # Corpus upload section for outputs
-                st.markdown("### 🌐 **Corpus Contribution**")
-                if ai_outputs_exist:
-                    if st.button("📤 Upload AI Outputs to Corpus Database", type="secondary"):
-                        with st.spinner("Uploading AI outputs to corpus..."):
-                            try:
-                                # Check if user is authenticated
-                                swecha_status = components["storage"].get_swecha_status()
-                                if not swecha_status.get("authenticated", False):
-                                    st.error("❌ Please log in to Swecha to upload to corpus")
-                                    st.info("Use the sidebar to authenticate with your Swecha account")
-                                else:
-                                    # Create a comprehensive record with AI outputs
-                                    ai_record = {
-                                        "id": f"ai_output_{selected_note.get('id', uuid.uuid4().hex)}",
-                                        "original_transcription": selected_note.get("original_transcription") or selected_note.get("transcription", ""),
-                                        "enhanced_transcription": selected_note.get("enhanced_transcription", ""),
-                                        "summary": selected_note.get("summary", ""),
-                                        "keywords": selected_note.get("keywords", []),
-                                        "ai_improvements": selected_note.get("ai_improvements", []),
-                                        "cleaning_stats": selected_note.get("cleaning_stats", {}),
-                                        "language": selected_note.get("language", "Unknown"),
-                                        "language_code": selected_note.get("language_code", "te"),
-                                        "processing_method": "ai_enhanced",
-                                        "timestamp": datetime.now().isoformat(),
-                                        "note_type": "ai_processed_output"
-                                    }
-
-                                    # Upload AI-enhanced data to corpus
-                                    success = components["storage"]._save_note_to_swecha(ai_record)
-                                    if success:
-                                        st.success("✅ AI outputs uploaded to corpus database!")
-                                        st.info("🎯 Your AI summaries and keywords are now part of the knowledge base!")
-
-                                        # Mark original note as having AI outputs uploaded
-                                        selected_note["ai_outputs_uploaded"] = True
-                                        selected_note["ai_upload_date"] = datetime.now().isoformat()
-                                        components["storage"].update_note(selected_note)
-                                    else:
-                                        st.error("❌ Failed to upload AI outputs to corpus. Please try again.")
-                            except Exception as e:
-                                st.error(f"❌ Error uploading to corpus: {str(e)}")
-                                st.info("Please check your internet connection and try again.")
-                else:
-                    st.info("💡 Generate AI outputs first, then contribute them to the corpus database!")
+                                # Use LLaMA 3.1 for AI-powered summary and keyword extraction
+                                if get_llama_ai() and final_text and _has_more_words(final_text):
+                                    try:
+                                        st.info("� Using LLaMA 3.1 for AI-powered summary and keyword extraction...")
+                                        summary, keywords = _summary_and_keywords(final_text, "en")
+                                        if summary:
+                                            st.success("✅ LLaMA 3.1 processing completed!")
+                                    except Exception as llama_error:
+                                        st.warning(f"LLaMA AI processing failed: {str(llama_error)}")
+
+                                # If no summary/keywords generated, show info
+                                if not summary:
+                                    st.info("💡 Add OpenRouter API key to enable advanced AI summarization")
+                                if not keywords:
+                                    st.info("💡 Add OpenRouter API key to enable advanced AI keyword extraction")
+
+                                note_data = {
+                                    "id": str(uuid.uuid4()),
+                                    "timestamp": datetime.now().isoformat(),
+                                    "language": "OCR Text",
+                                    "language_code": "en",
+                                    "transcription": final_text,
+                                    "audio_file": None,
+                                    "summary": summary,
+                                    "keywords": keywords,
+                                    "tags": ["OCR"],
+                                    "source": "OCR",
+                                    "processing_method": "llama_ai" if summary and keywords else "none",
+                                    "ai_model": "llama-3.1-405b" if summary and keywords else None
+                                }
+
+                                get_storage().save_note(note_data)
+                                _invalidate_notes()
+                                st.success("📝 OCR text saved as note!")
+
+                                # Show generated summary and keywords
+                                if summary:
+                                    st.subheader("📋 Generated Summary")
+                                    st.info(summary)
+
+                                if keywords:
+                                    st.subheader("🔑 Key Topics")
+                                    keyword_tags = " ".join(map("`{}`".format, keywords[:5]))
+                                    st.markdown(keyword_tags)
+
+                                # Note: OCR text cannot be uploaded to Swecha as it requires audio
+                                st.info("💡 Tip: OCR notes cannot be uploaded to Swecha corpus as they don't have audio recordings.")
+                    else:
+                        st.warning(
+                            "No text found in the image. Please try with a clearer image."
+                        )
 
+                except Exception as e:
+                    st.error(f"Error during OCR processing: {str(e)}")
+
+
+def _render_achievement_badges(contributions: Dict[str, Any]) -> None:
+    """Achievement badges earned from the user's Swecha contribution totals"""
+    total_contributions = contributions.get('total_contributions', 0)
+    audio_duration = contributions.get('audio_duration', 0)
+    media_stats = contributions.get('contributions_by_media_type', {})
+
+    st.markdown("#### 🏆 **Achievement Badges**")
+    badges_col1, badges_col2, badges_col3 = st.columns(3)
+
+    with badges_col1:
+        if total_contributions >= 10:
+            st.success("🌟 **Contributor** - 10+ contributions")
+        elif total_contributions >= 5:
+            st.info("⭐ **Helper** - 5+ contributions")
+        elif total_contributions >= 1:
+            st.info("🎯 **Starter** - First contribution!")
+
+    with badges_col2:
+        if audio_duration >= 3600:  # 1 hour
+            st.success("🎵 **Audio Master** - 1+ hour of audio")
+        elif audio_duration >= 1800:  # 30 minutes
+            st.info("🎤 **Voice Contributor** - 30+ min audio")
+
+    with badges_col3:
+        # Multi-media badge - check for multiple contribution types
+        media_types_count = sum(1 for media_type in ['audio', 'text', 'video', 'image']
+                               if media_stats.get(media_type, 0) > 0)
+
+        if media_types_count >= 4:
+            st.success("🎭 **Multi-Media Master** - All 4 media types!")
+        elif media_types_count >= 3:
+            st.success("🎨 **Multi-Media Pro** - 3+ media types")
+        elif media_types_count >= 2:
+            st.info("🎪 **Multi-Media** - 2+ media types")
+
+        # Additional specialized badges
+        video_count = media_stats.get('video', 0)
+        image_count = media_stats.get('image', 0)
+
+        if video_count >= 5:
+            st.success("🎬 **Video Creator** - 5+ videos")
+        elif image_count >= 10:
+            st.success("🖼️ **Image Collector** - 10+ images")
+
+
+def _render_personal_insights(contributions: Dict[str, Any]) -> None:
+    """Impact summary and next milestones for a user with Swecha contributions"""
+    # Show user's ranking and percentile (if available from API)
+    insights_col1, insights_col2 = st.columns(2)
+
+    with insights_col1:
+        # Contribution trend
+        st.info("📊 **Your Impact:** Your contributions are helping preserve and advance Telugu language technology!")
+
+        # Contribution quality metrics
+        total_contribs = contributions.get('total_contributions', 0)
+        audio_hours = round(contributions.get('audio_duration', 0) / 3600, 2)
+
+        if total_contribs > 20:
+            st.success(f"🏆 **Super Contributor:** {total_contribs} contributions! You're making a significant impact.")
+        elif total_contribs > 10:
+            st.success(f"⭐ **Active Contributor:** {total_contribs} contributions! Keep up the great work.")
+        elif total_contribs > 5:
+            st.info(f"🎯 **Growing Contributor:** {total_contribs} contributions! You're on the right track.")
         else:
-            st.info("📝 No notes available. Create some voice notes first to generate AI outputs!")
+            st.info(f"🌱 **New Contributor:** {total_contribs} contributions! Every contribution matters.")
+
+    with insights_col2:
+        # Personal goals and suggestions
+        st.markdown("#### 🎯 **Personal Goals**")
+
+        if audio_hours < 5:
+            # Milestone, bar and progress figures share one element
+            goal = 1.0 if audio_hours < 1 else 5.0
+            st.progress(
+                min(audio_hours / goal, 1.0),
+                text=(
+                    f"� **Next milestone:** Reach {goal:g} hour{'s' if goal > 1 else ''} of audio contributions"
+                    f" — {audio_hours:.2f} / {goal:.1f} hours"
+                ),
+            )
+        else:
+            st.success("🏆 **Audio Champion:** 5+ hours contributed!")
 
-    with tab4:
-        st.header("OCR - Extract Text from Images")
+        if total_contribs < 50:
+            remaining = 50 - total_contribs
+            st.write(f"� **Challenge:** {remaining} more contributions to reach 50!")
+        else:
+            st.success("🎉 **Milestone Master:** 50+ contributions achieved!")
+
+
+@st.fragment
+def _render_quick_actions() -> None:
+    """Quick Actions buttons; their clicks rerun only this panel, not the whole Stats tab"""
+    st.markdown("---")
+    st.markdown("### ⚡ **Quick Actions**")
+
+    action_col1, action_col2, action_col3 = st.columns(3)
+
+    with action_col1:
+        if st.button("🎙️ **Record New Note**", help="Go to Record tab"):
+            # This would switch to the Record tab (requires state management)
+            st.info("Switch to the 'Record' tab to create a new voice note!")
+
+    with action_col2:
+        if st.button("📤 **Upload My Notes**", help="Upload all my pending notes to corpus"):
+            st.session_state.pop("confirm_bulk_upload", None)
+            pending_count = _load_local_note_stats(get_storage())[0]
+            if not pending_count:
+                st.info("No pending uploads found.")
+            elif not st.session_state.get("privacy_consent", False):
+                st.warning("🔒 Tick the corpus consent box under Privacy Settings in the sidebar to upload your notes.")
+            elif not get_storage().get_swecha_status().get("authenticated", False):
+                st.error("❌ Please log in to Swecha to upload to corpus")
+            else:
+                # Ask before sharing everything at once; the upload runs on the confirming click
+                st.session_state.confirm_bulk_upload = True
+
+        if st.session_state.get("confirm_bulk_upload"):
+            pending_notes = [n for n in _load_notes(get_storage()) if _is_pending_upload(n)]
+            st.warning(f"Upload {len(pending_notes)} of your notes to the public corpus? This can't be undone.")
+            confirm_col, cancel_col = st.columns(2)
+            with confirm_col:
+                confirmed = st.button("✅ Upload", key="confirm_bulk_upload_yes")
+            with cancel_col:
+                if st.button("Cancel", key="confirm_bulk_upload_no"):
+                    st.session_state.pop("confirm_bulk_upload", None)
+                    st.rerun(scope="fragment")
+            if confirmed:
+                st.session_state.pop("confirm_bulk_upload", None)
+                if not st.session_state.get("privacy_consent", False):
+                    st.warning("🔒 Corpus consent was withdrawn; nothing was uploaded.")
+                elif pending_notes:
+                    # Only this fragment reruns, so the progress bar streams while the rest of the page stays put
+                    uploaded = _upload_notes_to_corpus(get_storage(), pending_notes)
+                    _invalidate_notes()
+                    if uploaded == len(pending_notes):
+                        st.success(f"✅ Uploaded {uploaded} note(s) to the corpus database!")
+                    else:
+                        st.warning(f"Uploaded {uploaded} of {len(pending_notes)} note(s); please retry the rest.")
+                else:
+                    st.info("No pending uploads found.")
 
-        uploaded_image = st.file_uploader(
-            "Upload an image to extract text",
-            type=["png", "jpg", "jpeg", "tiff", "bmp"],
-            help="Upload an image containing text to extract it using OCR",
+    with action_col3:
+        if st.button("🔄 **Refresh My Stats**", help="Reload your personal statistics"):
+            # Coalesce rapid repeat clicks into a single full rerun
+            now = time.monotonic()
+            if now - st.session_state.get("last_stats_refresh", 0.0) > _STATS_REFRESH_DEBOUNCE_S:
+                st.session_state.last_stats_refresh = now
+                # Refreshing must redraw the stats above, so this one reruns the whole app
+                st.rerun(scope="app")
+            st.toast("Refreshing…")
+
+
+@st.fragment
+def render_stats_tab() -> None:
+    """Stats tab: personal contribution and corpus statistics"""
+    st.header("📊 My Contribution Statistics")
+
+    llm_cache_stats = st.session_state.get("llm_cache_stats")
+    if llm_cache_stats:
+        st.caption(
+            f"🧠 AI summary cache this session: {llm_cache_stats['hits']} hits, "
+            f"{llm_cache_stats['misses']} misses"
         )
 
-        if uploaded_image is not None:
-            st.image(uploaded_image, caption="Uploaded Image", width=400)
+    # Privacy notice - prominently displayed at the top
+    st.markdown("### 🔒 Privacy Information")
+    st.info("""
+    **Your personal statistics are private and secure:**
+
+    • **Personal Data:** Only you can see your contribution statistics
+    • **Local Storage:** All notes are stored locally on your device
+    • **Opt-in Corpus:** Data is only contributed to the corpus with your explicit consent
+    • **Anonymized:** Contributed data is anonymized and contains no personal information
+    • **Offline First:** App works completely offline
+    """)
+    st.markdown("---")
+
+    # Fetch local notes once and reuse them across every stats section
+    local_notes = _load_notes(get_storage())
+
+    # Check Swecha API connection and user authentication
+    if st.button("🔄 Refresh", key="refresh_swecha_status", help="Re-check the Swecha connection"):
+        _cached_swecha_status.clear()
+        _cached_user_contributions.clear()
+    swecha_status = _cached_swecha_status(
+        get_storage(), st.session_state.get("swecha_token")
+    )
 
-            if st.button("🔍 Extract Text from Image"):
-                with st.spinner("Processing image with OCR..."):
-                    try:
-                        # Save uploaded image temporarily
-                        temp_image_path = f"temp_image_{uuid.uuid4().hex}.png"
-                        with open(temp_image_path, "wb") as f:
-                            f.write(uploaded_image.read())
-
-                        # Extract text
-                        extracted_text = components["ocr_reader"].extract_text(
-                            temp_image_path
-                        )
+    if swecha_status.get("connected", False) and swecha_status.get("authenticated", False):
+        # User is authenticated - fetch contributions while the profile renders
+        contributions_future = _prefetch_user_contributions(
+            get_storage(), st.session_state.get("swecha_token")
+        )
+        st.success("✅ **Connected to Swecha Corpus Platform**")
+
+        # User Profile Section
+        st.markdown("### 👤 **User Profile**")
+        user_info = swecha_status.get('user_info', {})
+
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            # One card for the whole profile instead of a box per field
+            profile_lines = [
+                f"**Name:** {user_info.get('name', 'Unknown')}",
+                f"**Phone:** {user_info.get('phone', 'Unknown')}",
+            ]
+            if user_info.get('email'):
+                profile_lines.append(f"**Email:** {user_info['email']}")
+            profile_lines.append(f"**Member since:** {(user_info.get('created_at') or '')[:10] or 'Unknown'}")
+            st.info("\n\n".join(profile_lines))
+
+        with col2:
+            if user_info.get('roles'):
+                role_badges = " ".join(
+                    _ROLE_BADGES.get(role.get('name', 'user'), "👤 **User**")
+                    for role in user_info['roles']
+                )
+                st.markdown(f"**Roles:** {role_badges}")
 
-                        if extracted_text.strip():
-                            st.success("✅ Text extracted successfully!")
+        st.markdown("---")
 
-                            # Editable text area
-                            final_text = st.text_area(
-                                "Extracted Text (editable):",
-                                value=extracted_text,
-                                height=200,
-                                key="ocr_text_edit",
-                            )
+        # Contribution Statistics
+        st.markdown("### 📈 **Your Contributions to Telugu Corpus**")
 
-                            # Option to save as note
-                            if st.button("💾 Save as Voice Note"):
-                                with st.spinner("🔄 Processing OCR text with AI..."):
-                                    # Generate summary and keywords using LLaMA AI
-                                    summary = None
-                                    keywords = []
+        # Fetch user contributions from Swecha API
+        contributions = None
+        try:
+            with st.spinner("Loading your contribution statistics..."):
+                contributions = contributions_future.result()
 
-                                    # Use LLaMA 3.1 for AI-powered summary and keyword extraction
-                                    if components["llama_ai"] and final_text and len(final_text.split()) > 10:
-                                        try:
-                                            st.info("� Using LLaMA 3.1 for AI-powered summary and keyword extraction...")
-                                            summary, keywords = components["llama_ai"].generate_summary_and_keywords(
-                                                final_text, language="en"
-                                            )
-                                            if summary:
-                                                st.success("✅ LLaMA 3.1 processing completed!")
-                                        except Exception as llama_error:
-                                            st.warning(f"LLaMA AI processing failed: {str(llama_error)}")
-
-                                    # If no summary/keywords generated, show info
-                                    if not summary:
-                                        st.info("💡 Add OpenRouter API key to enable advanced AI summarization")
-                                    if not keywords:
-                                        st.info("💡 Add OpenRouter API key to enable advanced AI keyword extraction")
-
-                                    note_data = {
-                                        "id": str(uuid.uuid4()),
-                                        "timestamp": datetime.now().isoformat(),
-                                        "language": "OCR Text",
-                                        "language_code": "en",
-                                        "transcription": final_text,
-                                        "audio_file": None,
-                                        "summary": summary,
-                                        "keywords": keywords,
-                                        "tags": ["OCR"],
-                                        "source": "OCR",
-                                        "processing_method": "llama_ai" if summary and keywords else "none",
-                                        "ai_model": "llama-3.1-405b" if summary and keywords else None
-                                    }
-
-                                    components["storage"].save_note(note_data)
-                                    st.success("📝 OCR text saved as note!")
-
-                                    # Show generated summary and keywords
-                                    if summary:
-                                        st.subheader("📋 Generated Summary")
-                                        st.info(summary)
-
-                                    if keywords:
-                                        st.subheader("🔑 Key Topics")
-                                        keyword_tags = " ".join([f"`{kw}`" for kw in keywords[:5]])
-                                        st.markdown(keyword_tags)
-
-                                    # Note: OCR text cannot be uploaded to Swecha as it requires audio
-                                    st.info("💡 Tip: OCR notes cannot be uploaded to Swecha corpus as they don't have audio recordings.")
-                        else:
-                            st.warning(
-                                "No text found in the image. Please try with a clearer image."
-                            )
+            if contributions:
+                # Main contribution metrics - Top row
+                col1, col2, col3, col4 = st.columns(4)
 
-                    except Exception as e:
-                        st.error(f"Error during OCR processing: {str(e)}")
+                with col1:
+                    total_contributions = contributions.get('total_contributions', 0)
+                    st.metric("🎯 Total Contributions", total_contributions)
 
-                    finally:
-                        # Clean up temp file
-                        if os.path.exists(temp_image_path):
-                            os.remove(temp_image_path)
+                with col2:
+                    audio_count = contributions.get('contributions_by_media_type', {}).get('audio', 0)
+                    st.metric("🎵 Audio Files", audio_count)
+
+                with col3:
+                    text_count = contributions.get('contributions_by_media_type', {}).get('text', 0)
+                    st.metric("📝 Text Records", text_count)
+
+                with col4:
+                    audio_duration = contributions.get('audio_duration', 0)
+                    duration_mins = round(audio_duration / 60, 1) if audio_duration else 0
+                    st.metric("⏱️ Audio Duration", f"{duration_mins} mins")
+
+                # Additional media type metrics - Second row
+                st.markdown("#### 📊 **Media Type Breakdown**")
+                media_col1, media_col2, media_col3, media_col4 = st.columns(4)
+
+                with media_col1:
+                    video_count = contributions.get('contributions_by_media_type', {}).get('video', 0)
+                    st.metric("🎬 Video Files", video_count)
+
+                with media_col2:
+                    image_count = contributions.get('contributions_by_media_type', {}).get('image', 0)
+                    st.metric("🖼️ Image Files", image_count)
+
+                with media_col3:
+                    video_duration = contributions.get('video_duration', 0)
+                    video_duration_mins = round(video_duration / 60, 1) if video_duration else 0
+                    st.metric("🎞️ Video Duration", f"{video_duration_mins} mins")
+
+                with media_col4:
+                    # Calculate total file size across all media types
+                    total_size = sum(
+                        contrib.get('size', 0)
+                        for media_type in _MEDIA_CONTRIBUTION_KEYS
+                        for contrib in contributions.get(media_type) or ()
+                    )
 
-    with tab5:
-        st.header("📊 My Contribution Statistics")
+                    st.metric("💾 Total Data Size", _format_size(total_size))
 
-        # Privacy notice - prominently displayed at the top
-        st.markdown("### 🔒 Privacy Information")
-        st.info("""
-        **Your personal statistics are private and secure:**
+                # Detailed contribution breakdown
+                st.markdown("#### 📊 **Detailed Contribution Breakdown**")
 
-        • **Personal Data:** Only you can see your contribution statistics
-        • **Local Storage:** All notes are stored locally on your device
-        • **Opt-in Corpus:** Data is only contributed to the corpus with your explicit consent
-        • **Anonymized:** Contributed data is anonymized and contains no personal information
-        • **Offline First:** App works completely offline
-        """)
-        st.markdown("---")
+                # Media type distribution
+                media_stats = contributions.get('contributions_by_media_type', {})
+                if any(media_stats.values()):
+                    media_counts = {
+                        label: count
+                        for media_type, label in (('audio', 'Audio'), ('text', 'Text'), ('video', 'Video'), ('image', 'Image'))
+                        if (count := media_stats.get(media_type, 0)) > 0  # Only show non-zero counts
+                    }
 
-        # Check Swecha API connection and user authentication
-        swecha_status = components["storage"].get_swecha_status()
+                    if media_counts:
+                        st.bar_chart({"Count": media_counts})
+
+                # Recent contributions
+                st.markdown("#### 📝 **Recent Contributions**")
+
+                for media_type, title, detail, expanded in _CONTRIBUTION_EXPANDERS:
+                    if not contributions.get(media_type):
+                        continue
+                    with st.expander(title, expanded=expanded):
+                        for contrib in contributions[media_type][:5]:  # Show recent 5
+                            # One markdown element per row instead of a column grid of small writes
+                            lines = [f"**{contrib.get('title', 'Untitled')}**"]
+                            description = contrib.get('description')
+                            if description:
+                                lines.append(_truncate(description))
+                            facts = []
+                            if detail:
+                                field, template = detail
+                                value = contrib.get(field)
+                                if value:
+                                    facts.append(template.format(value))
+                            facts.append(f"📊 {contrib.get('size', 0)} bytes")
+                            facts.append("✅ Reviewed" if contrib.get('reviewed') else "⏳ Pending")
+                            facts.append(f":gray[{(contrib.get('timestamp') or '')[:10] or 'Unknown'}]")
+                            lines.append(" &nbsp;·&nbsp; ".join(facts))
+                            st.markdown("  \n".join(lines) + "\n\n---")
+
+                # Show message if no contributions found in any category
+                has_any_contributions = any(
+                    contributions.get(media_type) for media_type in _MEDIA_CONTRIBUTION_KEYS
+                )
 
-        if swecha_status.get("connected", False) and swecha_status.get("authenticated", False):
-            # User is authenticated - show comprehensive dashboard
-            st.success("✅ **Connected to Swecha Corpus Platform**")
+                if not has_any_contributions:
+                    st.info("📋 **No recent contributions found.** Your contributions will appear here once you start uploading content to the corpus.")
+
+                # Achievement badges
+                _render_achievement_badges(contributions)
+
+            else:
+                st.info("📊 **No contributions found yet.** Start contributing to see your statistics!")
+                st.markdown("""
+                **How to contribute:**
+                1. 🎙️ Record voice notes using the 'Record' tab
+                2. 📤 Upload them to the corpus using the upload buttons
+                3. 📝 Your contributions will appear here with statistics
+                """)
+
+        except Exception as e:
+            # Network failures are reported inside the storage manager; keep the traceback of anything else
+            logger.exception("Stats dashboard fell back to local statistics")
+            error_message = str(e)
+            if "timeout" in error_message.lower():
+                st.error("⏱️ **Request timed out while loading your contributions.**")
+                st.info("📡 This usually means the server is busy. Please try again in a few moments.")
+                st.markdown("""
+                **Troubleshooting tips:**
+                - Check your internet connection
+                - Wait a few minutes and refresh the page
+                - Try switching to a different network if possible
+                """)
+            elif "connection" in error_message.lower():
+                st.error("🌐 **Connection error while loading contributions.**")
+                st.info("📡 Please check your internet connection and try again.")
+            else:
+                st.error(f"❌ **Error loading contributions:** {error_message}")
+                st.info("📞 If this persists, please contact support or try again later.")
+
+            # Show fallback local statistics
+            st.markdown("---")
+            st.info("📱 **Showing local device statistics as fallback:**")
+            if local_notes:
+                local_col1, local_col2 = st.columns(2)
+                with local_col1:
+                    st.metric("📝 Local Notes", len(local_notes))
+                with local_col2:
+                    st.metric("📤 Pending Uploads", _load_local_note_stats(get_storage())[0])
 
-            # User Profile Section
-            st.markdown("### 👤 **User Profile**")
-            user_info = swecha_status.get('user_info', {})
+    else:
+        # User not authenticated - show limited local stats
+        st.warning("🔐 **Please authenticate with Swecha to view your contribution statistics**")
 
-            col1, col2 = st.columns([2, 1])
-            with col1:
-                st.info(f"**Name:** {user_info.get('name', 'Unknown')}")
-                st.info(f"**Phone:** {user_info.get('phone', 'Unknown')}")
-                if user_info.get('email'):
-                    st.info(f"**Email:** {user_info.get('email')}")
-                st.info(f"**Member since:** {user_info.get('created_at', 'Unknown')[:10] if user_info.get('created_at') else 'Unknown'}")
+        # Show local statistics only
+        st.markdown("### 📱 **Local Statistics** (This Device Only)")
 
-            with col2:
-                if user_info.get('roles'):
-                    roles = [role.get('name', 'user') for role in user_info.get('roles', [])]
-                    role_badges = ""
-                    for role in roles:
-                        if role == 'admin':
-                            role_badges += "🔧 **Admin** "
-                        elif role == 'reviewer':
-                            role_badges += "👁️ **Reviewer** "
-                        else:
-                            role_badges += "👤 **User** "
-                    st.markdown(f"**Roles:** {role_badges}")
+        # Upload and language tallies are cached per notes version; only audio presence is live
+        pending_uploads, lang_counts = _load_local_note_stats(get_storage())
+        audio_paths = [n["audio_path"] for n in local_notes if n.get("audio_path")]
+        present_audio = _present_files(audio_paths)
+        # This is a rough estimate - in real implementation you'd get actual audio duration
+        total_duration = 2.0 * sum(1 for path in audio_paths if path in present_audio)  # Assume 2 minutes average per note
 
-            st.markdown("---")
+        # Display local stats
+        col1, col2, col3, col4 = st.columns(4)
 
-            # Contribution Statistics
-            st.markdown("### 📈 **Your Contributions to Telugu Corpus**")
+        with col1:
+            st.metric("📝 Local Notes", len(local_notes))
 
-            # Fetch user contributions from Swecha API
-            try:
-                with st.spinner("Loading your contribution statistics..."):
-                    contributions = components["storage"].get_user_contributions()
+        with col2:
+            st.metric("📤 Pending Uploads", pending_uploads)
 
-                if contributions:
-                    # Main contribution metrics - Top row
-                    col1, col2, col3, col4 = st.columns(4)
+        with col3:
+            st.metric("🌐 Languages Used", len(lang_counts))
 
-                    with col1:
-                        total_contributions = contributions.get('total_contributions', 0)
-                        st.metric("🎯 Total Contributions", total_contributions)
+        with col4:
+            st.metric("⏱️ Estimated Duration", f"{total_duration:.1f} min")
 
-                    with col2:
-                        audio_count = contributions.get('contributions_by_media_type', {}).get('audio', 0)
-                        st.metric("🎵 Audio Files", audio_count)
-
-                    with col3:
-                        text_count = contributions.get('contributions_by_media_type', {}).get('text', 0)
-                        st.metric("📝 Text Records", text_count)
-
-                    with col4:
-                        audio_duration = contributions.get('audio_duration', 0)
-                        duration_mins = round(audio_duration / 60, 1) if audio_duration else 0
-                        st.metric("⏱️ Audio Duration", f"{duration_mins} mins")
-
-                    # Additional media type metrics - Second row
-                    st.markdown("#### 📊 **Media Type Breakdown**")
-                    media_col1, media_col2, media_col3, media_col4 = st.columns(4)
-
-                    with media_col1:
-                        video_count = contributions.get('contributions_by_media_type', {}).get('video', 0)
-                        st.metric("🎬 Video Files", video_count)
-
-                    with media_col2:
-                        image_count = contributions.get('contributions_by_media_type', {}).get('image', 0)
-                        st.metric("🖼️ Image Files", image_count)
-
-                    with media_col3:
-                        video_duration = contributions.get('video_duration', 0)
-                        video_duration_mins = round(video_duration / 60, 1) if video_duration else 0
-                        st.metric("🎞️ Video Duration", f"{video_duration_mins} mins")
-
-                    with media_col4:
-                        # Calculate total file size across all media types
-                        total_size = 0
-                        for media_type in ['audio_contributions', 'text_contributions', 'video_contributions', 'image_contributions']:
-                            if contributions.get(media_type):
-                                for contrib in contributions[media_type]:
-                                    total_size += contrib.get('size', 0)
-
-                        # Convert to human readable format
-                        if total_size > 1024*1024*1024:  # GB
-                            size_str = f"{total_size/(1024*1024*1024):.1f} GB"
-                        elif total_size > 1024*1024:  # MB
-                            size_str = f"{total_size/(1024*1024):.1f} MB"
-                        elif total_size > 1024:  # KB
-                            size_str = f"{total_size/1024:.1f} KB"
-                        else:
-                            size_str = f"{total_size} bytes"
-
-                        st.metric("💾 Total Data Size", size_str)
-
-                    # Detailed contribution breakdown
-                    st.markdown("#### 📊 **Detailed Contribution Breakdown**")
-
-                    # Media type distribution
-                    media_stats = contributions.get('contributions_by_media_type', {})
-                    if any(media_stats.values()):
-                        media_df = pd.DataFrame([
-                            {'Media Type': 'Audio', 'Count': media_stats.get('audio', 0)},
-                            {'Media Type': 'Text', 'Count': media_stats.get('text', 0)},
-                            {'Media Type': 'Video', 'Count': media_stats.get('video', 0)},
-                            {'Media Type': 'Image', 'Count': media_stats.get('image', 0)}
-                        ])
-                        media_df = media_df[media_df['Count'] > 0]  # Only show non-zero counts
-
-                        if not media_df.empty:
-                            st.bar_chart(media_df.set_index('Media Type'))
-
-                    # Recent contributions
-                    st.markdown("#### 📝 **Recent Contributions**")
-
-                    # Audio contributions
-                    if contributions.get('audio_contributions'):
-                        with st.expander("🎵 **Audio Contributions**", expanded=True):
-                            for contrib in contributions['audio_contributions'][:5]:  # Show recent 5
-                                col_a, col_b, col_c = st.columns([3, 1, 1])
-                                with col_a:
-                                    st.write(f"**{contrib.get('title', 'Untitled')}**")
-                                    if contrib.get('description'):
-                                        st.caption(contrib['description'][:100] + "..." if len(contrib.get('description', '')) > 100 else contrib.get('description', ''))
-                                with col_b:
-                                    duration = contrib.get('duration', 0)
-                                    if duration:
-                                        st.write(f"⏱️ {duration}s")
-                                    st.write(f"📊 {contrib.get('size', 0)} bytes")
-                                with col_c:
-                                    status = "✅ Reviewed" if contrib.get('reviewed') else "⏳ Pending"
-                                    st.write(status)
-                                    timestamp = contrib.get('timestamp', '')[:10] if contrib.get('timestamp') else 'Unknown'
-                                    st.caption(timestamp)
-                                st.markdown("---")
-
-                    # Text contributions
-                    if contributions.get('text_contributions'):
-                        with st.expander("📝 **Text Contributions**", expanded=False):
-                            for contrib in contributions['text_contributions'][:5]:  # Show recent 5
-                                col_a, col_b, col_c = st.columns([3, 1, 1])
-                                with col_a:
-                                    st.write(f"**{contrib.get('title', 'Untitled')}**")
-                                    if contrib.get('description'):
-                                        st.caption(contrib['description'][:100] + "..." if len(contrib.get('description', '')) > 100 else contrib.get('description', ''))
-                                with col_b:
-                                    st.write(f"📊 {contrib.get('size', 0)} bytes")
-                                with col_c:
-                                    status = "✅ Reviewed" if contrib.get('reviewed') else "⏳ Pending"
-                                    st.write(status)
-                                    timestamp = contrib.get('timestamp', '')[:10] if contrib.get('timestamp') else 'Unknown'
-                                    st.caption(timestamp)
-                                st.markdown("---")
-
-                    # Video contributions
-                    if contributions.get('video_contributions'):
-                        with st.expander("🎬 **Video Contributions**", expanded=False):
-                            for contrib in contributions['video_contributions'][:5]:  # Show recent 5
-                                col_a, col_b, col_c = st.columns([3, 1, 1])
-                                with col_a:
-                                    st.write(f"**{contrib.get('title', 'Untitled')}**")
-                                    if contrib.get('description'):
-                                        st.caption(contrib['description'][:100] + "..." if len(contrib.get('description', '')) > 100 else contrib.get('description', ''))
-                                with col_b:
-                                    duration = contrib.get('duration', 0)
-                                    if duration:
-                                        st.write(f"⏱️ {duration}s")
-                                    st.write(f"📊 {contrib.get('size', 0)} bytes")
-                                with col_c:
-                                    status = "✅ Reviewed" if contrib.get('reviewed') else "⏳ Pending"
-                                    st.write(status)
-                                    timestamp = contrib.get('timestamp', '')[:10] if contrib.get('timestamp') else 'Unknown'
-                                    st.caption(timestamp)
-                                st.markdown("---")
-
-                    # Image contributions
-                    if contributions.get('image_contributions'):
-                        with st.expander("🖼️ **Image Contributions**", expanded=False):
-                            for contrib in contributions['image_contributions'][:5]:  # Show recent 5
-                                col_a, col_b, col_c = st.columns([3, 1, 1])
-                                with col_a:
-                                    st.write(f"**{contrib.get('title', 'Untitled')}**")
-                                    if contrib.get('description'):
-                                        st.caption(contrib['description'][:100] + "..." if len(contrib.get('description', '')) > 100 else contrib.get('description', ''))
-                                with col_b:
-                                    dimensions = contrib.get('dimensions')
-                                    if dimensions:
-                                        st.write(f"📐 {dimensions}")
-                                    st.write(f"📊 {contrib.get('size', 0)} bytes")
-                                with col_c:
-                                    status = "✅ Reviewed" if contrib.get('reviewed') else "⏳ Pending"
-                                    st.write(status)
-                                    timestamp = contrib.get('timestamp', '')[:10] if contrib.get('timestamp') else 'Unknown'
-                                    st.caption(timestamp)
-                                st.markdown("---")
-
-                    # Show message if no contributions found in any category
-                    has_any_contributions = any([
-                        contributions.get('audio_contributions'),
-                        contributions.get('text_contributions'),
-                        contributions.get('video_contributions'),
-                        contributions.get('image_contributions')
-                    ])
-
-                    if not has_any_contributions:
-                        st.info("📋 **No recent contributions found.** Your contributions will appear here once you start uploading content to the corpus.")
-
-                    # Achievement badges
-                    st.markdown("#### 🏆 **Achievement Badges**")
-                    badges_col1, badges_col2, badges_col3 = st.columns(3)
-
-                    with badges_col1:
-                        if total_contributions >= 10:
-                            st.success("🌟 **Contributor** - 10+ contributions")
-                        elif total_contributions >= 5:
-                            st.info("⭐ **Helper** - 5+ contributions")
-                        elif total_contributions >= 1:
-                            st.info("🎯 **Starter** - First contribution!")
-
-                    with badges_col2:
-                        if audio_duration >= 3600:  # 1 hour
-                            st.success("🎵 **Audio Master** - 1+ hour of audio")
-                        elif audio_duration >= 1800:  # 30 minutes
-                            st.info("🎤 **Voice Contributor** - 30+ min audio")
-
-                    with badges_col3:
-                        # Multi-media badge - check for multiple contribution types
-                        media_types_count = sum(1 for media_type in ['audio', 'text', 'video', 'image']
-                                               if media_stats.get(media_type, 0) > 0)
-
-                        if media_types_count >= 4:
-                            st.success("🎭 **Multi-Media Master** - All 4 media types!")
-                        elif media_types_count >= 3:
-                            st.success("🎨 **Multi-Media Pro** - 3+ media types")
-                        elif media_types_count >= 2:
-                            st.info("🎪 **Multi-Media** - 2+ media types")
-
-                        # Additional specialized badges
-                        video_count = media_stats.get('video', 0)
-                        image_count = media_stats.get('image', 0)
-
-                        if video_count >= 5:
-                            st.success("🎬 **Video Creator** - 5+ videos")
-                        elif image_count >= 10:
-                            st.success("🖼️ **Image Collector** - 10+ images")
+        # Language distribution for local notes
+        if local_notes:
+            st.markdown("#### 📊 **Local Language Distribution**")
+            if lang_counts:
+                st.bar_chart({"Count": lang_counts})
 
-                else:
-                    st.info("📊 **No contributions found yet.** Start contributing to see your statistics!")
-                    st.markdown("""
-                    **How to contribute:**
-                    1. 🎙️ Record voice notes using the 'Record' tab
-                    2. 📤 Upload them to the corpus using the upload buttons
-                    3. 📝 Your contributions will appear here with statistics
-                    """)
-
-            except Exception as e:
-                error_message = str(e)
-                if "timeout" in error_message.lower():
-                    st.error("⏱️ **Request timed out while loading your contributions.**")
-                    st.info("📡 This usually means the server is busy. Please try again in a few moments.")
-                    st.markdown("""
-                    **Troubleshooting tips:**
-                    - Check your internet connection
-                    - Wait a few minutes and refresh the page
-                    - Try switching to a different network if possible
-                    """)
-                elif "connection" in error_message.lower():
-                    st.error("🌐 **Connection error while loading contributions.**")
-                    st.info("📡 Please check your internet connection and try again.")
-                else:
-                    st.error(f"❌ **Error loading contributions:** {error_message}")
-                    st.info("📞 If this persists, please contact support or try again later.")
-
-                # Show fallback local statistics
-                st.markdown("---")
-                st.info("📱 **Showing local device statistics as fallback:**")
-                local_notes = components["storage"].load_notes()
-                if local_notes:
-                    local_col1, local_col2 = st.columns(2)
-                    with local_col1:
-                        st.metric("📝 Local Notes", len(local_notes))
-                    with local_col2:
-                        pending = len([n for n in local_notes if not n.get('uploaded_to_corpus', False)])
-                        st.metric("📤 Pending Uploads", pending)
+        # Authentication help
+        st.markdown("---")
+        st.markdown("### 🔑 **Get Full Statistics**")
+        st.info("""
+        **To unlock full contribution statistics and corpus insights:**
+
+        1. 📱 Use the sidebar to **Sign Up** or **Log In** with Swecha
+        2. 🔐 Complete the authentication process
+        3. 📊 View your complete contribution history and statistics
+        4. 🏆 Earn achievement badges for your contributions
+        5. 📈 Track your impact on the Telugu language corpus
+        """)
+
+    # Personal performance insights (only for authenticated users)
+    if swecha_status.get("connected", False) and swecha_status.get("authenticated", False):
+        st.markdown("---")
+        st.markdown("### 📈 **Personal Performance Insights**")
 
+        # Reuse the contributions fetched for the dashboard above
+        if contributions and contributions.get('total_contributions', 0) > 0:
+            _render_personal_insights(contributions)
+        elif contributions is None:
+            st.info("📊 **Personal insights will appear here once you start contributing to the corpus.**")
         else:
-            # User not authenticated - show limited local stats
-            st.warning("🔐 **Please authenticate with Swecha to view your contribution statistics**")
+            st.info("📊 **Start your contribution journey:** Upload your first note to see personalized insights!")
 
-            # Show local statistics only
-            st.markdown("### 📱 **Local Statistics** (This Device Only)")
+    # Quick actions
+    _render_quick_actions()
 
-            # Load local statistics
-            stats = components["storage"].get_corpus_stats()
-            local_notes = components["storage"].load_notes()
 
-            # Display local stats
-            col1, col2, col3, col4 = st.columns(4)
+@st.fragment
+def render_sidebar() -> None:
+    """Privacy, Swecha account and info panels; their widgets rerun only this fragment"""
+    # Privacy settings
+    st.subheader("Privacy Settings")
+    privacy_consent = st.checkbox(
+        "I consent to contribute my data to the multilingual corpus",
+        value=st.session_state.privacy_consent,
+        help="Your audio and transcription will be anonymized and used to improve AI for Indian languages",
+    )
+    st.session_state.privacy_consent = privacy_consent
+
+    if privacy_consent:
+        st.success("✅ Contributing to corpus")
+    else:
+        st.info("🔒 Private mode - data stays local")
+
+    # Swecha API Integration
+    st.subheader("🌟 Swecha Corpus")
+    swecha_manager = get_swecha()
+
+    if swecha_manager.is_logged_in():
+        swecha_manager.show_user_info()
+    else:
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("🔐 Login to Swecha"):
+                st.session_state.show_swecha_login = True
+                st.session_state.show_swecha_signup = False
+        with col2:
+            if st.button("📝 Sign Up for Swecha"):
+                st.session_state.show_swecha_signup = True
+                st.session_state.show_swecha_login = False
+
+    # Show login form if requested
+    if st.session_state.get('show_swecha_login', False) and swecha_manager.show_login_form():
+        st.session_state.show_swecha_login = False
 
-            with col1:
-                st.metric("📝 Local Notes", len(local_notes))
+    # Show signup form if requested
+    if st.session_state.get('show_swecha_signup', False) and swecha_manager.show_signup_form():
+        st.session_state.show_swecha_signup = False
 
-            with col2:
-                pending_uploads = len([n for n in local_notes if not n.get('uploaded_to_corpus', False)])
-                st.metric("📤 Pending Uploads", pending_uploads)
-
-            with col3:
-                local_languages = set(note.get('language', 'Unknown') for note in local_notes)
-                st.metric("🌐 Languages Used", len(local_languages))
-
-            with col4:
-                # Calculate total audio duration from local notes
-                total_duration = 0
-                for note in local_notes:
-                    if note.get("audio_path") and os.path.exists(note.get("audio_path")):
-                        # This is a rough estimate - in real implementation you'd get actual audio duration
-                        total_duration += 2  # Assume 2 minutes average per note
-                st.metric("⏱️ Estimated Duration", f"{total_duration:.1f} min")
-
-            # Language distribution for local notes
-            if local_notes:
-                st.markdown("#### 📊 **Local Language Distribution**")
-                lang_counts = {}
-                for note in local_notes:
-                    lang = note.get('language', 'Unknown')
-                    lang_counts[lang] = lang_counts.get(lang, 0) + 1
-
-                if lang_counts:
-                    lang_df = pd.DataFrame(
-                        list(lang_counts.items()), columns=["Language", "Count"]
-                    )
-                    st.bar_chart(lang_df.set_index("Language"))
+    # Privacy Information Section
+    st.subheader("🔒 Privacy & Storage")
+    with st.expander("Storage Information", expanded=True):
+        st.markdown("""
+        **WhispNote uses Swecha API for all data storage:**
+
+        • **Cloud Storage:** All notes stored securely via Swecha API
+        • **Account Required:** Create a free Swecha account or login to access all features
+        • **Secure Authentication:** Bearer token-based authentication
+        • **Telugu Corpus:** Your contributions help build the Swecha Telugu language corpus
+        • **Data Privacy:** Your data is handled according to Swecha's privacy policy
+        • **Open Source:** Transparent and community-driven
+        """)
 
-            # Authentication help
-            st.markdown("---")
-            st.markdown("### 🔑 **Get Full Statistics**")
-            st.info("""
-            **To unlock full contribution statistics and corpus insights:**
-
-            1. 📱 Use the sidebar to **Sign Up** or **Log In** with Swecha
-            2. 🔐 Complete the authentication process
-            3. 📊 View your complete contribution history and statistics
-            4. 🏆 Earn achievement badges for your contributions
-            5. 📈 Track your impact on the Telugu language corpus
-            """)
-
-        # Personal performance insights (only for authenticated users)
-        if swecha_status.get("connected", False) and swecha_status.get("authenticated", False):
-            st.markdown("---")
-            st.markdown("### 📈 **Personal Performance Insights**")
-
-            try:
-                contributions = components["storage"].get_user_contributions()
-                if contributions and contributions.get('total_contributions', 0) > 0:
-                    # Show user's ranking and percentile (if available from API)
-                    insights_col1, insights_col2 = st.columns(2)
-
-                    with insights_col1:
-                        # Contribution trend
-                        st.info("📊 **Your Impact:** Your contributions are helping preserve and advance Telugu language technology!")
-
-                        # Contribution quality metrics
-                        total_contribs = contributions.get('total_contributions', 0)
-                        audio_hours = round(contributions.get('audio_duration', 0) / 3600, 2)
-
-                        if total_contribs > 20:
-                            st.success(f"🏆 **Super Contributor:** {total_contribs} contributions! You're making a significant impact.")
-                        elif total_contribs > 10:
-                            st.success(f"⭐ **Active Contributor:** {total_contribs} contributions! Keep up the great work.")
-                        elif total_contribs > 5:
-                            st.info(f"🎯 **Growing Contributor:** {total_contribs} contributions! You're on the right track.")
-                        else:
-                            st.info(f"🌱 **New Contributor:** {total_contribs} contributions! Every contribution matters.")
-
-                    with insights_col2:
-                        # Personal goals and suggestions
-                        st.markdown("#### 🎯 **Personal Goals**")
-
-                        if audio_hours < 1:
-                            st.write("� **Next milestone:** Reach 1 hour of audio contributions")
-                            progress = min(audio_hours / 1.0, 1.0)
-                            st.progress(progress)
-                            st.caption(f"Progress: {audio_hours:.2f} / 1.0 hours")
-                        elif audio_hours < 5:
-                            st.write("� **Next milestone:** Reach 5 hours of audio contributions")
-                            progress = min(audio_hours / 5.0, 1.0)
-                            st.progress(progress)
-                            st.caption(f"Progress: {audio_hours:.2f} / 5.0 hours")
-                        else:
-                            st.success("🏆 **Audio Champion:** 5+ hours contributed!")
+    # App info
+    st.subheader("About")
+    st.info("""
+    **WhispNote** is a cloud-based voice note app powered by Swecha that:
+    - Records and transcribes speech in Indian languages
+    - Summarizes content using AI
+    - Extracts keywords and topics
+    - Supports OCR for image text
+    - Contributes to Telugu language corpus
+    """)
 
-                        if total_contribs < 50:
-                            remaining = 50 - total_contribs
-                            st.write(f"� **Challenge:** {remaining} more contributions to reach 50!")
-                        else:
-                            st.success("🎉 **Milestone Master:** 50+ contributions achieved!")
 
-                else:
-                    st.info("📊 **Start your contribution journey:** Upload your first note to see personalized insights!")
+def main() -> None:
+    init_session_state()
 
-            except Exception as e:
-                st.info("📊 **Personal insights will appear here once you start contributing to the corpus.**")
+    # Custom CSS and header in a single element
+    st.markdown(_PAGE_HEADER_HTML, unsafe_allow_html=True)
 
-        # Quick actions
-        st.markdown("---")
-        st.markdown("### ⚡ **Quick Actions**")
+    # Sidebar (language stays outside the fragment since the Record tab depends on it)
+    with st.sidebar:
+        st.header("Settings")
 
-        action_col1, action_col2, action_col3 = st.columns(3)
+        # Language selection
+        selected_language = st.selectbox(
+            "Select Language",
+            options=_LANGUAGE_NAMES,
+            index=_DEFAULT_LANGUAGE_INDEX,
+        )
+        language_code = _LANGUAGE_OPTIONS[selected_language]
 
-        with action_col1:
-            if st.button("🎙️ **Record New Note**", help="Go to Record tab"):
-                # This would switch to the Record tab (requires state management)
-                st.info("Switch to the 'Record' tab to create a new voice note!")
+        render_sidebar()
 
-        with action_col2:
-            if st.button("📤 **Upload My Notes**", help="Upload all my pending notes to corpus"):
-                # This would trigger upload of all local notes
-                pending_notes = [n for n in components["storage"].load_notes() if not n.get('uploaded_to_corpus', False)]
-                if pending_notes:
-                    st.info(f"Found {len(pending_notes)} of your notes ready to upload!")
-                else:
-                    st.info("No pending uploads found.")
+    # Check authentication status
+    swecha_manager = get_swecha()
+    if not swecha_manager.is_logged_in():
+        st.warning("🔐 **Authentication Required**")
+        st.info("""
+        ### Welcome to WhispNote! 🎙️
 
-        with action_col3:
-            if st.button("🔄 **Refresh My Stats**", help="Reload your personal statistics"):
-                st.rerun()
+        To access all features and contribute to the Swecha Telugu corpus, please:
+
+        - **Login** if you already have a Swecha account
+        - **Sign Up** to create a new free account
+
+        Use the sidebar authentication options to get started.
+        """)
+        st.stop()
+
+    # Main content tabs (only the selected one is rendered on each rerun)
+    active_tab = st.radio(
+        "Section", _TABS, horizontal=True, key="active_tab", label_visibility="collapsed"
+    )
+
+    if active_tab == "🎙️ Record":
+        render_record_tab(selected_language, language_code)
+    elif active_tab == "📝 My Notes":
+        render_notes_tab()
+    elif active_tab == "📊 Summarize":
+        render_summarize_tab()
+    elif active_tab == "🔍 OCR":
+        render_ocr_tab()
+    else:
+        render_stats_tab()
 
 
 if __name__ == "__main__":
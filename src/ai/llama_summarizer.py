@@ -1,10 +1,13 @@
 # llama_summarizer.py - Advanced AI Summarization with Llama 3.1 405B and alternatives
 import os
+import re
 import sys
-from typing import Any, Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
 
 import requests
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -405,6 +408,14 @@ Summary:"""
 
         return summary
 
+    def is_fallback_summary(self, text: str, summary: str, max_length: int = 150) -> bool:
+        """True if summary is empty or only the extractive fallback for text"""
+        return not summary or summary == self._extractive_summarize(text, max_length)
+
+    def is_fallback_keywords(self, text: str, keywords: List[str], num_keywords: int = 8) -> bool:
+        """True if keywords are empty or only the simple fallback extraction for text"""
+        return not keywords or set(keywords) == set(self._simple_keyword_extraction(text, num_keywords))
+
     def get_setup_instructions(self) -> str:
         """Return setup instructions for various AI services"""
         return """
@@ -601,10 +612,22 @@ Add your API keys to your environment or .env file!
                     st.warning(f"⚠️ {service_name.title()} failed: {str(e)[:100]}...")
                     continue
 
-        # Fallback to separate calls
-        summary = self.summarize(text, language)
-        keywords = self.extract_keywords(text, language, num_keywords)
-        return summary, keywords
+        # Fallback to separate calls, issued concurrently so the round trips overlap
+        ctx = get_script_run_ctx()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            summary_future = pool.submit(
+                self._run_in_script_ctx, ctx, self.summarize, text, language
+            )
+            keywords_future = pool.submit(
+                self._run_in_script_ctx, ctx, self.extract_keywords, text, language, num_keywords
+            )
+            return summary_future.result(), keywords_future.result()
+
+    @staticmethod
+    def _run_in_script_ctx(ctx: Any, func: Callable[..., Any], *args: Any) -> Any:
+        """Run func in a worker thread that can still post Streamlit status messages"""
+        add_script_run_ctx(ctx=ctx)
+        return func(*args)
 
     # Keyword extraction methods for each service
     def _extract_keywords_with_openrouter(
@@ -707,8 +730,6 @@ Add your API keys to your environment or .env file!
 
     def _simple_keyword_extraction(self, text: str, num_keywords: int) -> List[str]:
         """Simple fallback keyword extraction"""
-        import re
-
         # Simple approach: find most common meaningful words
         words = re.findall(r"\b[a-zA-Z]{3,}\b", text.lower())
         # Filter out common words
@@ -832,8 +853,6 @@ Return only the cleaned text:"""
 
     def _simple_text_cleaning(self, text: str) -> Dict[str, Any]:
         """Simple fallback text cleaning"""
-        import re
-
         # Basic cleaning
         cleaned = text
         removed_elements = []
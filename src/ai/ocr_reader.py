@@ -1,6 +1,7 @@
 # ocr_reader.py
+import io
 import os
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 
 import streamlit as st
 from PIL import Image
@@ -78,35 +79,72 @@ class OCRReader:
             return None
 
         try:
-            # Try EasyOCR first (better for multilingual)
-            if self.easyocr_available:
-                text = self._extract_with_easyocr(image_path)
-                if text and text.strip():
-                    return text
+            with Image.open(image_path) as image:
+                return self._extract_from_image(image, language)
+
+        except Exception as e:
+            st.error(f"OCR extraction failed: {str(e)}")
+            return None
 
-            # Fall back to Tesseract
-            if self.tesseract_available:
-                text = self._extract_with_tesseract(image_path, language)
-                if text and text.strip():
-                    return text
+    def extract_text_from_bytes(
+        self, data: Union[bytes, BinaryIO], language: str = "eng"
+    ) -> Optional[str]:
+        """
+        Extract text from an in-memory image without writing it to disk
 
-            # Final fallback - simple text extraction attempt
-            return self._basic_text_extraction(image_path)
+        Args:
+            data: Encoded image bytes (PNG, JPEG, ...) or a binary stream of them
+            language: Language code for OCR (tesseract format)
+
+        Returns:
+            Extracted text or None if failed
+        """
+        try:
+            if isinstance(data, bytes):
+                data = io.BytesIO(data)
+            else:
+                # Decode straight from the stream; it may already have been read once
+                data.seek(0)
+            with Image.open(data) as image:
+                return self._extract_from_image(image, language)
 
         except Exception as e:
             st.error(f"OCR extraction failed: {str(e)}")
             return None
 
-    def _extract_with_easyocr(self, image_path: str) -> Optional[str]:
+    def _extract_from_image(self, image: Image.Image, language: str) -> str:
+        """Run the OCR engines over an image decoded once up front"""
+        # Convert to RGB if necessary
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+
+        # Try EasyOCR first (better for multilingual)
+        if self.easyocr_available:
+            text = self._extract_with_easyocr(image)
+            if text and text.strip():
+                return text
+
+        # Fall back to Tesseract
+        if self.tesseract_available:
+            text = self._extract_with_tesseract(image, language)
+            if text and text.strip():
+                return text
+
+        # Final fallback - simple text extraction attempt
+        return self._basic_text_extraction()
+
+    def _extract_with_easyocr(self, image: Image.Image) -> Optional[str]:
         """Extract text using EasyOCR"""
         try:
+            import numpy as np
+
             if self.easyocr_reader is None:
                 self.easyocr_reader = self._load_easyocr()
 
             if self.easyocr_reader is None:
                 return None
 
-            results = self.easyocr_reader.readtext(image_path)
+            results = self.easyocr_reader.readtext(np.asarray(image))
 
             # Combine all detected text
             extracted_texts = []
@@ -121,7 +159,7 @@ class OCRReader:
             return None
 
     def _extract_with_tesseract(
-        self, image_path: str, language: str = "eng"
+        self, image: Image.Image, language: str = "eng"
     ) -> Optional[str]:
         """Extract text using Tesseract OCR"""
         try:
@@ -141,13 +179,6 @@ class OCRReader:
 
             tesseract_lang = lang_mapping.get(language, "eng")
 
-            # Open and preprocess image
-            image = Image.open(image_path)
-
-            # Convert to RGB if necessary
-            if image.mode != "RGB":
-                image = image.convert("RGB")
-
             # Extract text
             extracted_text = pytesseract.image_to_string(
                 image,
@@ -161,7 +192,7 @@ class OCRReader:
             st.warning(f"Tesseract OCR failed: {str(e)}")
             return None
 
-    def _basic_text_extraction(self, image_path: str) -> str:
+    def _basic_text_extraction(self) -> str:
         """Basic fallback text extraction (placeholder)"""
         try:
             # This is a very basic fallback - in practice, you might want to
@@ -1,10 +1,214 @@
 # whisper_transcriber.py
+import atexit
+import io
+import multiprocessing
 import os
-from typing import Optional
+import subprocess
+import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, List, Optional, Union
 
+import numpy as np
 import streamlit as st
+import torch
 import whisper
 
+# faster-whisper (CTranslate2) runs Whisper with int8 weights; optional speedup
+try:
+    from faster_whisper import WhisperModel
+
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+# Map language codes to Whisper format
+LANGUAGE_MAPPING = {
+    "hi": "hindi",
+    "te": "telugu",
+    "ta": "tamil",
+    "bn": "bengali",
+    "mr": "marathi",
+    "gu": "gujarati",
+    "kn": "kannada",
+    "ml": "malayalam",
+    "pa": "punjabi",
+    "en": "english",
+}
+
+# A file path, encoded audio bytes, a binary stream or decoded 16 kHz samples
+AudioSource = Union[str, bytes, BinaryIO, np.ndarray]
+
+# Log-mel spectrograms of short clips, keyed by audio content hash
+MEL_CACHE_DIR = "whispnote_data/mel"
+
+# Least recently used spectrograms are evicted past this size (~1 MB per clip)
+MEL_CACHE_MAX_BYTES = 512 * 1024**2
+
+# Approximate memory per loaded model (GB), used to size the CPU process pool
+MODEL_RAM_GB = {"tiny": 1, "base": 1, "small": 2, "medium": 5, "large": 10}
+
+# whisper.transcribe()'s defaults for retrying a window at a higher temperature
+COMPRESSION_RATIO_THRESHOLD = 2.4
+LOGPROB_THRESHOLD = -1.0
+NO_SPEECH_THRESHOLD = 0.6
+
+# Model loaded once in each CPU pool worker process
+_worker_model = None
+
+
+def _decode_in_process(data: bytes) -> Optional[np.ndarray]:
+    """Mono float32 samples via libsndfile when the clip is already 16 kHz, else None"""
+    try:
+        # Imported here so a missing libsndfile only costs this fast path, not the module
+        import soundfile as sf
+    except (ImportError, OSError):
+        return None  # ffmpeg decodes everything libsndfile would
+
+    try:
+        with sf.SoundFile(io.BytesIO(data)) as f:
+            if f.samplerate != whisper.audio.SAMPLE_RATE:
+                return None  # leave resampling to ffmpeg
+            samples = f.read(dtype="float32", always_2d=True)
+    except RuntimeError:
+        # Not a format libsndfile reads (e.g. WebM/MP3 from the browser)
+        return None
+    return samples.mean(axis=1) if samples.shape[1] > 1 else samples[:, 0]
+
+
+def load_audio(audio: AudioSource) -> np.ndarray:
+    """Decode any AudioSource to 16 kHz mono float32 samples (libsndfile, else an ffmpeg pipe)"""
+    if isinstance(audio, np.ndarray):
+        return audio
+    if isinstance(audio, str):
+        return whisper.load_audio(audio)
+
+    data = audio if isinstance(audio, bytes) else audio.read()
+    samples = _decode_in_process(data)
+    if samples is not None:
+        return samples
+
+    cmd = [
+        "ffmpeg",
+        "-threads", "0",
+        "-i", "pipe:0",
+        "-f", "s16le",
+        "-ac", "1",
+        "-acodec", "pcm_s16le",
+        "-ar", str(whisper.audio.SAMPLE_RATE),
+        "-",
+    ]
+    try:
+        out = subprocess.run(cmd, input=data, capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError:
+        # Some containers (e.g. m4a with a trailing index) need a seekable input
+        fd, temp_path = tempfile.mkstemp()
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            return whisper.load_audio(temp_path)
+        finally:
+            os.unlink(temp_path)
+
+    return np.frombuffer(out, np.int16).flatten().astype(np.float32) / 32768.0
+
+
+def _load_cached_mel(path: str) -> Optional[np.ndarray]:
+    """A cached spectrogram, or None if it is missing or unreadable (the bad file is removed)"""
+    try:
+        mel = np.load(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, EOFError):
+        # Left truncated by an interrupted write from an older version; recompute it
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+    try:
+        os.utime(path)  # mark as recently used for eviction
+    except OSError:
+        pass
+    return mel
+
+
+def _save_cached_mel(path: str, mel: np.ndarray) -> None:
+    """Write a spectrogram to the cache atomically, so readers never see a partial file"""
+    try:
+        os.makedirs(MEL_CACHE_DIR, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=MEL_CACHE_DIR, suffix=".tmp")
+    except OSError:
+        return  # caching is best-effort
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, mel)
+        os.replace(temp_path, path)
+    except OSError:
+        # e.g. disk full; drop the partial file and carry on uncached
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+def _prune_mel_cache(max_bytes: int = MEL_CACHE_MAX_BYTES) -> None:
+    """Delete the least recently used spectrograms until the cache fits in max_bytes"""
+    try:
+        entries = [
+            (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+            for entry in os.scandir(MEL_CACHE_DIR)
+            if entry.name.endswith(".npy")
+        ]
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue  # removed concurrently by another session
+        total -= size
+
+
+def _needs_fallback(result: "whisper.DecodingResult") -> bool:
+    """True if transcribe() would have re-decoded this greedy result at a higher temperature"""
+    if result.no_speech_prob > NO_SPEECH_THRESHOLD and result.avg_logprob < LOGPROB_THRESHOLD:
+        return False  # silence, not a failed decode
+    return (
+        result.compression_ratio > COMPRESSION_RATIO_THRESHOLD
+        or result.avg_logprob < LOGPROB_THRESHOLD
+    )
+
+
+def _init_worker(model_size: str, num_threads: int) -> None:
+    """Load one CPU Whisper model per pool process, sharing the cores between workers"""
+    global _worker_model
+    torch.set_num_threads(num_threads)
+    _worker_model = whisper.load_model(model_size, device="cpu")
+
+
+def _worker_transcribe(audio: np.ndarray, language: Optional[str]) -> Optional[str]:
+    """Transcribe decoded samples in a pool worker"""
+    try:
+        return _worker_model.transcribe(audio, language=language, fp16=False)["text"].strip()
+    except Exception:
+        return None
+
+
+def _process_pool_size(model_size: str, held_gb: float = 0.0) -> int:
+    """Workers for CPU transcription: half the cores, capped by free RAM (plus held_gb) per model"""
+    cpu_workers = max(1, (os.cpu_count() or 2) // 2)
+    try:
+        free_gb = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / 1024**3
+    except (AttributeError, ValueError, OSError):
+        # No sysconf (e.g. Windows): don't risk loading extra models
+        return 1
+    return max(1, min(cpu_workers, int((free_gb + held_gb) // MODEL_RAM_GB.get(model_size, 2))))
+
 
 class WhisperTranscriber:
     def __init__(self, model_size: str = "base"):
@@ -16,29 +220,43 @@ class WhisperTranscriber:
         """
         self.model_size = model_size
         self.model = None
+        # Decode in half precision on GPU; Whisper only supports FP32 on CPU
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.fp16 = self.device == "cuda"
+        self._pool = None
+        self._pool_workers = 0
+        # The transcriber is shared across sessions; guards creating and resizing the pool
+        self._pool_lock = threading.Lock()
+        # Don't leave worker processes (and their models) behind when the app exits
+        atexit.register(self._shutdown_pool)
+
+    @property
+    def model_id(self) -> str:
+        """Backend and model that produce this transcriber's output"""
+        return f"openai-whisper/{self.model_size}"
 
     @st.cache_resource
     def _load_model(_self):
         """Load Whisper model (cached for performance)"""
         try:
-            return whisper.load_model(_self.model_size)
+            return whisper.load_model(_self.model_size, device=_self.device)
         except Exception as e:
             st.error(f"Failed to load Whisper model: {str(e)}")
             return None
 
-    def transcribe(self, audio_path: str, language: str = None) -> Optional[str]:
+    def transcribe(self, audio: AudioSource, language: str = None) -> Optional[str]:
         """
-        Transcribe audio file to text
+        Transcribe audio to text
 
         Args:
-            audio_path: Path to audio file
+            audio: Path to audio file, encoded audio bytes/stream, or decoded samples
             language: Language code (e.g., 'hi', 'en', 'te')
 
         Returns:
             Transcribed text or None if failed
         """
-        if not os.path.exists(audio_path):
-            st.error(f"Audio file not found: {audio_path}")
+        if isinstance(audio, str) and not os.path.exists(audio):
+            st.error(f"Audio file not found: {audio}")
             return None
 
         try:
@@ -49,27 +267,11 @@ class WhisperTranscriber:
             if self.model is None:
                 return None
 
-            # Map language codes to Whisper format
-            language_mapping = {
-                "hi": "hindi",
-                "te": "telugu",
-                "ta": "tamil",
-                "bn": "bengali",
-                "mr": "marathi",
-                "gu": "gujarati",
-                "kn": "kannada",
-                "ml": "malayalam",
-                "pa": "punjabi",
-                "en": "english",
-            }
-
-            whisper_language = language_mapping.get(language, "english")
-
             # Transcribe
             result = self.model.transcribe(
-                audio_path,
-                language=whisper_language if language != "auto" else None,
-                fp16=False,  # Better compatibility
+                audio if isinstance(audio, str) else load_audio(audio),
+                language=self._whisper_language(language),
+                fp16=self.fp16,
             )
 
             return result["text"].strip()
@@ -78,6 +280,164 @@ class WhisperTranscriber:
             st.error(f"Transcription failed: {str(e)}")
             return None
 
+    def transcribe_batch(
+        self,
+        audios: List[AudioSource],
+        language: str = None,
+        batch_size: int = 8,
+        cache_keys: Optional[List[str]] = None,
+    ) -> List[Optional[str]]:
+        """
+        Transcribe several audio files, decoding short clips as one batch
+
+        Clips that fit in Whisper's 30 second window are stacked into a single
+        mel-spectrogram batch so the encoder and decoder run once for all of
+        them. The batch is decoded greedily, so clips that fail transcribe()'s
+        compression-ratio or log-probability checks are re-run through it to get
+        its temperature fallback. Longer clips need sliding-window decoding; on
+        CPU they are spread over a pool of worker processes, otherwise they go
+        through transcribe().
+
+        Args:
+            audios: Audio file paths, encoded audio bytes/streams, or decoded samples
+            language: Language code (e.g., 'hi', 'en', 'te')
+            batch_size: Maximum clips decoded together, bounding GPU memory
+            cache_keys: Content hashes of the inputs; short clips' mel spectrograms
+                are cached on disk under these so retries skip feature extraction
+
+        Returns:
+            Transcribed text (or None if failed) for each input, in order
+        """
+        results: List[Optional[str]] = [None] * len(audios)
+
+        try:
+            if self.model is None:
+                self.model = self._load_model()
+
+            if self.model is None:
+                return results
+
+            batch_indices = []
+            batch_mels = []
+            # Samples of clips decoded here, so a fallback doesn't re-read a consumed stream
+            decoded_audios = {}
+            long_indices = []
+            long_audios = []
+            new_mels = False
+            for i, source in enumerate(audios):
+                if isinstance(source, str) and not os.path.exists(source):
+                    st.error(f"Audio file not found: {source}")
+                    continue
+
+                mel_path = self._mel_cache_path(cache_keys[i]) if cache_keys else None
+                cached_mel = _load_cached_mel(mel_path) if mel_path else None
+                if cached_mel is not None:
+                    mel = torch.from_numpy(cached_mel).to(self.model.device)
+                else:
+                    audio = load_audio(source)
+                    decoded_audios[i] = audio
+                    if len(audio) > whisper.audio.N_SAMPLES:
+                        long_indices.append(i)
+                        long_audios.append(audio)
+                        continue
+
+                    mel = whisper.log_mel_spectrogram(
+                        whisper.pad_or_trim(audio),
+                        n_mels=self.model.dims.n_mels,
+                        device=self.model.device,
+                    )
+                    if mel_path:
+                        _save_cached_mel(mel_path, mel.cpu().numpy())
+                        new_mels = True
+
+                batch_indices.append(i)
+                batch_mels.append(mel)
+
+            if new_mels:
+                _prune_mel_cache()
+
+            options = whisper.DecodingOptions(
+                language=self._whisper_language(language),
+                without_timestamps=True,
+                fp16=self.fp16,
+            )
+            for start in range(0, len(batch_mels), batch_size):
+                mel = torch.stack(batch_mels[start : start + batch_size])
+                decoded = whisper.decode(self.model, mel, options)
+                for i, result in zip(batch_indices[start : start + batch_size], decoded):
+                    if _needs_fallback(result):
+                        # Batched decoding is greedy only; let transcribe() retry with temperature fallback
+                        results[i] = self.transcribe(decoded_audios.get(i, audios[i]), language=language)
+                    else:
+                        results[i] = result.text.strip()
+
+            for i, text in zip(long_indices, self._transcribe_long(long_audios, language)):
+                results[i] = text
+
+        except Exception as e:
+            st.error(f"Batch transcription failed: {str(e)}")
+
+        return results
+
+    def _transcribe_long(
+        self, audios: List[np.ndarray], language: Optional[str]
+    ) -> List[Optional[str]]:
+        """Transcribe clips longer than one window, across CPU worker processes when possible"""
+        pool = self._cpu_pool() if self.device == "cpu" and len(audios) >= 2 else None
+        if pool is None:
+            return [self.transcribe(audio, language=language) for audio in audios]
+
+        whisper_language = self._whisper_language(language)
+        return list(pool.map(_worker_transcribe, audios, [whisper_language] * len(audios)))
+
+    def _cpu_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Worker pool sized to the RAM free right now, or None if it only fits one model"""
+        retired = None
+        with self._pool_lock:
+            # Our own workers' models would be freed by a resize, so count them as available
+            held_gb = self._pool_workers * MODEL_RAM_GB.get(self.model_size, 2)
+            workers = _process_pool_size(self.model_size, held_gb)
+            if self._pool is not None and workers < self._pool_workers:
+                # Memory got tighter since the pool was sized; retire it and replace it below
+                retired = self._pool
+                self._pool, self._pool_workers = None, 0
+            if workers >= 2 and self._pool is None:
+                # Spawn rather than fork: forked children inherit torch's thread pools
+                self._pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.model_size, max(1, (os.cpu_count() or 2) // workers)),
+                )
+                self._pool_workers = workers
+            pool = self._pool
+        if retired is not None:
+            # Outside the lock: let other sessions' batches finish, then reap the workers
+            retired.shutdown(wait=True)
+        return pool
+
+    def _shutdown_pool(self) -> None:
+        """Stop the worker pool at exit, dropping queued work where the Python version allows"""
+        with self._pool_lock:
+            pool, self._pool, self._pool_workers = self._pool, None, 0
+        if pool is None:
+            return
+        if sys.version_info >= (3, 9):
+            pool.shutdown(wait=False, cancel_futures=True)
+        else:
+            pool.shutdown(wait=False)
+
+    def _mel_cache_path(self, cache_key: str) -> str:
+        """On-disk location of a clip's cached mel spectrogram for this model's mel size"""
+        return os.path.join(MEL_CACHE_DIR, f"{cache_key}_{self.model.dims.n_mels}.f32.npy")
+
+    @staticmethod
+    def _whisper_language(language: Optional[str]) -> Optional[str]:
+        """Whisper language name for a language code (None to auto-detect)"""
+        if language == "auto":
+            return None
+        return LANGUAGE_MAPPING.get(language, "english")
+
     def get_supported_languages(self) -> dict:
         """Get supported languages"""
         return {
@@ -126,3 +486,95 @@ class WhisperTranscriber:
         except Exception as e:
             st.warning(f"Language detection failed: {str(e)}")
             return None
+
+
+class FasterWhisperTranscriber(WhisperTranscriber):
+    """WhisperTranscriber backed by faster-whisper's int8 CTranslate2 models"""
+
+    def __init__(self, model_size: str = "base"):
+        super().__init__(model_size)
+        # int8 weights on CPU; int8 weights with FP16 activations on GPU
+        self.compute_type = "int8_float16" if self.device == "cuda" else "int8"
+
+    @property
+    def model_id(self) -> str:
+        """Backend, model and quantization that produce this transcriber's output"""
+        return f"faster-whisper/{self.model_size}/{self.compute_type}"
+
+    @st.cache_resource
+    def _load_model(_self):
+        """Load the CTranslate2 Whisper model (cached for performance)"""
+        try:
+            return WhisperModel(
+                _self.model_size, device=_self.device, compute_type=_self.compute_type
+            )
+        except Exception as e:
+            st.error(f"Failed to load Whisper model: {str(e)}")
+            return None
+
+    def transcribe(self, audio: AudioSource, language: str = None) -> Optional[str]:
+        """Transcribe audio to text (same contract as WhisperTranscriber.transcribe)"""
+        if isinstance(audio, str) and not os.path.exists(audio):
+            st.error(f"Audio file not found: {audio}")
+            return None
+
+        try:
+            if self.model is None:
+                self.model = self._load_model()
+
+            if self.model is None:
+                return None
+
+            segments, _ = self.model.transcribe(
+                audio if isinstance(audio, str) else load_audio(audio),
+                language=self._language_code(language),
+                beam_size=1,
+                vad_filter=True,
+                condition_on_previous_text=False,
+            )
+            # Segments are generated lazily; joining them runs the decode
+            return " ".join(segment.text.strip() for segment in segments).strip()
+
+        except Exception as e:
+            st.error(f"Transcription failed: {str(e)}")
+            return None
+
+    def transcribe_batch(
+        self,
+        audios: List[AudioSource],
+        language: str = None,
+        batch_size: int = 8,
+        cache_keys: Optional[List[str]] = None,
+    ) -> List[Optional[str]]:
+        """Transcribe several clips; CTranslate2 already spreads each one over all cores"""
+        return [self.transcribe(audio, language=language) for audio in audios]
+
+    def detect_language(self, audio_path: str) -> Optional[str]:
+        """Detect language of audio file"""
+        try:
+            if self.model is None:
+                self.model = self._load_model()
+
+            if self.model is None:
+                return None
+
+            _, info = self.model.transcribe(audio_path, beam_size=1)
+            return info.language
+
+        except Exception as e:
+            st.warning(f"Language detection failed: {str(e)}")
+            return None
+
+    @staticmethod
+    def _language_code(language: Optional[str]) -> Optional[str]:
+        """faster-whisper language code for a language code (None to auto-detect)"""
+        if language == "auto":
+            return None
+        return language if language in LANGUAGE_MAPPING else "en"
+
+
+def create_transcriber(model_size: str = "base") -> WhisperTranscriber:
+    """The fastest available transcriber: faster-whisper when installed, else openai-whisper"""
+    if FASTER_WHISPER_AVAILABLE:
+        return FasterWhisperTranscriber(model_size)
+    return WhisperTranscriber(model_size)
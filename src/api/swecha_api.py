@@ -12,6 +12,7 @@ Documentation: https://api.corpus.swecha.org/docs
 import json
 import logging
 import os
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -479,9 +480,7 @@ class WhispNoteSwechaIntegration:
             pending_dir.mkdir(parents=True, exist_ok=True)
 
             # Store the data
-            import datetime
-
-            timestamp = datetime.datetime.now().isoformat()
+            timestamp = datetime.now().isoformat()
             filename = f"pending_{timestamp.replace(':', '-')}.json"
 
             data = {
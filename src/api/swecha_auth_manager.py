@@ -4,15 +4,72 @@ Swecha Authentication and Upload Manager
 Handles user authentication and file uploads to Swecha API
 """
 
+import io
 import math
+import mimetypes
 import os
+import tempfile
 import uuid
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
 import requests
 import streamlit as st
 
 
+# PCM WAV subtypes FLAC stores losslessly at the same depth
+_FLAC_SUBTYPES = frozenset({"PCM_S8", "PCM_U8", "PCM_16", "PCM_24"})
+
+
+def encode_audio_for_upload(audio_file_path: str) -> Tuple[BinaryIO, int, str, str]:
+    """
+    Open an audio file for upload, re-encoding PCM WAV as lossless FLAC
+
+    Args:
+        audio_file_path: Path to audio file
+
+    Returns:
+        Tuple of (readable stream, size in bytes, file extension, MIME type);
+        the caller closes the stream
+    """
+    try:
+        # Imported here so app startup doesn't pay for numpy + libsndfile
+        import soundfile as sf
+    except (ImportError, OSError):
+        sf = None
+
+    original_size = os.path.getsize(audio_file_path)
+    if sf is not None:
+        try:
+            info = sf.info(audio_file_path)
+        except Exception:
+            info = None  # Format libsndfile can't decode (e.g. m4a); upload as-is
+
+        # Compressed inputs (mp3, ogg) would only grow as FLAC, and float WAV doesn't fit it
+        if info is not None and info.format == "WAV" and info.subtype in _FLAC_SUBTYPES:
+            encoded = tempfile.TemporaryFile()
+            try:
+                subtype = "PCM_S8" if info.subtype == "PCM_U8" else info.subtype
+                with sf.SoundFile(audio_file_path) as src, sf.SoundFile(
+                    encoded, "w", info.samplerate, info.channels, subtype, format="FLAC", closefd=False
+                ) as dst:
+                    # Stream in blocks; int32 keeps every sample bit of 8-24-bit PCM
+                    for block in src.blocks(blocksize=65536, dtype="int32"):
+                        dst.write(block)
+                # libsndfile rewrites the FLAC header on close, so measure from the end
+                size = encoded.seek(0, os.SEEK_END)
+                if size < original_size:
+                    encoded.seek(0)
+                    return encoded, size, "flac", "audio/flac"
+            except Exception:
+                pass  # Upload the original file instead
+            encoded.close()
+
+    # Stream the original file from disk rather than reading it into memory
+    extension = os.path.splitext(audio_file_path)[1].lstrip(".").lower() or "wav"
+    mime_type = mimetypes.guess_type(audio_file_path)[0] or "audio/wav"
+    return open(audio_file_path, 'rb'), original_size, extension, mime_type
+
+
 class SwechaAuthManager:
     """Manages authentication with Swecha API"""
 
@@ -160,12 +217,31 @@ class SwechaUploadManager:
             filename: Name of the file
             file_type: MIME type of the file
 
+        Returns:
+            True if upload successful, False otherwise
+        """
+        return self.upload_stream_in_chunks(
+            token, upload_uuid, io.BytesIO(file_content), len(file_content), filename, file_type
+        )
+
+    def upload_stream_in_chunks(self, token: str, upload_uuid: str, stream: BinaryIO,
+                                file_size: int, filename: str, file_type: str) -> bool:
+        """
+        Upload a readable stream in chunks, holding one chunk in memory at a time
+
+        Args:
+            token: Bearer token for authentication
+            upload_uuid: Unique identifier for the upload
+            stream: Binary stream positioned at the start of the content
+            file_size: Total size of the content in bytes
+            filename: Name of the file
+            file_type: MIME type of the file
+
         Returns:
             True if upload successful, False otherwise
         """
         try:
             headers = {"Authorization": f"Bearer {token}"}
-            file_size = len(file_content)
             total_chunks = math.ceil(file_size / self.chunk_size)
 
             st.info(f"Uploading '{filename}' ({file_size / (1024*1024):.2f} MB) in {total_chunks} chunk(s)...")
@@ -173,9 +249,7 @@ class SwechaUploadManager:
 
             for i in range(total_chunks):
                 # Get chunk data
-                start = i * self.chunk_size
-                end = start + self.chunk_size
-                chunk_data = file_content[start:end]
+                chunk_data = stream.read(self.chunk_size)
 
                 # Prepare chunk upload
                 files = {'chunk': (filename, chunk_data, file_type)}
@@ -477,15 +551,15 @@ class SwechaIntegrationManager:
 
                         # If we have audio file, upload it
                         if audio_file_path and os.path.exists(audio_file_path):
-                            with open(audio_file_path, 'rb') as f:
-                                audio_content = f.read()
+                            audio_stream, audio_size, audio_ext, audio_type = encode_audio_for_upload(audio_file_path)
 
                             audio_uuid = str(uuid.uuid4())
-                            audio_filename = f"voice_note_{audio_uuid}.wav"
+                            audio_filename = f"voice_note_{audio_uuid}.{audio_ext}"
 
-                            upload_success = self.upload_manager.upload_file_in_chunks(
-                                token, audio_uuid, audio_content, audio_filename, "audio/wav"
-                            )
+                            with audio_stream:
+                                upload_success = self.upload_manager.upload_stream_in_chunks(
+                                    token, audio_uuid, audio_stream, audio_size, audio_filename, audio_type
+                                )
 
                             if upload_success:
                                 # Update record for audio
@@ -494,7 +568,7 @@ class SwechaIntegrationManager:
                                     "upload_uuid": audio_uuid,
                                     "filename": audio_filename,
                                     "media_type": "audio",
-                                    "total_chunks": math.ceil(len(audio_content) / self.upload_manager.chunk_size)
+                                    "total_chunks": math.ceil(audio_size / self.upload_manager.chunk_size)
                                 })
 
                                 final_response = self.upload_manager.finalize_record(token, audio_record_data)
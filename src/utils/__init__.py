@@ -4,4 +4,5 @@ Utility Modules for WhispNote.
 This package contains utility functions and classes:
 - storage: Local data persistence and management
 - export_utils: Export functionality for various formats
+- lazy: Proxy that defers building expensive objects until first use
 """
@@ -1,9 +1,10 @@
 # export_utils.py
 import datetime
+import io
 import json
+import os
 import tempfile
 import zipfile
-from pathlib import Path
 from typing import Dict, List
 
 import streamlit as st
@@ -108,57 +109,36 @@ class ExportUtils:
             ZIP archive as bytes
         """
         try:
-            # Create temporary directory
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Export individual notes in each format
-                for i, note in enumerate(notes):
-                    note_id = note.get("id", f"note_{i}")[:8]
-                    timestamp = note.get("timestamp", "")[:10]
-
-                    for fmt in formats:
-                        try:
-                            content = self.export_note(note, fmt)
-                            filename = f"{timestamp}_{note_id}.{fmt}"
-
-                            with open(temp_path / filename, "w", encoding="utf-8") as f:
-                                f.write(content)
-                        except Exception as e:
-                            st.warning(
-                                f"Failed to export note {note_id} as {fmt}: {str(e)}"
-                            )
-
-                # Create combined exports
+            # Collect archive members in memory (later entries replace same-named ones)
+            members: Dict[str, str] = {}
+
+            # Export individual notes in each format
+            for i, note in enumerate(notes):
+                note_id = note.get("id", f"note_{i}")[:8]
+                timestamp = note.get("timestamp", "")[:10]
+
                 for fmt in formats:
                     try:
-                        combined_content = self.export_multiple_notes(notes, fmt)
-                        combined_filename = f"all_notes.{fmt}"
-
-                        with open(
-                            temp_path / combined_filename, "w", encoding="utf-8"
-                        ) as f:
-                            f.write(combined_content)
+                        members[f"{timestamp}_{note_id}.{fmt}"] = self.export_note(note, fmt)
                     except Exception as e:
-                        st.warning(f"Failed to create combined {fmt} export: {str(e)}")
+                        st.warning(
+                            f"Failed to export note {note_id} as {fmt}: {str(e)}"
+                        )
 
-                # Create ZIP archive
-                zip_buffer = tempfile.NamedTemporaryFile(delete=False)
-                with zipfile.ZipFile(
-                    zip_buffer.name, "w", zipfile.ZIP_DEFLATED
-                ) as zip_file:
-                    for file_path in temp_path.rglob("*"):
-                        if file_path.is_file():
-                            zip_file.write(file_path, file_path.name)
+            # Create combined exports
+            for fmt in formats:
+                try:
+                    members[f"all_notes.{fmt}"] = self.export_multiple_notes(notes, fmt)
+                except Exception as e:
+                    st.warning(f"Failed to create combined {fmt} export: {str(e)}")
 
-                # Read ZIP content
-                with open(zip_buffer.name, "rb") as f:
-                    zip_content = f.read()
+            # Build the ZIP archive in memory
+            zip_buffer = io.BytesIO()
+            with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                for filename, content in members.items():
+                    zip_file.writestr(filename, content)
 
-                # Cleanup
-                Path(zip_buffer.name).unlink()
-
-                return zip_content
+            return zip_buffer.getvalue()
 
         except Exception as e:
             st.error(f"Archive creation failed: {str(e)}")
@@ -205,7 +185,7 @@ class ExportUtils:
             if note_data.get("tags"):
                 md_content.append("## Tags\n")
                 tags = note_data.get("tags", [])
-                md_content.append(" ".join([f"#{tag}" for tag in tags]))
+                md_content.append(" ".join(map("#{}".format, tags)))
                 md_content.append("")
 
             return "\n".join(md_content)
@@ -335,11 +315,11 @@ class ExportUtils:
             if note_data.get("tags"):
                 doc.add_heading("Tags", level=1)
                 tags = note_data.get("tags", [])
-                doc.add_paragraph(" ".join([f"#{tag}" for tag in tags]))
+                doc.add_paragraph(" ".join(map("#{}".format, tags)))
 
-            # Save to temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".docx")
-            doc.save(temp_file.name)
+            # Save to temporary file (closed on exit; the caller owns the path)
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as temp_file:
+                doc.save(temp_file)
 
             return temp_file.name
 
@@ -352,11 +332,12 @@ class ExportUtils:
             return "PDF export not available"
 
         try:
-            # Create temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
+            # Create temporary file (closed on exit; the caller owns the path)
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
+                pdf_path = temp_file.name
 
             # Create PDF document
-            doc = SimpleDocTemplate(temp_file.name, pagesize=A4)
+            doc = SimpleDocTemplate(pdf_path, pagesize=A4)
             styles = getSampleStyleSheet()
             story = []
 
@@ -406,13 +387,17 @@ class ExportUtils:
                 story.append(Paragraph("Tags", styles["Heading1"]))
                 tags = note_data.get("tags", [])
                 story.append(
-                    Paragraph(" ".join([f"#{tag}" for tag in tags]), styles["Normal"])
+                    Paragraph(" ".join(map("#{}".format, tags)), styles["Normal"])
                 )
 
             # Build PDF
-            doc.build(story)
+            try:
+                doc.build(story)
+            except Exception:
+                os.unlink(pdf_path)
+                raise
 
-            return temp_file.name
+            return pdf_path
 
         except Exception as e:
             return f"PDF export error: {str(e)}"
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Lazy object proxy for WhispNote
+Defers building expensive objects until they are first used
+"""
+
+import threading
+from typing import Any, Callable, Optional
+
+
+class Lazy:
+    """Proxy that builds its target on first use; falsy if the target can't be built"""
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        self._factory = factory
+        self._obj = None
+        self._error: Optional[Exception] = None
+        self._built = False
+        self._lock = threading.Lock()
+
+    def _get(self) -> Any:
+        """Build the target once (None if the factory raised)"""
+        if not self._built:
+            # Cached proxies are shared across sessions, so build the target only once
+            with self._lock:
+                if not self._built:
+                    try:
+                        self._obj = self._factory()
+                    except Exception as e:
+                        # Remember the failure rather than retrying on every access
+                        self._error = e
+                    self._built = True
+        return self._obj
+
+    @property
+    def error(self) -> Optional[Exception]:
+        """Why the target couldn't be built, if it couldn't"""
+        self._get()
+        return self._error
+
+    def __bool__(self) -> bool:
+        # Lets callers keep writing `if processor:` for their fallback paths
+        return self._get() is not None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the proxy itself
+        obj = self._get()
+        if obj is None:
+            raise RuntimeError(f"{getattr(self._factory, '__name__', 'object')} is unavailable: {self._error}")
+        return getattr(obj, name)
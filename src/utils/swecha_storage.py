@@ -7,13 +7,44 @@ Includes local storage fallback for users not authenticated with Swecha
 
 import json
 import os
+import sqlite3
+import time
 import uuid
+from contextlib import closing
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 import streamlit as st
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dump_note(note_data: Dict[str, Any]) -> str:
+    """Serialize a note for the local database"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(note_data, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+    return json.dumps(note_data, ensure_ascii=False)
+
+
+_load_note = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _search_text(note_data: Dict[str, Any]) -> str:
+    """Lowercased transcription, language and tags, as the notes search box matches them"""
+    return " ".join(
+        (
+            note_data.get("transcription") or "",
+            note_data.get("language") or "",
+            *(note_data.get("tags") or ()),
+        )
+    ).lower()
+
 
 class SwechaStorageManager:
     """Storage manager that uses Swecha API with local storage fallback"""
@@ -49,6 +80,7 @@ class SwechaStorageManager:
 
         self.local_storage_dir = "whispnote_data/notes"
         self._ensure_local_storage_dir()
+        self._init_local_db()
 
     def _get_auth_headers(self) -> Optional[Dict[str, str]]:
         """Get authentication headers from session state"""
@@ -67,36 +99,225 @@ class SwechaStorageManager:
             os.makedirs(self.local_storage_dir, exist_ok=True)
 
     def _get_local_notes_file(self) -> str:
-        """Get path to local notes file"""
-        return os.path.join(self.local_storage_dir, "local_notes.json")
+        """Get path to local notes database"""
+        return os.path.join(self.local_storage_dir, "local_notes.db")
+
+    @property
+    def notes_path(self) -> str:
+        """Path to the local notes database"""
+        return self._get_local_notes_file()
+
+    @property
+    def notes_mtime(self) -> float:
+        """Last local write time (WAL commits touch the -wal file, not the database)"""
+        notes_file = self._get_local_notes_file()
+        return max(
+            (os.path.getmtime(path) for path in (notes_file, f"{notes_file}-wal") if os.path.exists(path)),
+            default=0.0,
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the local notes database"""
+        conn = sqlite3.connect(self._get_local_notes_file())
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _init_local_db(self) -> None:
+        """Create the local notes tables and import notes from the old JSON file"""
+        self.fts_enabled = True
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS notes ("
+                    "id TEXT PRIMARY KEY, timestamp TEXT, language TEXT, data TEXT NOT NULL, "
+                    "audio_hash TEXT)"
+                )
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(notes)")}
+                if "audio_hash" not in columns:
+                    conn.execute("ALTER TABLE notes ADD COLUMN audio_hash TEXT")
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS notes_audio_hash ON notes (audio_hash)"
+                )
+                # Transcriptions by audio hash for every saved note, including Swecha-backed ones
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS audio_transcriptions ("
+                    "audio_hash TEXT NOT NULL, language_code TEXT NOT NULL, transcription TEXT NOT NULL, "
+                    "PRIMARY KEY (audio_hash, language_code))"
+                )
+                schema_version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if schema_version < 2:
+                    # Version 2 indexes trigrams so search keeps substring matching
+                    conn.execute("DROP TABLE IF EXISTS notes_fts")
+                try:
+                    conn.execute(
+                        "CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5("
+                        "id UNINDEXED, content, tokenize='trigram')"
+                    )
+                except sqlite3.OperationalError:
+                    # SQLite without FTS5 (or older than 3.34) - search falls back to LIKE
+                    self.fts_enabled = False
+                if self.fts_enabled and schema_version < 2:
+                    for (data,) in conn.execute("SELECT data FROM notes").fetchall():
+                        self._upsert_note(conn, _load_note(data))
+                    conn.execute("PRAGMA user_version = 2")
+
+                legacy_file = os.path.join(self.local_storage_dir, "local_notes.json")
+                if os.path.exists(legacy_file):
+                    with open(legacy_file, encoding="utf-8") as f:
+                        for note in json.load(f):
+                            self._upsert_note(conn, note)
+                    os.replace(legacy_file, f"{legacy_file}.migrated")
+        except Exception as e:
+            st.warning(f"Could not initialize local notes database: {str(e)}")
+
+    def _upsert_note(self, conn: sqlite3.Connection, note_data: Dict[str, Any]) -> None:
+        """Insert or update a note row and its search index entry"""
+        note_id = note_data.setdefault("id", str(uuid.uuid4()))
+        conn.execute(
+            "INSERT INTO notes (id, timestamp, language, data, audio_hash) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET timestamp = excluded.timestamp, "
+            "language = excluded.language, data = excluded.data, "
+            "audio_hash = excluded.audio_hash",
+            (
+                note_id,
+                note_data.get("timestamp"),
+                note_data.get("language"),
+                _dump_note(note_data),
+                note_data.get("audio_hash"),
+            ),
+        )
+        if self.fts_enabled:
+            conn.execute("DELETE FROM notes_fts WHERE id = ?", (note_id,))
+            conn.execute(
+                "INSERT INTO notes_fts (id, content) VALUES (?, ?)",
+                (note_id, _search_text(note_data)),
+            )
 
     def _load_local_notes(self) -> List[Dict[str, Any]]:
-        """Load notes from local storage"""
+        """Load notes from local storage, oldest first"""
         try:
-            notes_file = self._get_local_notes_file()
-            if os.path.exists(notes_file):
-                with open(notes_file, encoding="utf-8") as f:
-                    return json.load(f)
+            with closing(self._connect()) as conn:
+                # Decode while the cursor steps through rows instead of holding every raw row first
+                return [_load_note(data) for (data,) in conn.execute("SELECT data FROM notes ORDER BY rowid")]
         except Exception as e:
             st.warning(f"Could not load local notes: {str(e)}")
         return []
 
-    def _save_local_notes(self, notes: List[Dict[str, Any]]) -> bool:
-        """Save notes to local storage"""
+    def _save_note_locally(self, note_data: Dict[str, Any]) -> bool:
+        """Save (or update) a single note in local storage"""
+        try:
+            with closing(self._connect()) as conn, conn:
+                self._upsert_note(conn, note_data)
+            return True
+        except Exception as e:
+            st.error(f"Could not save to local storage: {str(e)}")
+            return False
+
+    def _save_notes_locally(self, notes: List[Dict[str, Any]]) -> bool:
+        """Save (or update) several notes in local storage in one transaction"""
         try:
-            notes_file = self._get_local_notes_file()
-            with open(notes_file, "w", encoding="utf-8") as f:
-                json.dump(notes, f, indent=2, ensure_ascii=False)
+            with closing(self._connect()) as conn, conn:
+                for note_data in notes:
+                    self._upsert_note(conn, note_data)
             return True
         except Exception as e:
             st.error(f"Could not save to local storage: {str(e)}")
             return False
 
-    def _save_note_locally(self, note_data: Dict[str, Any]) -> bool:
-        """Save a single note to local storage"""
-        notes = self._load_local_notes()
-        notes.append(note_data)
-        return self._save_local_notes(notes)
+    def _delete_note_locally(self, note_id: str) -> bool:
+        """Delete a note from local storage, returning whether it existed"""
+        with closing(self._connect()) as conn, conn:
+            deleted = conn.execute("DELETE FROM notes WHERE id = ?", (note_id,)).rowcount
+            if self.fts_enabled:
+                conn.execute("DELETE FROM notes_fts WHERE id = ?", (note_id,))
+        return deleted > 0
+
+    def _remember_audio_transcription(self, note_data: Dict[str, Any]) -> None:
+        """Record a saved note's raw transcription under its audio hash, whichever backend holds the note"""
+        audio_hash = note_data.get("audio_hash")
+        transcription = note_data.get("original_transcription") or note_data.get("transcription")
+        if not audio_hash or not transcription:
+            return
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO audio_transcriptions (audio_hash, language_code, transcription) "
+                    "VALUES (?, ?, ?)",
+                    (audio_hash, note_data.get("language_code", ""), transcription),
+                )
+        except Exception as e:
+            st.warning(f"Could not record audio transcription: {str(e)}")
+
+    def find_note_by_audio_hash(
+        self, audio_hash: str, language_code: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Most recent saved note (or its recorded transcription) for the given audio content hash"""
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT language_code, transcription FROM audio_transcriptions "
+                    "WHERE audio_hash = ? AND (? IS NULL OR language_code = ?) "
+                    "ORDER BY rowid DESC LIMIT 1",
+                    (audio_hash, language_code, language_code),
+                ).fetchone()
+                if row:
+                    return {
+                        "audio_hash": audio_hash,
+                        "language_code": row[0],
+                        "original_transcription": row[1],
+                    }
+                # Local notes saved before transcriptions were recorded separately
+                for (data,) in conn.execute(
+                    "SELECT data FROM notes WHERE audio_hash = ? ORDER BY rowid DESC",
+                    (audio_hash,),
+                ):
+                    note = _load_note(data)
+                    if language_code is None or note.get("language_code") == language_code:
+                        return note
+            return None
+        except Exception as e:
+            st.warning(f"Could not look up local notes: {str(e)}")
+            return None
+
+    def search_local_notes(
+        self, query: str, language: Optional[str] = None, limit: int = 50, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Search local notes by transcription, language and tags, newest first
+
+        Args:
+            query: Search text, matched case-insensitively anywhere in those fields
+            language: Only return notes in this language
+            limit: Maximum number of notes to return
+            offset: Number of matching notes to skip, for pagination
+
+        Returns:
+            List of matching note dictionaries
+        """
+        # Substring match; the trigram index serves LIKE patterns of three or more characters
+        query = query.lower()
+        like = "LIKE ?"
+        if any(char in query for char in "\\%_"):
+            # FTS5 skips its index for LIKE ... ESCAPE, so only pay for it when needed
+            query = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            like = "LIKE ? ESCAPE '\\'"
+        phrase = f"%{query}%"
+        if self.fts_enabled:
+            match_clause = f"id IN (SELECT id FROM notes_fts WHERE content {like})"
+        else:
+            match_clause = f"lower(data) {like}"
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    f"SELECT data FROM notes WHERE {match_clause} "
+                    "AND (? IS NULL OR language = ?) "
+                    "ORDER BY timestamp DESC LIMIT ? OFFSET ?",
+                    (phrase, language, language, limit, offset),
+                ).fetchall()
+            return [_load_note(data) for (data,) in rows]
+        except Exception as e:
+            st.warning(f"Could not search local notes: {str(e)}")
+            return []
 
     def _ensure_authenticated(self) -> bool:
         """Check if user is authenticated with Swecha (but don't require it)"""
@@ -112,6 +333,9 @@ class SwechaStorageManager:
         Returns:
             True if successful, False otherwise
         """
+        # Swecha records don't carry the audio hash, so keep it locally for transcription reuse
+        self._remember_audio_transcription(note_data)
+
         # Try Swecha API first if authenticated
         if st.session_state.get("swecha_logged_in", False):
             try:
@@ -135,6 +359,7 @@ class SwechaStorageManager:
             headers = self._get_auth_headers()
             if not headers:
                 return False
+            token = st.session_state.get("swecha_token")
 
             # Get user data
             user_data = st.session_state.get("swecha_user_data", {})
@@ -144,72 +369,95 @@ class SwechaStorageManager:
                 st.error("User ID not found in session")
                 return False
 
-            # Get categories to find default category
-            categories_response = self.session.get(
-                f"{self.base_url}/categories/", headers=headers
-            )
-            categories_response.raise_for_status()
-            categories = categories_response.json()
-
             # Use first available category as default
-            category_id = categories[0]["id"] if categories else None
+            category_id = self.get_default_category_id(token)
             if not category_id:
                 st.error("No categories available")
                 return False
 
-            # Map language to Swecha enum
-            language_map = {
-                "hi": "hindi",
-                "te": "telugu",
-                "ta": "tamil",
-                "bn": "bengali",
-                "mr": "marathi",
-                "gu": "gujarati",
-                "kn": "kannada",
-                "ml": "malayalam",
-                "pa": "punjabi",
-                "en": "hindi",  # Default English to Hindi for now
-            }
-            language_code = note_data.get("language_code", "te")
-            swecha_language = language_map.get(language_code, "telugu")
-
-            # Create record using the correct API structure
-            record_data = {
-                "title": f"WhispNote - {note_data.get('language', 'Unknown')} ({datetime.now().strftime('%Y-%m-%d %H:%M')})",
-                "description": f"Voice note transcription\n\nContent: {note_data.get('transcription', '')[:200]}...",
-                "media_type": "text",
-                "user_id": user_id,
-                "category_id": category_id,
-                "release_rights": "creator",
-                "language": swecha_language,
-                "file_name": f"whispnote_{note_data.get('id', uuid.uuid4())}.json",
-                "file_size": len(json.dumps(note_data).encode("utf-8")),
-                "status": "pending",
-            }
-
-            # Create the record
-            response = self.session.post(
-                f"{self.base_url}/records/", headers=headers, json=record_data
-            )
-            response.raise_for_status()
-
-            # Store the Swecha record info in session for tracking
-            swecha_response = response.json()
-            if "swecha_notes" not in st.session_state:
-                st.session_state.swecha_notes = {}
-
-            st.session_state.swecha_notes[note_data["id"]] = {
-                "swecha_uid": swecha_response.get("uid"),
-                "note_data": note_data,
-                "saved_at": datetime.now().isoformat(),
-            }
-
+            swecha_response = self.create_note_record(note_data, token, user_id, category_id)
+            self.track_swecha_note(note_data, swecha_response)
             return True
 
         except Exception as e:
             st.error(f"Failed to save note to Swecha: {str(e)}")
             return False
 
+    def get_default_category_id(self, token: str) -> Optional[str]:
+        """First Swecha category, used as the default for uploaded notes"""
+        categories_response = self.session.get(
+            f"{self.base_url}/categories/", headers={"Authorization": f"Bearer {token}"}
+        )
+        categories_response.raise_for_status()
+        categories = categories_response.json()
+        return categories[0]["id"] if categories else None
+
+    def create_note_record(
+        self, note_data: Dict[str, Any], token: str, user_id: str, category_id: str
+    ) -> Dict[str, Any]:
+        """
+        Create a Swecha record for a note
+
+        Takes the login explicitly and never touches Streamlit, so it is safe
+        to call from worker threads. Errors are raised for the caller to report.
+
+        Args:
+            note_data: Dictionary containing note information
+            token: Swecha access token
+            user_id: Swecha user id the record belongs to
+            category_id: Swecha category for the record
+
+        Returns:
+            The created record as returned by the API
+        """
+        # Map language to Swecha enum
+        language_map = {
+            "hi": "hindi",
+            "te": "telugu",
+            "ta": "tamil",
+            "bn": "bengali",
+            "mr": "marathi",
+            "gu": "gujarati",
+            "kn": "kannada",
+            "ml": "malayalam",
+            "pa": "punjabi",
+            "en": "hindi",  # Default English to Hindi for now
+        }
+        language_code = note_data.get("language_code", "te")
+        swecha_language = language_map.get(language_code, "telugu")
+
+        # Create record using the correct API structure
+        record_data = {
+            "title": f"WhispNote - {note_data.get('language', 'Unknown')} ({datetime.now().strftime('%Y-%m-%d %H:%M')})",
+            "description": f"Voice note transcription\n\nContent: {note_data.get('transcription', '')[:200]}...",
+            "media_type": "text",
+            "user_id": user_id,
+            "category_id": category_id,
+            "release_rights": "creator",
+            "language": swecha_language,
+            "file_name": f"whispnote_{note_data.get('id', uuid.uuid4())}.json",
+            "file_size": len(json.dumps(note_data).encode("utf-8")),
+            "status": "pending",
+        }
+
+        # Create the record
+        response = self.session.post(
+            f"{self.base_url}/records/", headers={"Authorization": f"Bearer {token}"}, json=record_data
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def track_swecha_note(self, note_data: Dict[str, Any], swecha_response: Dict[str, Any]) -> None:
+        """Store the Swecha record info in session for tracking"""
+        if "swecha_notes" not in st.session_state:
+            st.session_state.swecha_notes = {}
+
+        st.session_state.swecha_notes[note_data["id"]] = {
+            "swecha_uid": swecha_response.get("uid"),
+            "note_data": note_data,
+            "saved_at": datetime.now().isoformat(),
+        }
+
     def load_notes(self) -> List[Dict[str, Any]]:
         """
         Load all notes from Swecha API with local storage fallback
@@ -217,12 +465,21 @@ class SwechaStorageManager:
         Returns:
             List of note dictionaries
         """
+        return self.load_notes_with_source()[1]
+
+    def load_notes_with_source(self) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Load all notes like load_notes(), along with where they came from
+
+        Returns:
+            Tuple of ("swecha" or "local", list of note dictionaries)
+        """
         # Try Swecha API first if authenticated
         if st.session_state.get("swecha_logged_in", False):
             try:
                 swecha_notes = self._load_notes_from_swecha()
                 if swecha_notes:
-                    return swecha_notes
+                    return "swecha", swecha_notes
             except Exception as e:
                 st.warning(f"Could not load from Swecha API: {str(e)}")
 
@@ -230,7 +487,7 @@ class SwechaStorageManager:
         local_notes = self._load_local_notes()
         if local_notes:
             st.info("📁 Showing notes from local storage")
-        return local_notes
+        return "local", local_notes
 
     def _load_notes_from_swecha(self) -> List[Dict[str, Any]]:
         """Load notes from Swecha API (original implementation)"""
@@ -257,6 +514,8 @@ class SwechaStorageManager:
 
             contributions = response.json()
             notes = []
+            # Fallback timestamp for records without one, taken once for the whole batch
+            loaded_at = datetime.now().isoformat()
 
             # Extract notes from text contributions (where we store WhispNote data)
             text_contributions = contributions.get("text_contributions", [])
@@ -271,10 +530,8 @@ class SwechaStorageManager:
                         # Try to reconstruct note data from the description
                         # Since we store the transcription in description
                         note_data = {
-                            "id": contribution.get("id", str(uuid.uuid4())),
-                            "timestamp": contribution.get(
-                                "timestamp", datetime.now().isoformat()
-                            ),
+                            "id": contribution["id"] if "id" in contribution else str(uuid.uuid4()),
+                            "timestamp": contribution.get("timestamp", loaded_at),
                             "language": "Unknown",
                             "language_code": "te",  # Default
                             "transcription": (
@@ -300,7 +557,7 @@ class SwechaStorageManager:
                     note["id"]: {
                         "swecha_uid": note.get("swecha_uid"),
                         "note_data": note,
-                        "loaded_at": datetime.now().isoformat(),
+                        "loaded_at": loaded_at,
                     }
                     for note in notes
                 }
@@ -336,21 +593,8 @@ class SwechaStorageManager:
                 self.delete_note(note_id)
                 return self.save_note(note_data)
 
-            # For local storage, update the note in place
-            notes = self._load_local_notes()
-            updated = False
-
-            for i, note in enumerate(notes):
-                if note.get("id") == note_id:
-                    notes[i] = note_data
-                    updated = True
-                    break
-
-            if updated:
-                return self._save_local_notes(notes)
-            else:
-                # Note not found, add as new
-                return self._save_note_locally(note_data)
+            # For local storage, update the note in place (or add it if missing)
+            return self._save_note_locally(note_data)
 
         except Exception as e:
             st.error(f"Failed to update note: {str(e)}")
@@ -377,14 +621,9 @@ class SwechaStorageManager:
                 return True
 
             # For local storage, actually delete the note
-            notes = self._load_local_notes()
-            updated_notes = [note for note in notes if note.get("id") != note_id]
-
-            if len(updated_notes) < len(notes):
-                success = self._save_local_notes(updated_notes)
-                if success:
-                    st.success("Note deleted from local storage")
-                return success
+            if self._delete_note_locally(note_id):
+                st.success("Note deleted from local storage")
+                return True
             else:
                 st.warning("Note not found")
                 return False
@@ -687,8 +926,6 @@ class SwechaStorageManager:
 
                 if task_id:
                     # Poll for task completion (simplified version)
-                    import time
-
                     for _ in range(10):  # Check up to 10 times
                         time.sleep(2)  # Wait 2 seconds between checks
 
@@ -7,6 +7,8 @@ Handles cleaning, formatting, and enhancing transcribed text
 import re
 from typing import Any, Dict, List, Tuple
 
+from src.utils.lazy import Lazy
+
 
 class TranscriptionProcessor:
     """Processes and cleans transcribed text from speech-to-text"""
@@ -77,7 +79,8 @@ class TranscriptionProcessor:
         try:
             from src.ai.llama_summarizer import AdvancedAISummarizer
 
-            self.ai_processor = AdvancedAISummarizer()
+            # Built on first AI cleaning request, not for traditional NLP runs
+            self.ai_processor = Lazy(AdvancedAISummarizer)
         except ImportError:
             print(
                 "LLaMA AI processor not available - using traditional NLP methods only"
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for the formatting helpers in app.py
+"""
+
+import pytest
+
+pytest.importorskip("streamlit")
+
+import app  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "size, expected",
+    [
+        (0, "0 bytes"),
+        (1024, "1024 bytes"),
+        (1024.5, "1.0 KB"),
+        (1025, "1.0 KB"),
+        (1536, "1.5 KB"),
+        (1024**2, "1024.0 KB"),
+        (1024**2 + 1, "1.0 MB"),
+        (5 * 1024**3, "5.0 GB"),
+        (3 * 1024**4, "3072.0 GB"),
+        (2048.0, "2.0 KB"),
+        (512.7, "512.7 bytes"),
+    ],
+)
+def test_format_size(size, expected):
+    assert app._format_size(size) == expected
+
+
+@pytest.mark.parametrize(
+    "timestamp, expected",
+    [
+        ("2025-08-28T15:35:16.123456", "2025-08-28 15:35"),
+        ("2025-08-28T15:35", "2025-08-28 15:35"),
+        ("2025-08-28", "Recently"),
+        ("", "Recently"),
+        (None, "Recently"),
+    ],
+)
+def test_format_timestamp(timestamp, expected):
+    assert app._format_timestamp(timestamp) == expected
+
+
+@pytest.mark.parametrize(
+    "text, limit, expected",
+    [
+        ("", 10, False),
+        ("one two three", 3, False),
+        ("one two three four", 3, True),
+        ("  spaced\tout\nwords  ", 2, True),
+        ("ఇది ఒక టెస్ట్ వాక్యం", 4, False),
+        (" ".join(["word"] * 11), 10, True),
+    ],
+)
+def test_has_more_words(text, limit, expected):
+    assert app._has_more_words(text, limit) is expected
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the audio encode/decode helpers used for uploads and transcription
+"""
+
+import io
+
+import pytest
+
+np = pytest.importorskip("numpy")
+sf = pytest.importorskip("soundfile")
+
+
+def _sine(sample_rate, seconds=1.0, channels=1):
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    wave = 0.5 * np.sin(2 * np.pi * 440 * t)
+    return np.repeat(wave[:, None], channels, axis=1) if channels > 1 else wave
+
+
+class TestEncodeAudioForUpload:
+    @pytest.fixture(autouse=True)
+    def _imports(self):
+        pytest.importorskip("streamlit")
+        pytest.importorskip("requests")
+        from src.api.swecha_auth_manager import encode_audio_for_upload
+
+        self.encode = encode_audio_for_upload
+
+    @pytest.mark.parametrize("subtype", ["PCM_16", "PCM_24"])
+    def test_pcm_wav_becomes_lossless_flac(self, tmp_path, subtype):
+        path = str(tmp_path / "note.wav")
+        sf.write(path, _sine(16000, channels=2), 16000, subtype=subtype)
+
+        stream, size, extension, mime_type = self.encode(path)
+        with stream:
+            data = stream.read()
+
+        assert (extension, mime_type) == ("flac", "audio/flac")
+        assert size == len(data)
+        info = sf.info(io.BytesIO(data))
+        assert (info.format, info.subtype, info.channels) == ("FLAC", subtype, 2)
+        original, _ = sf.read(path, dtype="int32")
+        encoded, _ = sf.read(io.BytesIO(data), dtype="int32")
+        np.testing.assert_array_equal(encoded, original)
+
+    def test_float_wav_is_uploaded_unchanged(self, tmp_path):
+        path = str(tmp_path / "note.wav")
+        sf.write(path, _sine(16000), 16000, subtype="FLOAT")
+
+        stream, _, extension, _ = self.encode(path)
+        with stream, open(path, "rb") as f:
+            assert stream.read() == f.read()
+        assert extension == "wav"
+
+    def test_undecodable_file_keeps_its_type(self, tmp_path):
+        path = tmp_path / "note.mp3"
+        path.write_bytes(b"ID3 not really an mp3")
+
+        stream, size, extension, mime_type = self.encode(str(path))
+        with stream:
+            assert stream.read() == path.read_bytes()
+        assert (size, extension, mime_type) == (len(path.read_bytes()), "mp3", "audio/mpeg")
+
+
+class TestDecodeInProcess:
+    @pytest.fixture(autouse=True)
+    def _imports(self):
+        pytest.importorskip("streamlit")
+        pytest.importorskip("torch")
+        pytest.importorskip("whisper")
+        from src.ai.whisper_transcriber import _decode_in_process
+
+        self.decode = _decode_in_process
+
+    @staticmethod
+    def _wav_bytes(samples, sample_rate):
+        buffer = io.BytesIO()
+        sf.write(buffer, samples, sample_rate, format="WAV", subtype="PCM_16")
+        return buffer.getvalue()
+
+    def test_16khz_stereo_is_downmixed_to_mono(self):
+        stereo = np.stack([_sine(16000), np.zeros(16000)], axis=1)
+        samples = self.decode(self._wav_bytes(stereo, 16000))
+
+        assert samples.dtype == np.float32
+        assert samples.shape == (16000,)
+        np.testing.assert_allclose(samples, stereo.mean(axis=1), atol=1e-4)
+
+    def test_other_sample_rates_are_left_to_ffmpeg(self):
+        assert self.decode(self._wav_bytes(_sine(44100), 44100)) is None
+
+    def test_unreadable_formats_are_left_to_ffmpeg(self):
+        assert self.decode(b"\x1aE\xdf\xa3 webm bytes") is None
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests that fallback summaries and keywords are recognised and kept out of the LLM cache
+"""
+
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("requests")
+
+import app  # noqa: E402
+from src.ai.llama_summarizer import AdvancedAISummarizer  # noqa: E402
+
+TEXT = "First point here. Second point follows. Third point is longer. Final point ends it."
+
+
+@pytest.fixture
+def summarizer():
+    # Skip __init__, which probes API keys and a local Ollama server
+    return object.__new__(AdvancedAISummarizer)
+
+
+def test_fallback_summary_is_recognised(summarizer):
+    assert summarizer.is_fallback_summary(TEXT, summarizer._extractive_summarize(TEXT))
+    assert summarizer.is_fallback_summary(TEXT, "")
+    assert not summarizer.is_fallback_summary(TEXT, "Four points are made.")
+
+
+def test_fallback_keywords_are_recognised(summarizer):
+    assert summarizer.is_fallback_keywords(TEXT, summarizer._simple_keyword_extraction(TEXT, 8))
+    assert summarizer.is_fallback_keywords(TEXT, [])
+    assert not summarizer.is_fallback_keywords(TEXT, ["points", "structure"])
+
+
+def test_fallback_output_raises_instead_of_returning(summarizer, monkeypatch):
+    monkeypatch.setattr(summarizer, "summarize", lambda text, language: summarizer._extractive_summarize(text))
+    monkeypatch.setattr(
+        summarizer, "extract_keywords", lambda text, language, num_keywords: ["points", "structure"]
+    )
+
+    with pytest.raises(app.AIFallbackResult) as excinfo:
+        app._checked_summary(summarizer, TEXT, "en")
+    assert excinfo.value.result == summarizer._extractive_summarize(TEXT)
+    assert app._checked_keywords(summarizer, TEXT, "en", 8) == ["points", "structure"]
+
+
+def test_refresh_returns_fallback_output_uncached(summarizer, monkeypatch):
+    monkeypatch.setattr(app, "get_llama_ai", lambda: summarizer)
+    monkeypatch.setattr(summarizer, "summarize", lambda text, language: "")
+
+    assert app._summary(TEXT, "en", refresh=True) == ""
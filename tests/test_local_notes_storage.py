@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite-backed local notes store
+"""
+
+import json
+import os
+
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("requests")
+
+from src.utils.swecha_storage import SwechaStorageManager  # noqa: E402
+
+NOTES_DIR = os.path.join("whispnote_data", "notes")
+
+
+def _note(note_id, text="hello world", **fields):
+    return {
+        "id": note_id,
+        "timestamp": f"2025-01-0{note_id[-1]}T10:00:00",
+        "language": "English",
+        "language_code": "en",
+        "transcription": text,
+        "keywords": [],
+        "tags": [],
+        **fields,
+    }
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """A storage manager whose local database lives in a temporary directory"""
+    monkeypatch.chdir(tmp_path)
+    return SwechaStorageManager()
+
+
+def test_legacy_json_notes_are_migrated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs(NOTES_DIR)
+    legacy_file = os.path.join(NOTES_DIR, "local_notes.json")
+    with open(legacy_file, "w", encoding="utf-8") as f:
+        json.dump([_note("n1"), _note("n2", "రెండవ గమనిక")], f, ensure_ascii=False)
+
+    storage = SwechaStorageManager()
+
+    assert not os.path.exists(legacy_file)
+    assert os.path.exists(f"{legacy_file}.migrated")
+    notes = storage._load_local_notes()
+    assert [note["id"] for note in notes] == ["n1", "n2"]
+    assert notes[1]["transcription"] == "రెండవ గమనిక"
+
+    # Starting again must not import the notes a second time
+    assert len(SwechaStorageManager()._load_local_notes()) == 2
+
+
+def test_upsert_updates_in_place(storage):
+    assert storage._save_note_locally(_note("n1"))
+    assert storage._save_note_locally(_note("n2"))
+    assert storage._save_note_locally(_note("n1", "edited"))
+
+    notes = storage._load_local_notes()
+    assert [note["id"] for note in notes] == ["n1", "n2"]
+    assert notes[0]["transcription"] == "edited"
+
+
+def test_upsert_assigns_missing_ids(storage):
+    note = _note("n1")
+    del note["id"]
+    assert storage._save_note_locally(note)
+    assert note["id"]
+    assert storage._load_local_notes()[0]["id"] == note["id"]
+
+
+def test_save_notes_locally_writes_all_notes(storage):
+    storage._save_note_locally(_note("n1"))
+    assert storage._save_notes_locally([_note("n1", "updated"), _note("n2"), _note("n3")])
+
+    notes = {note["id"]: note for note in storage._load_local_notes()}
+    assert set(notes) == {"n1", "n2", "n3"}
+    assert notes["n1"]["transcription"] == "updated"
+
+
+def test_delete_note_locally(storage):
+    storage._save_notes_locally([_note("n1"), _note("n2")])
+
+    assert storage._delete_note_locally("n1")
+    assert not storage._delete_note_locally("n1")
+    assert [note["id"] for note in storage._load_local_notes()] == ["n2"]
+    assert storage.search_local_notes("hello") == [_note("n2")]
+
+
+def test_search_local_notes(storage):
+    storage._save_notes_locally(
+        [
+            _note("n1", "meeting notes about the budget", tags=["work"]),
+            _note("n2", "grocery list", language="Telugu"),
+            _note("n3", "budgeting for the trip"),
+        ]
+    )
+
+    # Case-insensitive substring matches, newest first
+    assert [note["id"] for note in storage.search_local_notes("budget")] == ["n3", "n1"]
+    assert [note["id"] for note in storage.search_local_notes("UDGET")] == ["n3", "n1"]
+    assert [note["id"] for note in storage.search_local_notes("ro")] == ["n2"]
+    assert [note["id"] for note in storage.search_local_notes("work")] == ["n1"]
+    assert [note["id"] for note in storage.search_local_notes("telugu")] == ["n2"]
+    assert [note["id"] for note in storage.search_local_notes("list", language="Telugu")] == ["n2"]
+    assert storage.search_local_notes("list", language="English") == []
+
+
+
+def test_search_local_notes_treats_wildcards_literally(storage):
+    storage._save_notes_locally([_note("n1", "100% done"), _note("n2", "1000 done"), _note("n3", "a_b")])
+
+    assert [note["id"] for note in storage.search_local_notes("100%")] == ["n1"]
+    assert [note["id"] for note in storage.search_local_notes("a_b")] == ["n3"]
+
+
+def test_find_note_by_audio_hash(storage):
+    storage._save_notes_locally([_note("n1", audio_hash="abc"), _note("n2", audio_hash="abc")])
+
+    assert storage.find_note_by_audio_hash("abc")["id"] == "n2"
+    assert storage.find_note_by_audio_hash("abc", "te") is None
+    assert storage.find_note_by_audio_hash("missing") is None
+
+
+def test_audio_transcription_outlives_the_session(storage):
+    # Notes saved to Swecha come back without their hash, so the lookup must not depend on them
+    storage._remember_audio_transcription(
+        _note("n1", "cleaned text", audio_hash="abc", original_transcription="raw text")
+    )
+
+    found = SwechaStorageManager().find_note_by_audio_hash("abc", "en")
+    assert found["original_transcription"] == "raw text"
+    assert found["language_code"] == "en"
+    assert storage.find_note_by_audio_hash("abc", "te") is None
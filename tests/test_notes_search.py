@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for how the My Notes search picks between the local index and the in-memory frame
+"""
+
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("pandas")
+
+import app  # noqa: E402
+
+
+class FakeStorage:
+    """Stands in for the local index, recording the searches it receives"""
+
+    def __init__(self, matches):
+        self.matches = matches
+        self.searches = []
+
+    def search_local_notes(self, query, language=None, limit=50, offset=0):
+        self.searches.append((query, language))
+        return self.matches
+
+
+NOTES = [
+    {"id": "n1", "transcription": "the budget meeting", "language": "English", "tags": []},
+    {"id": "n2", "transcription": "grocery list", "language": "Telugu", "tags": ["home"]},
+]
+
+
+@pytest.fixture
+def session_state(monkeypatch):
+    state = {"swecha_logged_in": True}
+    monkeypatch.setattr(app.st, "session_state", state)
+    return state
+
+
+def test_local_notes_are_searched_through_the_index(session_state):
+    # Logged in, but the notes fell back to local storage
+    session_state["resident_notes"] = (("token", 0.0, 0), NOTES, "local")
+    storage = FakeStorage([NOTES[1]])
+
+    assert app._filter_notes(storage, NOTES, "ocer", "All") == [NOTES[1]]
+    assert storage.searches == [("ocer", None)]
+
+
+def test_swecha_notes_are_searched_in_memory(session_state, monkeypatch):
+    session_state["resident_notes"] = (("token", 0.0, 0), NOTES, "swecha")
+    monkeypatch.setattr(app, "_cached_notes_frame", lambda *args: app._build_notes_frame(NOTES))
+    storage = FakeStorage([])
+
+    # Substring matching, as the local index does
+    assert app._filter_notes(storage, NOTES, "udget", "All") == [NOTES[0]]
+    assert app._filter_notes(storage, NOTES, "home", "Telugu") == [NOTES[1]]
+    assert storage.searches == []
+
+
+def test_unloaded_lists_are_searched_in_memory(session_state):
+    session_state["resident_notes"] = (("token", 0.0, 0), list(NOTES), "local")
+    storage = FakeStorage([])
+
+    assert app._filter_notes(storage, NOTES, "udget", "All") == [NOTES[0]]
+    assert storage.searches == []